@@ -19,6 +19,14 @@ def benchmark_xoflib_stream(shake, absorb, c, n):
     return res
 
 
+def benchmark_xoflib_xor_into(shake, absorb, c, n):
+    xof = shake(absorb).finalize()
+    res = bytearray(c)
+    for _ in range(n):
+        xof.xor_into(res)
+    return bytes(res)
+
+
 def benchmark_xoflib_turbo_stream(turboshake, absorb, c, n):
     xof = turboshake(1, absorb).finalize()
     res = bytes([0] * c)
@@ -66,10 +74,11 @@ def benchmark_pycryptodome_stream(shake, absorb, c, n):
 
 # Ensure things work
 a = benchmark_xoflib_stream(Shake128, b"benchmarking...", 123, 1000)
+e = benchmark_xoflib_xor_into(Shake128, b"benchmarking...", 123, 1000)
 b = benchmark_hashlib_one_call(shake_128, b"benchmarking...", 123, 1000)
 c = benchmark_hashlib_stream(shake_128_hashlib, b"benchmarking...", 123, 1000)
 d = benchmark_pycryptodome_stream(SHAKE128_XOF(), b"benchmarking...", 123, 1000)
-assert a == b == c == d
+assert a == b == c == d == e
 
 benchmark_data = [
     (1, 10_000, 100),
@@ -100,6 +109,18 @@ for name, shakes in [
         )
         print(f"xoflib: {xoflib_time:.2f}s")
 
+        xoflib_xor_into_time = timeit(
+            'benchmark_xoflib_xor_into(shake, b"benchmarking...", c, n)',
+            globals={
+                "shake": shakes[0],
+                "benchmark_xoflib_xor_into": benchmark_xoflib_xor_into,
+                "c": c,
+                "n": n,
+            },
+            number=number,
+        )
+        print(f"xoflib (xor_into): {xoflib_xor_into_time:.2f}s")
+
         hashlib_single_time = timeit(
             'benchmark_hashlib_one_call(shake, b"benchmarking...", c, n)',
             globals={
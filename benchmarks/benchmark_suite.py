@@ -0,0 +1,424 @@
+"""
+A structured benchmark suite for xoflib with machine readable output.
+
+Every benchmark records one measurement in a common format, so results from
+different releases of xoflib, or different machines, can be compared directly:
+
+    python benchmarks/benchmark_suite.py --output results.json
+    python benchmarks/benchmark_suite.py --output new.json --compare results.json
+
+The suite only needs the standard library. The groups of benchmarks are:
+
+- overhead:   the time of a single call which does no hashing work
+- latency:    the time to hash a small message and read a short digest
+- throughput: bulk absorb and read speed for large chunks
+- threads:    combined throughput when several threads each use their own XOF
+- memory:     the resident memory used by each shaker and sponge
+- extras:     the helpers built on the XOFs, such as XofRandom and PrefixCache
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from time import perf_counter
+from timeit import Timer
+
+import xoflib
+from xoflib import (
+    AsconAXof,
+    AsconXof,
+    Blake3,
+    KT128,
+    KT256,
+    PrefixCache,
+    Shake128,
+    Shake256,
+    TurboShake128,
+    TurboShake256,
+    XofRandom,
+)
+
+XOF_CLASSES = {
+    "AsconXof": AsconXof,
+    "AsconAXof": AsconAXof,
+    "Blake3": Blake3,
+    "KT128": KT128,
+    "KT256": KT256,
+    "Shake128": Shake128,
+    "Shake256": Shake256,
+    "TurboShake128": lambda data=None: TurboShake128(1, data),
+    "TurboShake256": lambda data=None: TurboShake256(1, data),
+}
+
+LATENCY_SIZES = [0, 32, 1024]
+LATENCY_OUTPUT = 32
+THROUGHPUT_CHUNK = 2**20
+THREAD_COUNTS = [1, 2, 4, 8]
+MEMORY_OBJECTS = 100_000
+
+
+class Suite:
+    def __init__(self, repeat, data_mb, selected):
+        self.repeat = repeat
+        self.data_mb = data_mb
+        self.selected = selected
+        self.results = []
+
+    def record(self, group, name, algorithm, value, unit, **params):
+        self.results.append(
+            {
+                "group": group,
+                "name": name,
+                "algorithm": algorithm,
+                "params": params,
+                "value": value,
+                "unit": unit,
+            }
+        )
+        param_str = " ".join(f"{k}={v}" for k, v in params.items())
+        value_str = "n/a" if value is None else f"{value:0.1f}"
+        print(f"{group:<10} {name:<16} {algorithm:<14} {param_str:<24} {value_str} {unit}")
+
+    def best_per_call(self, stmt):
+        """
+        Return the fastest time in nanoseconds for a single call to `stmt`
+        """
+        timer = Timer(stmt)
+        number, _ = timer.autorange()
+        return min(timer.repeat(self.repeat, number)) / number * 1e9
+
+    def best_time(self, fn):
+        """
+        Return the fastest time in seconds of `repeat` calls to `fn`
+        """
+        times = []
+        for _ in range(self.repeat):
+            start = perf_counter()
+            fn()
+            times.append(perf_counter() - start)
+        return min(times)
+
+    def algorithms(self):
+        return [
+            (name, xof)
+            for name, xof in XOF_CLASSES.items()
+            if not self.selected or name in self.selected
+        ]
+
+    def overhead(self):
+        for name, Xof in self.algorithms():
+            shaker = Xof()
+            sponge = Xof().finalize()
+            buf = bytearray(0)
+            self.record("overhead", "construct", name, self.best_per_call(Xof), "ns")
+            self.record(
+                "overhead",
+                "absorb",
+                name,
+                self.best_per_call(lambda: shaker.absorb(b"")),
+                "ns",
+            )
+            self.record(
+                "overhead", "copy", name, self.best_per_call(shaker.copy), "ns"
+            )
+            self.record(
+                "overhead",
+                "read",
+                name,
+                self.best_per_call(lambda: sponge.read(0)),
+                "ns",
+            )
+            self.record(
+                "overhead",
+                "read_into",
+                name,
+                self.best_per_call(lambda: sponge.read_into(buf)),
+                "ns",
+            )
+
+    def latency(self):
+        for name, Xof in self.algorithms():
+            for size in LATENCY_SIZES:
+                message = os.urandom(size)
+                self.record(
+                    "latency",
+                    "hash",
+                    name,
+                    self.best_per_call(
+                        lambda: Xof(message).finalize().read(LATENCY_OUTPUT)
+                    ),
+                    "ns",
+                    input_bytes=size,
+                    output_bytes=LATENCY_OUTPUT,
+                )
+
+    def throughput(self):
+        chunk = os.urandom(THROUGHPUT_CHUNK)
+        count = self.data_mb * 2**20 // THROUGHPUT_CHUNK
+        buf = bytearray(THROUGHPUT_CHUNK)
+
+        for name, Xof in self.algorithms():
+
+            def absorb():
+                shaker = Xof()
+                for _ in range(count):
+                    shaker.absorb(chunk)
+                return shaker
+
+            def read():
+                sponge = Xof().finalize()
+                for _ in range(count):
+                    sponge.read_into(buf)
+
+            for bench, fn in [("absorb", absorb), ("read_into", read)]:
+                elapsed = self.best_time(fn)
+                self.record(
+                    "throughput",
+                    bench,
+                    name,
+                    self.data_mb / elapsed,
+                    "MB/s",
+                    chunk_bytes=THROUGHPUT_CHUNK,
+                )
+
+    def threads(self):
+        chunk = os.urandom(THROUGHPUT_CHUNK)
+        count = self.data_mb * 2**20 // THROUGHPUT_CHUNK
+
+        for name, Xof in self.algorithms():
+
+            def absorb_and_read(_):
+                shaker = Xof()
+                for _ in range(count):
+                    shaker.absorb(chunk)
+                sponge = shaker.finalize()
+                buf = bytearray(THROUGHPUT_CHUNK)
+                for _ in range(count):
+                    sponge.read_into(buf)
+
+            for thread_count in THREAD_COUNTS:
+                with ThreadPoolExecutor(max_workers=thread_count) as executor:
+
+                    def run():
+                        list(executor.map(absorb_and_read, range(thread_count)))
+
+                    elapsed = self.best_time(run)
+                self.record(
+                    "threads",
+                    "absorb_read",
+                    name,
+                    2 * thread_count * self.data_mb / elapsed,
+                    "MB/s",
+                    threads=thread_count,
+                )
+
+    def memory(self):
+        # Each measurement runs in a fresh process, so memory freed by earlier
+        # benchmarks is not reused by the new objects
+        for name, _ in self.algorithms():
+            for kind in ["shaker", "sponge"]:
+                child = subprocess.run(
+                    [sys.executable, __file__, "--memory-child", name, kind],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                per_object = json.loads(child.stdout)
+                self.record(
+                    "memory", kind, name, per_object, "bytes", objects=MEMORY_OBJECTS
+                )
+
+    def extras(self):
+        rng = XofRandom(b"seed")
+        self.record("extras", "random", "XofRandom", self.best_per_call(rng.random), "ns")
+        self.record(
+            "extras",
+            "getrandbits",
+            "XofRandom",
+            self.best_per_call(lambda: rng.getrandbits(64)),
+            "ns",
+            bits=64,
+        )
+
+        cache = PrefixCache(Shake256)
+        prefix = os.urandom(1024)
+        cache.get(prefix)
+        self.record(
+            "extras",
+            "get_hit",
+            "PrefixCache",
+            self.best_per_call(lambda: cache.get(prefix)),
+            "ns",
+            prefix_bytes=len(prefix),
+        )
+
+        try:
+            import numpy as np
+            from xoflib import XofBitGenerator
+        except ImportError:
+            return
+
+        rng = np.random.Generator(XofBitGenerator(b"seed"))
+        count = 2**20
+        elapsed = self.best_time(lambda: rng.integers(0, 2**64, count, np.uint64))
+        self.record(
+            "extras",
+            "integers",
+            "XofBitGenerator",
+            8 * count / 2**20 / elapsed,
+            "MB/s",
+            dtype="uint64",
+        )
+
+
+def resident_memory():
+    """
+    Return the resident memory of this process in bytes, or None when it
+    cannot be measured on this platform
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def memory_child(name, kind):
+    """
+    Print the resident memory used by each of `MEMORY_OBJECTS` new shakers or
+    sponges of the algorithm `name`
+    """
+    Xof = XOF_CLASSES[name]
+    make = Xof if kind == "shaker" else lambda: Xof().finalize()
+
+    gc.collect()
+    before = resident_memory()
+    objects = [make() for _ in range(MEMORY_OBJECTS)]
+    after = resident_memory()
+
+    per_object = None
+    if before is not None and after is not None:
+        per_object = (after - before) / len(objects)
+    print(json.dumps(per_object))
+
+
+def metadata():
+    try:
+        from importlib.metadata import version
+
+        xoflib_version = version("xoflib")
+    except Exception:
+        xoflib_version = None
+
+    return {
+        "xoflib_version": xoflib_version,
+        "xoflib_path": os.path.dirname(xoflib.__file__),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def result_key(result):
+    return (
+        result["group"],
+        result["name"],
+        result["algorithm"],
+        tuple(sorted(result["params"].items())),
+    )
+
+
+def compare(results, baseline_path):
+    """
+    Print the ratio of every result to the matching result in `baseline_path`,
+    where a ratio above 1.0 is an improvement
+    """
+    with open(baseline_path) as f:
+        baseline = {result_key(r): r for r in json.load(f)["results"]}
+
+    print(f"\nComparison against {baseline_path} (> 1.00 is faster or smaller):")
+    for result in results:
+        old = baseline.get(result_key(result))
+        if old is None or not old["value"] or not result["value"]:
+            continue
+        if result["unit"] == "MB/s":
+            ratio = result["value"] / old["value"]
+        else:
+            ratio = old["value"] / result["value"]
+        param_str = " ".join(f"{k}={v}" for k, v in result["params"].items())
+        print(
+            f"{result['group']:<10} {result['name']:<16} {result['algorithm']:<14} {param_str:<24} {ratio:0.2f}"
+        )
+
+
+GROUPS = ["overhead", "latency", "throughput", "threads", "memory", "extras"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    parser.add_argument("--compare", help="a previous JSON output to compare against")
+    parser.add_argument(
+        "--groups",
+        nargs="+",
+        choices=GROUPS,
+        default=GROUPS,
+        help="the groups of benchmarks to run",
+    )
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=list(XOF_CLASSES),
+        help="only benchmark these algorithms",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="repetitions, the best time is kept"
+    )
+    parser.add_argument(
+        "--data-mb",
+        type=int,
+        default=100,
+        help="MB of data absorbed and read by the throughput benchmarks",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="a fast smoke run with --repeat 1 --data-mb 4",
+    )
+    parser.add_argument("--memory-child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.memory_child:
+        memory_child(*args.memory_child)
+        return
+
+    if args.quick:
+        args.repeat, args.data_mb = 1, 4
+
+    suite = Suite(args.repeat, args.data_mb, args.algorithms)
+    for group in args.groups:
+        getattr(suite, group)()
+
+    output = {"metadata": metadata(), "results": suite.results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+        print(f"\nWrote {len(suite.results)} results to {args.output}")
+
+    if args.compare:
+        compare(suite.results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
 from timeit import timeit
 from xoflib import Blake3, Shake128, Shake256, AsconXof, AsconAXof, TurboShake128, TurboShake256
 from tabulate import tabulate
@@ -7,6 +9,8 @@ REPEAT = 1
 CHUNK_SIZES = [32, 2**10, 2**20]
 MB_COUNT = 100
 DATA_SIZE = MB_COUNT * 2**20  # MB_COUNT Mb of data read/absorb
+THREAD_COUNTS = [1, 2, 4, 8]
+THREAD_CHUNK_SIZE = 2**20
 
 
 def absorb_chunks(xof_shaker, chunks):
@@ -76,3 +80,48 @@ for xof_shaker in [
     table_data.append(table_row)
 
 print(tabulate(table_data, table_headers, tablefmt="github"))
+
+
+def absorb_and_read(xof_class, chunks):
+    xof_shaker = xof_class()
+    for chunk in chunks:
+        xof_shaker.absorb(chunk)
+    xof_sponge = xof_shaker.finalize()
+    buf = bytearray(THREAD_CHUNK_SIZE)
+    for _ in chunks:
+        xof_sponge.read_into(buf)
+
+
+def threaded_throughput(xof_class, chunks, thread_count):
+    # Every thread absorbs and reads the full set of chunks with its own XOF
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        start = perf_counter()
+        for _ in executor.map(
+            lambda _: absorb_and_read(xof_class, chunks), range(thread_count)
+        ):
+            pass
+        elapsed = perf_counter() - start
+    return 2 * thread_count * MB_COUNT / elapsed
+
+
+thread_table_headers = ["Algorithm"] + [f"{t} thread(s)" for t in THREAD_COUNTS]
+thread_table_data = []
+chunks = [os.urandom(THREAD_CHUNK_SIZE) for _ in range(DATA_SIZE // THREAD_CHUNK_SIZE)]
+
+for name, xof_class in [
+    ("AsconXof", AsconXof),
+    ("AsconAXof", AsconAXof),
+    ("Blake3", Blake3),
+    ("Shake128", Shake128),
+    ("Shake256", Shake256),
+    ("TurboShake128", lambda: TurboShake128(1)),
+    ("TurboShake256", lambda: TurboShake256(1)),
+]:
+    print(f"Benchmarking threaded scaling: {name}")
+    table_row = [name]
+    for thread_count in THREAD_COUNTS:
+        throughput = threaded_throughput(xof_class, chunks, thread_count)
+        table_row.append(f"{throughput:0.0f} MB/s")
+    thread_table_data.append(table_row)
+
+print(tabulate(thread_table_data, thread_table_headers, tablefmt="github"))
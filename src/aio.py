@@ -0,0 +1,62 @@
+import asyncio
+import concurrent.futures
+import functools
+import threading
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# id(xof) -> future of the last operation queued for xof. Every pending
+# operation holds a reference to its xof, so the id is not reused while the
+# entry exists. The lock keeps reading and replacing an entry atomic when
+# there is no GIL.
+_queued = {}
+_queued_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="xoflib"
+            )
+        return _executor
+
+
+def run_in_order(xof, fn, args):
+    """
+    Run `fn(*args)` on the thread pool once every operation previously queued
+    for `xof` has finished, and return a future for the result.
+
+    Operations start in the order this is called. Cancelling the returned
+    future does not cancel the operation, so later operations on `xof` always
+    see the effect of earlier ones.
+    """
+    loop = asyncio.get_running_loop()
+    key = id(xof)
+    done = loop.create_future()
+    with _queued_lock:
+        previous = _queued.get(key)
+        _queued[key] = done
+
+    def finish(job):
+        with _queued_lock:
+            if _queued.get(key) is done:
+                del _queued[key]
+        exc = job.exception()
+        if exc is None:
+            done.set_result(job.result())
+        else:
+            done.set_exception(exc)
+
+    def start(_=None):
+        job = loop.run_in_executor(_get_executor(), functools.partial(fn, *args))
+        job.add_done_callback(finish)
+
+    if previous is None:
+        start()
+    else:
+        previous.add_done_callback(start)
+
+    return asyncio.shield(done)
@@ -0,0 +1,27 @@
+//! Support for the `*_async` methods. The operations are queued with the
+//! asyncio helpers in `aio.py`, which are only imported on first use.
+
+use std::ffi::CString;
+
+use pyo3::{ffi::c_str, prelude::*, sync::GILOnceCell, types::PyTuple};
+
+static RUN_IN_ORDER: GILOnceCell<Py<PyAny>> = GILOnceCell::new();
+
+/// Queue `xof.method(*args)` to run on a thread pool after every operation
+/// already queued for `xof`, returning an awaitable for the result
+pub fn run_in_order<'py>(
+    xof: &Bound<'py, PyAny>,
+    method: &str,
+    args: Bound<'py, PyTuple>,
+) -> PyResult<Bound<'py, PyAny>> {
+    let py = xof.py();
+    let run_in_order = RUN_IN_ORDER.get_or_try_init(py, || -> PyResult<_> {
+        let code = CString::new(include_str!("aio.py"))?;
+        let module =
+            PyModule::from_code(py, &code, c_str!("xoflib/aio.py"), c_str!("xoflib._aio"))?;
+        Ok(module.getattr("run_in_order")?.unbind())
+    })?;
+    run_in_order
+        .bind(py)
+        .call1((xof, xof.getattr(method)?, args))
+}
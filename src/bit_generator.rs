@@ -0,0 +1,134 @@
+use std::ffi::{c_void, CString};
+
+use pyo3::{prelude::*, types::PyCapsule};
+
+use crate::buffered_xof::{BufferedXof, SeededXof};
+use crate::pybuffer_get_bytes;
+
+// The `bitgen_t` interface of NumPy, see `numpy/random/bitgen.h`. NumPy calls
+// these functions without the GIL while holding the `lock` of the generator.
+
+unsafe extern "C" fn next_uint64(state: *mut c_void) -> u64 {
+    // SAFETY: `state` is the `BufferedXof` owned by the capsule, and NumPy
+    // holds `lock` so there is no concurrent access
+    let xof = unsafe { &mut *(state as *mut BufferedXof) };
+    xof.next_u64()
+}
+
+unsafe extern "C" fn next_uint32(state: *mut c_void) -> u32 {
+    // SAFETY: see `next_uint64`
+    let xof = unsafe { &mut *(state as *mut BufferedXof) };
+    xof.next_u32()
+}
+
+unsafe extern "C" fn next_double(state: *mut c_void) -> f64 {
+    // SAFETY: see `next_uint64`
+    let xof = unsafe { &mut *(state as *mut BufferedXof) };
+    xof.next_f64()
+}
+
+#[repr(C)]
+struct BitGen {
+    state: *mut c_void,
+    next_uint64: unsafe extern "C" fn(*mut c_void) -> u64,
+    next_uint32: unsafe extern "C" fn(*mut c_void) -> u32,
+    next_double: unsafe extern "C" fn(*mut c_void) -> f64,
+    next_raw: unsafe extern "C" fn(*mut c_void) -> u64,
+}
+
+/// The value stored in the capsule, NumPy reads the `bitgen_t` from the start
+/// of the capsule pointer. The capsule owns the `BufferedXof` behind `state`.
+#[repr(C)]
+struct BitGenCapsule {
+    bitgen: BitGen,
+}
+
+// SAFETY: `state` is uniquely owned by the capsule
+unsafe impl Send for BitGenCapsule {}
+
+impl BitGenCapsule {
+    fn new(xof: SeededXof) -> Self {
+        let state = Box::into_raw(Box::new(BufferedXof::new(xof)));
+        Self {
+            bitgen: BitGen {
+                state: state as *mut c_void,
+                next_uint64,
+                next_uint32,
+                next_double,
+                next_raw: next_uint64,
+            },
+        }
+    }
+}
+
+impl Drop for BitGenCapsule {
+    fn drop(&mut self) {
+        // SAFETY: `state` was created by `Box::into_raw` in `new`
+        drop(unsafe { Box::from_raw(self.bitgen.state as *mut BufferedXof) });
+    }
+}
+
+/// A NumPy bit generator producing the output of a XOF seeded with `seed`
+///
+/// `algorithm` is one of `"turboshake128"` (the default), `"turboshake256"`,
+/// `"shake128"`, `"shake256"` or `"blake3"`. The TurboShakes use the domain
+/// separation byte `0x1F`. Draws read the XOF output as little-endian integers,
+/// so the stream of `numpy.uint64` values is the XOF output read 8 bytes at a
+/// time.
+///
+/// Example:
+///
+/// .. code-block:: python
+///
+///    >>> import numpy as np
+///    >>> from xoflib import XofBitGenerator
+///    >>> rng = np.random.Generator(XofBitGenerator(b"seed", algorithm="blake3"))
+///    >>> x = rng.standard_normal(1000)
+#[pyclass(module = "xoflib")]
+pub struct XofBitGenerator {
+    algorithm: String,
+    capsule: Py<PyCapsule>,
+    lock: Py<PyAny>,
+}
+
+#[pymethods]
+impl XofBitGenerator {
+    #[new]
+    #[pyo3(signature = (seed, algorithm = "turboshake128"))]
+    fn new(py: Python<'_>, seed: &Bound<'_, PyAny>, algorithm: &str) -> PyResult<Self> {
+        let seed = pybuffer_get_bytes(seed)?;
+
+        let xof = SeededXof::new(seed.as_slice(), algorithm)?;
+
+        let name = CString::new("BitGenerator").unwrap();
+        let capsule = PyCapsule::new(py, BitGenCapsule::new(xof), Some(name))?;
+        let lock = py.import("threading")?.getattr("Lock")?.call0()?;
+
+        Ok(Self {
+            algorithm: algorithm.to_string(),
+            capsule: capsule.unbind(),
+            lock: lock.unbind(),
+        })
+    }
+
+    /// The `bitgen_t` capsule used by `numpy.random.Generator`
+    #[getter]
+    fn capsule(&self, py: Python<'_>) -> Py<PyCapsule> {
+        self.capsule.clone_ref(py)
+    }
+
+    /// The lock held by NumPy while it draws from this bit generator
+    #[getter]
+    fn lock(&self, py: Python<'_>) -> Py<PyAny> {
+        self.lock.clone_ref(py)
+    }
+
+    #[getter]
+    fn algorithm(&self) -> &str {
+        &self.algorithm
+    }
+
+    fn __str__(&self) -> String {
+        String::from("XofBitGenerator")
+    }
+}
@@ -0,0 +1,119 @@
+//! `Blake3KeyContext`, a BLAKE3 hasher in keyed or key derivation mode which is
+//! initialized once and then copied for every message.
+
+use blake3::Hasher;
+use pyo3::{exceptions::PyValueError, prelude::*, types::PyBytes};
+
+use crate::{
+    absorb_into, allow_threads_for_len, blake3_key, pybuffer_get_bytes,
+    stats::{self, Instrumented},
+    xof_batch, Blake3Xof, Locked,
+};
+
+/// A reusable BLAKE3 keyed hash or key derivation context
+///
+/// Exactly one of `key`, a 32 byte key for keyed hashing, or `context`, a
+/// hardcoded, globally unique and application-specific string for key
+/// derivation, must be given. Key derivation first hashes `context` into a
+/// context key, which is done once here rather than for every derived key, and
+/// every message starts from a copy of the initialized state.
+///
+/// Example:
+///
+/// .. code-block:: python
+///
+///    >>> from xoflib import Blake3, Blake3KeyContext
+///    >>> kdf = Blake3KeyContext(context="example.com 2024-01-01 session keys")
+///    >>> subkeys = [kdf.digest(b"user %d" % i) for i in range(1000)]
+///    >>> xof = Blake3.derive_key("example.com 2024-01-01 session keys", b"user 0")
+///    >>> xof.finalize().read(32) == subkeys[0]
+///    True
+#[pyclass(module = "xoflib", frozen)]
+pub struct Blake3KeyContext {
+    hasher: Hasher,
+}
+
+#[pymethods]
+impl Blake3KeyContext {
+    #[new]
+    #[pyo3(signature = (key = None, context = None))]
+    fn new(key: Option<&Bound<'_, PyAny>>, context: Option<&str>) -> PyResult<Self> {
+        let hasher = match (key, context) {
+            (Some(key), None) => Hasher::new_keyed(&blake3_key(key)?),
+            (None, Some(context)) => Hasher::new_derive_key(context),
+            _ => {
+                return Err(PyValueError::new_err(
+                    "exactly one of key and context must be given",
+                ))
+            }
+        };
+        Ok(Self { hasher })
+    }
+
+    /// Return a new `Blake3` XOF with this key or context which has absorbed
+    /// `input_bytes`
+    #[pyo3(signature = (input_bytes = None))]
+    fn hasher(
+        &self,
+        py: Python<'_>,
+        input_bytes: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<Blake3Xof> {
+        let mut hasher = self.hasher.clone();
+        if let Some(initial_data) = input_bytes {
+            let start = stats::start();
+            let len = absorb_into(py, &mut hasher, initial_data)?;
+            Blake3Xof::stats().absorb.record(start, len);
+        }
+        Ok(Blake3Xof {
+            hasher: Locked::new(hasher),
+        })
+    }
+
+    /// Return the first `n` bytes of the output for `input_bytes`
+    ///
+    /// For key derivation `input_bytes` is the key material and the output is
+    /// the derived key, and for keyed hashing the output is the MAC.
+    #[pyo3(signature = (input_bytes, n = 32))]
+    fn digest<'py>(
+        &self,
+        py: Python<'py>,
+        input_bytes: &Bound<'py, PyAny>,
+        n: usize,
+    ) -> PyResult<Bound<'py, PyBytes>> {
+        let data = pybuffer_get_bytes(input_bytes)?;
+        let bytes = data.as_slice();
+        let mut hasher = self.hasher.clone();
+        let counters = Blake3Xof::stats();
+        PyBytes::new_with(py, n, |out| {
+            allow_threads_for_len(py, bytes.len() + n, || {
+                let start = stats::start();
+                hasher.update(bytes);
+                counters.absorb.record(start, bytes.len());
+
+                let start = stats::start();
+                let mut xof = hasher.finalize_xof();
+                counters.finalize.record(start, 0);
+
+                let start = stats::start();
+                xof.fill(out);
+                counters.read.record(start, n);
+            });
+            Ok(())
+        })
+    }
+
+    /// Return `digest(input_bytes, n)` for every buffer in `inputs`,
+    /// concatenated into one bytes object of length `len(inputs) * n`
+    ///
+    /// The inputs are all hashed in one call, which is much faster than calling
+    /// `digest()` for many short inputs.
+    #[pyo3(signature = (inputs, n = 32))]
+    fn digest_batch<'py>(
+        &self,
+        py: Python<'py>,
+        inputs: &Bound<'py, PyAny>,
+        n: usize,
+    ) -> PyResult<Bound<'py, PyBytes>> {
+        xof_batch(py, inputs, n, Blake3Xof::stats(), || self.hasher.clone())
+    }
+}
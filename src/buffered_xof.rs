@@ -0,0 +1,134 @@
+//! XOF output buffered in memory, for drawing many small random values from a
+//! single seeded XOF.
+
+use blake3::{Hasher as Blake3, OutputReader as Blake3Reader};
+use digest::{ExtendableOutput, Update};
+use pyo3::{exceptions::PyValueError, prelude::*};
+
+use crate::shake::{
+    Shake128, Shake128Reader, Shake256, Shake256Reader, TurboShake128, TurboShake128Reader,
+    TurboShake256, TurboShake256Reader,
+};
+use crate::Squeeze;
+
+/// Number of bytes squeezed from the XOF each time the buffer runs out
+const BUFFER_LEN: usize = 1 << 12;
+
+/// Domain separation byte used when seeding the TurboShakes, the default from
+/// RFC 9861
+const TURBO_SHAKE_DOMAIN: u8 = 0x1F;
+
+/// The reader of a XOF which has absorbed a seed
+#[derive(Clone)]
+pub enum SeededXof {
+    TurboShake128(TurboShake128Reader),
+    TurboShake256(TurboShake256Reader),
+    Shake128(Shake128Reader),
+    Shake256(Shake256Reader),
+    Blake3(Blake3Reader),
+}
+
+impl SeededXof {
+    /// Absorb `seed` into the XOF named by `algorithm`, one of "turboshake128",
+    /// "turboshake256", "shake128", "shake256" or "blake3"
+    pub fn new(seed: &[u8], algorithm: &str) -> PyResult<Self> {
+        let xof = match algorithm {
+            "turboshake128" => {
+                let mut hasher = TurboShake128::new(TURBO_SHAKE_DOMAIN);
+                hasher.update(seed);
+                Self::TurboShake128(hasher.finalize_xof())
+            }
+            "turboshake256" => {
+                let mut hasher = TurboShake256::new(TURBO_SHAKE_DOMAIN);
+                hasher.update(seed);
+                Self::TurboShake256(hasher.finalize_xof())
+            }
+            "shake128" => Self::Shake128(Shake128::default().chain(seed).finalize_xof()),
+            "shake256" => Self::Shake256(Shake256::default().chain(seed).finalize_xof()),
+            "blake3" => {
+                let mut hasher = Blake3::new();
+                hasher.update(seed);
+                Self::Blake3(hasher.finalize_xof())
+            }
+            _ => {
+                return Err(PyValueError::new_err(format!(
+                    "unsupported algorithm {:?}, expected one of \"turboshake128\", \
+                     \"turboshake256\", \"shake128\", \"shake256\" or \"blake3\"",
+                    algorithm
+                )))
+            }
+        };
+        Ok(xof)
+    }
+}
+
+impl Squeeze for SeededXof {
+    fn squeeze(&mut self, buf: &mut [u8]) {
+        match self {
+            Self::TurboShake128(xof) => xof.squeeze(buf),
+            Self::TurboShake256(xof) => xof.squeeze(buf),
+            Self::Shake128(xof) => xof.squeeze(buf),
+            Self::Shake256(xof) => xof.squeeze(buf),
+            Self::Blake3(xof) => xof.squeeze(buf),
+        }
+    }
+}
+
+/// A seeded XOF with buffered output, so most draws are a copy from memory
+///
+/// The output is the XOF stream consumed in order, no bytes are skipped.
+#[derive(Clone)]
+pub struct BufferedXof {
+    xof: SeededXof,
+    buf: [u8; BUFFER_LEN],
+    pos: usize,
+}
+
+impl BufferedXof {
+    pub fn new(xof: SeededXof) -> Self {
+        Self {
+            xof,
+            buf: [0u8; BUFFER_LEN],
+            pos: BUFFER_LEN,
+        }
+    }
+
+    /// Fill `out` with the next bytes of the XOF stream
+    pub fn fill(&mut self, out: &mut [u8]) {
+        let available = (BUFFER_LEN - self.pos).min(out.len());
+        let (buffered, out) = out.split_at_mut(available);
+        buffered.copy_from_slice(&self.buf[self.pos..self.pos + available]);
+        self.pos += available;
+
+        if out.is_empty() {
+            return;
+        }
+
+        // The buffer is now empty, so large requests are squeezed directly
+        if out.len() >= BUFFER_LEN {
+            self.xof.squeeze(out);
+        } else {
+            self.xof.squeeze(&mut self.buf);
+            out.copy_from_slice(&self.buf[..out.len()]);
+            self.pos = out.len();
+        }
+    }
+
+    pub fn next_u32(&mut self) -> u32 {
+        let mut bytes = [0u8; 4];
+        self.fill(&mut bytes);
+        u32::from_le_bytes(bytes)
+    }
+
+    pub fn next_u64(&mut self) -> u64 {
+        let mut bytes = [0u8; 8];
+        self.fill(&mut bytes);
+        u64::from_le_bytes(bytes)
+    }
+
+    /// The top 53 bits of the next uint64 as a float in [0, 1), as both NumPy
+    /// and `random.random()` do
+    pub fn next_f64(&mut self) -> f64 {
+        (self.next_u64() >> 11) as f64 * (1.0 / 9007199254740992.0)
+    }
+}
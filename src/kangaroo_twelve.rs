@@ -0,0 +1,215 @@
+//! KangarooTwelve (KT128 and KT256) from RFC 9861, built on the TurboShake
+//! implementations of the `shake` module.
+//!
+//! Inputs longer than a single 8KiB chunk are hashed as a tree: the first chunk
+//! is absorbed into the final node directly and every later chunk is a leaf
+//! whose chaining value is absorbed into the final node. The leaves are
+//! independent, so the chaining values of large absorbs are computed across
+//! threads with rayon.
+
+use digest::{ExtendableOutput, ExtendableOutputReset, Reset, Update, XofReader};
+use rayon::prelude::*;
+
+use crate::shake::{
+    take_bytes, take_vec, TurboShake128, TurboShake128Reader, TurboShake256, TurboShake256Reader,
+};
+use crate::SerializeState;
+
+/// Length of each chunk of the input in tree hashing mode
+const CHUNK_LEN: usize = 8192;
+
+/// Domain separation for a message which fits into a single chunk
+const SINGLE_NODE_DOMAIN: u8 = 0x07;
+/// Domain separation for the final node of the tree
+const FINAL_NODE_DOMAIN: u8 = 0x06;
+/// Domain separation for the leaves of the tree
+const LEAF_DOMAIN: u8 = 0x0B;
+
+/// Padding absorbed into the final node after the first chunk
+const FIRST_CHUNK_SUFFIX: [u8; 8] = [0x03, 0, 0, 0, 0, 0, 0, 0];
+/// Padding absorbed into the final node after the chaining values
+const FINAL_NODE_SUFFIX: [u8; 2] = [0xFF, 0xFF];
+
+/// `length_encode(x)` from RFC 9861: the big-endian bytes of `x` with leading
+/// zero bytes removed, followed by the number of bytes used
+fn length_encode(x: usize) -> Vec<u8> {
+    let bytes = (x as u64).to_be_bytes();
+    let skip = bytes.iter().take_while(|&&b| b == 0).count();
+
+    let mut encoded = bytes[skip..].to_vec();
+    encoded.push((bytes.len() - skip) as u8);
+    encoded
+}
+
+macro_rules! impl_kangaroo_twelve {
+    (
+        name = $name:ident,
+        hasher = $hasher:ident,
+        reader = $reader:ident,
+        chaining_value_len = $cv_len:literal $(,)?
+    ) => {
+        #[doc = concat!("The ", stringify!($name), " XOF from RFC 9861 with a fixed customization string")]
+        #[derive(Clone)]
+        pub struct $name {
+            customization: Vec<u8>,
+            // absorbs the first chunk, followed by the chaining values of the leaves
+            final_node: $hasher,
+            // input which is not yet part of a node, at most one chunk
+            pending: Vec<u8>,
+            // number of chunks absorbed into the final node
+            chunk_count: usize,
+        }
+
+        impl $name {
+            pub fn new(customization: &[u8]) -> Self {
+                Self {
+                    customization: customization.to_vec(),
+                    final_node: $hasher::new(FINAL_NODE_DOMAIN),
+                    pending: Vec::with_capacity(CHUNK_LEN),
+                    chunk_count: 0,
+                }
+            }
+
+            fn chaining_value(leaf: &[u8]) -> [u8; $cv_len] {
+                let mut hasher = $hasher::new(LEAF_DOMAIN);
+                hasher.update(leaf);
+
+                let mut cv = [0u8; $cv_len];
+                hasher.finalize_xof().read(&mut cv);
+                cv
+            }
+
+            /// Move the full pending chunk into the tree
+            fn commit_pending(&mut self) {
+                if self.chunk_count == 0 {
+                    self.final_node.update(&self.pending);
+                    self.final_node.update(&FIRST_CHUNK_SUFFIX);
+                } else {
+                    let cv = Self::chaining_value(&self.pending);
+                    self.final_node.update(&cv);
+                }
+                self.chunk_count += 1;
+                self.pending.clear();
+            }
+
+            /// Absorb whole leaves from the start of `data`, computing their
+            /// chaining values in parallel. At least one byte of `data` is always
+            /// left over, so the last chunk is never committed early.
+            fn absorb_leaves<'a>(&mut self, data: &'a [u8]) -> &'a [u8] {
+                let leaves_len = (data.len() - 1) / CHUNK_LEN * CHUNK_LEN;
+                let (leaves, rest) = data.split_at(leaves_len);
+
+                let cvs: Vec<[u8; $cv_len]> = leaves
+                    .par_chunks(CHUNK_LEN)
+                    .map(Self::chaining_value)
+                    .collect();
+                for cv in &cvs {
+                    self.final_node.update(cv);
+                }
+                self.chunk_count += cvs.len();
+
+                rest
+            }
+        }
+
+        impl Update for $name {
+            fn update(&mut self, mut data: &[u8]) {
+                while !data.is_empty() {
+                    // A chunk is only committed once we know more input follows it,
+                    // as a message of exactly one chunk is not tree hashed
+                    if self.pending.len() == CHUNK_LEN {
+                        self.commit_pending();
+                    }
+
+                    if self.pending.is_empty() && self.chunk_count > 0 && data.len() > CHUNK_LEN {
+                        data = self.absorb_leaves(data);
+                    }
+
+                    let take = (CHUNK_LEN - self.pending.len()).min(data.len());
+                    self.pending.extend_from_slice(&data[..take]);
+                    data = &data[take..];
+                }
+            }
+        }
+
+        impl ExtendableOutput for $name {
+            type Reader = $reader;
+
+            fn finalize_xof(mut self) -> Self::Reader {
+                let customization = std::mem::take(&mut self.customization);
+                self.update(&customization);
+                self.update(&length_encode(customization.len()));
+
+                if self.chunk_count == 0 {
+                    let mut hasher = $hasher::new(SINGLE_NODE_DOMAIN);
+                    hasher.update(&self.pending);
+                    return hasher.finalize_xof();
+                }
+
+                // The length encoding above ensures the last chunk is never empty
+                let cv = Self::chaining_value(&self.pending);
+                self.final_node.update(&cv);
+                self.final_node.update(&length_encode(self.chunk_count));
+                self.final_node.update(&FINAL_NODE_SUFFIX);
+                self.final_node.finalize_xof()
+            }
+        }
+
+        impl Reset for $name {
+            fn reset(&mut self) {
+                *self = Self::new(&self.customization);
+            }
+        }
+
+        impl ExtendableOutputReset for $name {
+            fn finalize_xof_reset(&mut self) -> Self::Reader {
+                let fresh = Self::new(&self.customization);
+                std::mem::replace(self, fresh).finalize_xof()
+            }
+        }
+
+        impl SerializeState for $name {
+            fn write_state(&self, out: &mut Vec<u8>) -> bool {
+                out.extend_from_slice(&(self.customization.len() as u64).to_le_bytes());
+                out.extend_from_slice(&self.customization);
+                self.final_node.write_state(out);
+                out.extend_from_slice(&(self.chunk_count as u64).to_le_bytes());
+                out.extend_from_slice(&(self.pending.len() as u64).to_le_bytes());
+                out.extend_from_slice(&self.pending);
+                true
+            }
+
+            fn read_state(data: &mut &[u8]) -> Option<Self> {
+                let customization = take_vec(data, usize::MAX)?;
+                let final_node = $hasher::read_state(data)?;
+                let chunk_count = usize::try_from(u64::from_le_bytes(take_bytes(data)?)).ok()?;
+                let mut pending = take_vec(data, CHUNK_LEN)?;
+                // The final chunk is only ever empty before anything is absorbed
+                if chunk_count > 0 && pending.is_empty() {
+                    return None;
+                }
+                pending.reserve(CHUNK_LEN - pending.len());
+                Some(Self {
+                    customization,
+                    final_node,
+                    pending,
+                    chunk_count,
+                })
+            }
+        }
+    };
+}
+
+impl_kangaroo_twelve!(
+    name = KT128,
+    hasher = TurboShake128,
+    reader = TurboShake128Reader,
+    chaining_value_len = 32,
+);
+
+impl_kangaroo_twelve!(
+    name = KT256,
+    hasher = TurboShake256,
+    reader = TurboShake256Reader,
+    chaining_value_len = 64,
+);
@@ -1,70 +1,2144 @@
+mod aio;
+mod bit_generator;
+mod blake3_key;
+mod buffered_xof;
+mod kangaroo_twelve;
+mod prefix_cache;
+mod shake;
+mod sp800_185;
+mod stats;
+mod xof_random;
+
+use std::collections::BTreeMap;
+use std::fs::File;
+use std::io::{self, Read, Seek};
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex};
+
+use aio::run_in_order;
 use ascon_hash::{AsconAXof, AsconAXofReader, AsconXof, AsconXofReaderCore};
+use bit_generator::XofBitGenerator;
 use blake3::{Hasher as Blake3, OutputReader as Blake3Reader};
+use blake3_key::Blake3KeyContext;
+use digest::{
+    core_api::XofReaderCoreWrapper, ExtendableOutput, ExtendableOutputReset, Update, XofReader,
+};
+use kangaroo_twelve::{KT128, KT256};
+use prefix_cache::PrefixCache;
+use rayon::{prelude::*, ThreadPool};
+use shake::{
+    take_bytes, Shake128, Shake128Reader, Shake256, Shake256Reader, TurboShake128,
+    TurboShake128Reader, TurboShake256, TurboShake256Reader,
+};
+use sp800_185::{
+    CShake128, CShake256, Kmac128, Kmac256, KmacXof128, KmacXof256, ParallelHash128,
+    ParallelHash256, ParallelHashXof128, ParallelHashXof256, TupleHash128, TupleHash256,
+    TupleHashXof128, TupleHashXof256,
+};
+use stats::{AlgorithmStats, Instrumented};
+use xof_random::add_xof_random;
+
 use pyo3::{
-    buffer::PyBuffer,
-    exceptions::{PyTypeError, PyValueError},
+    buffer::{Element, PyBuffer},
+    exceptions::{PyBufferError, PyOverflowError, PyRuntimeError, PyTypeError, PyValueError},
+    ffi,
+    marker::Ungil,
     prelude::*,
-    types::PyBytes,
-};
-use sha3::{
-    digest::{
-        core_api::{CoreWrapper, XofReaderCoreWrapper},
-        ExtendableOutputReset, Update, XofReader,
-    },
-    Shake128, Shake128Reader, Shake256, Shake256Reader, TurboShake128, TurboShake128Core,
-    TurboShake128Reader, TurboShake256, TurboShake256Core, TurboShake256Reader,
+    types::{PyBool, PyBytes, PyDict, PyInt, PyTuple, PyType},
 };
 
 // remove when https://github.com/RustCrypto/hashes/pull/610 lands
 type AsconXofReader = XofReaderCoreWrapper<AsconXofReaderCore>;
 
-fn pybuffer_get_bytes<'py>(data: &Bound<'py, PyAny>) -> PyResult<&'py [u8]> {
-    let buf = PyBuffer::<u8>::get(data)?;
+/// Calls which absorb or squeeze at least this many bytes release the GIL while
+/// the permutation runs. Below this, the cost of dropping and re-acquiring the
+/// GIL outweighs the work done.
+const GIL_RELEASE_THRESHOLD: usize = 1 << 12;
+
+/// A read-only view of the memory exported by a Python object through the
+/// buffer protocol.
+///
+/// The export is held until this value is dropped, which pins the memory of
+/// the exporter (a `bytearray` cannot be resized while it is exported, for
+/// example). The bytes can therefore be safely used after the GIL has been
+/// released, and on free-threaded builds where no GIL is held at all.
+///
+/// Pinning does not stop other threads writing into a mutable exporter while
+/// the view is in use. As with `hashlib`, the bytes read by a call which races
+/// with such a write are unspecified, but the memory always remains valid.
+struct PinnedBytes {
+    buf: PyBuffer<u8>,
+}
+
+impl PinnedBytes {
+    fn as_slice(&self) -> &[u8] {
+        if self.buf.len_bytes() == 0 {
+            return &[];
+        }
+
+        // SAFETY: the buffer is C-contiguous and the export held by `self.buf`
+        // keeps the data alive and in place for the lifetime of `self`
+        unsafe { std::slice::from_raw_parts(self.buf.buf_ptr() as *const u8, self.buf.len_bytes()) }
+    }
+}
+
+/// A writable view of the memory exported by a Python object through the
+/// buffer protocol as an array of `T`, see `PinnedBytes`.
+struct PinnedBufferMut<T: Element = u8> {
+    buf: PyBuffer<T>,
+}
+
+impl<T: Element> PinnedBufferMut<T> {
+    fn as_mut_slice(&mut self) -> &mut [T] {
+        if self.buf.item_count() == 0 {
+            return &mut [];
+        }
 
-    // SAFETY: we hold the GIL so it is safe to access data via buffer.buf_ptr
-    Ok(unsafe { std::slice::from_raw_parts(buf.buf_ptr() as *const _, buf.len_bytes()) })
+        // SAFETY: the buffer is C-contiguous, writable and aligned for `T`, and
+        // the export held by `self.buf` keeps the data alive and in place for
+        // the lifetime of `self`
+        unsafe {
+            std::slice::from_raw_parts_mut(self.buf.buf_ptr() as *mut T, self.buf.item_count())
+        }
+    }
 }
 
-fn pybuffer_get_bytes_mut<'py>(data: &Bound<'py, PyAny>) -> PyResult<&'py mut [u8]> {
+fn pybuffer_get_bytes(data: &Bound<'_, PyAny>) -> PyResult<PinnedBytes> {
     let buf = PyBuffer::<u8>::get(data)?;
 
+    // SAFETY PRECONDITION: Ensure the data is a single contiguous block
+    if !buf.is_c_contiguous() {
+        return Err(PyBufferError::new_err("Buffer is not C-contiguous"));
+    }
+
+    Ok(PinnedBytes { buf })
+}
+
+fn pybuffer_get_mut<T: Element>(data: &Bound<'_, PyAny>) -> PyResult<PinnedBufferMut<T>> {
+    // Checks the item size, format and alignment are compatible with `T`
+    let buf = PyBuffer::<T>::get(data)?;
+
     // SAFETY PRECONDITION: Ensure the data area is mutable
     if buf.readonly() {
         return Err(PyTypeError::new_err("Cannot write into readonly object"));
     }
 
-    // SAFETY: we hold the GIL so it is safe to access data via buffer.buf_ptr
-    Ok(unsafe { std::slice::from_raw_parts_mut(buf.buf_ptr() as *mut _, buf.len_bytes()) })
+    // SAFETY PRECONDITION: Ensure the data is a single contiguous block
+    if !buf.is_c_contiguous() {
+        return Err(PyBufferError::new_err("Buffer is not C-contiguous"));
+    }
+
+    Ok(PinnedBufferMut { buf })
 }
 
-macro_rules! impl_sponge_shaker_classes {
-    // hasher is tt so we can pick the right kind of methods to generate
-    (
-        hasher_name = $hasher:tt,
-        pyclass_name = $class_name:literal,
-        reader_name = $xof_reader:ident,
-        rust_shaker_name = $shaker_name:ident,
-        rust_sponge_name = $sponge_name:ident,
-        example_hash = $example_hash:literal $(,)?
-    ) => {
-        #[pyclass(module="xoflib", name=$class_name)]
-        #[doc=concat!(stringify!($shaker_name), " implements absorption and finalization for the ", stringify!($hasher), " XOF")]
-        struct $shaker_name {
-            hasher: $hasher,
+/// Like `pybuffer_get_mut`, but returns `None` when the buffer is not compatible
+/// with `T` so other item types can be tried
+fn pybuffer_try_get_mut<T: Element>(
+    py: Python<'_>,
+    data: &Bound<'_, PyAny>,
+) -> PyResult<Option<PinnedBufferMut<T>>> {
+    match pybuffer_get_mut::<T>(data) {
+        Ok(buf) => Ok(Some(buf)),
+        Err(err) if err.is_instance_of::<PyBufferError>(py) => Ok(None),
+        Err(err) => Err(err),
+    }
+}
+
+fn pybuffer_get_bytes_mut(data: &Bound<'_, PyAny>) -> PyResult<PinnedBufferMut<u8>> {
+    pybuffer_get_mut::<u8>(data)
+}
+
+/// Run `f`, releasing the GIL first when `len` is at least `GIL_RELEASE_THRESHOLD`
+fn allow_threads_for_len<T, F>(py: Python<'_>, len: usize, f: F) -> T
+where
+    F: Ungil + FnOnce() -> T,
+    T: Ungil,
+{
+    if len >= GIL_RELEASE_THRESHOLD {
+        py.allow_threads(f)
+    } else {
+        f()
+    }
+}
+
+/// Mutable access to the state of a hasher or reader for a single operation,
+/// either borrowed directly or through the lock of a shared Python object
+trait WithState<T> {
+    /// Run `f` on the state, releasing the GIL first when `len` is at least
+    /// `GIL_RELEASE_THRESHOLD`
+    fn with_state<U, F>(self, py: Python<'_>, len: usize, f: F) -> U
+    where
+        F: Ungil + FnOnce(&mut T) -> U,
+        U: Ungil;
+}
+
+impl<T: Send> WithState<T> for &mut T {
+    fn with_state<U, F>(self, py: Python<'_>, len: usize, f: F) -> U
+    where
+        F: Ungil + FnOnce(&mut T) -> U,
+        U: Ungil,
+    {
+        allow_threads_for_len(py, len, || f(self))
+    }
+}
+
+/// The state of a shaker, hasher or sponge, locked for every operation so that
+/// one object can be used from several threads at once
+///
+/// The lock is only held inside `with_state`, whose closure cannot call into
+/// Python, so a thread holding it never waits for the GIL or runs code which
+/// could use the same object. A thread which finds the lock held waits for it
+/// with the GIL released.
+struct Locked<T>(Mutex<T>);
+
+impl<T> Locked<T> {
+    fn new(state: T) -> Self {
+        Self(Mutex::new(state))
+    }
+
+    fn into_inner(self) -> T {
+        self.0.into_inner().unwrap()
+    }
+}
+
+impl<T: Clone + Send> Locked<T> {
+    /// Return a copy of the state
+    fn cloned(&self, py: Python<'_>) -> T {
+        self.with_state(py, 0, |state| state.clone())
+    }
+}
+
+impl<T: Send> WithState<T> for &Locked<T> {
+    fn with_state<U, F>(self, py: Python<'_>, len: usize, f: F) -> U
+    where
+        F: Ungil + FnOnce(&mut T) -> U,
+        U: Ungil,
+    {
+        if len < GIL_RELEASE_THRESHOLD {
+            if let Ok(mut state) = self.0.try_lock() {
+                return f(&mut state);
+            }
         }
+        py.allow_threads(|| f(&mut self.0.lock().unwrap()))
+    }
+}
 
-        impl_sponge_shaker_classes!(@shaker_methods $hasher, $class_name, $shaker_name, $sponge_name);
+/// Absorb the data held by the Python object `data` into `hasher`, returning
+/// the number of bytes absorbed
+fn absorb_into<H: Update + Send>(
+    py: Python<'_>,
+    hasher: impl WithState<H>,
+    data: &Bound<'_, PyAny>,
+) -> PyResult<usize> {
+    let data = pybuffer_get_bytes(data)?;
+    let bytes = data.as_slice();
+    hasher.with_state(py, bytes.len(), |hasher| hasher.update(bytes));
+    Ok(bytes.len())
+}
+
+/// Absorb every buffer yielded by the Python iterable `data` into `hasher`
+///
+/// All of the buffers are acquired before any are absorbed, so an invalid item
+/// leaves `hasher` unchanged.
+fn absorb_many_into<H: Update + Send>(
+    py: Python<'_>,
+    hasher: impl WithState<H>,
+    data: &Bound<'_, PyAny>,
+) -> PyResult<usize> {
+    let buffers = data
+        .try_iter()?
+        .map(|item| pybuffer_get_bytes(&item?))
+        .collect::<PyResult<Vec<_>>>()?;
+
+    let total_len = buffers.iter().map(|buf| buf.as_slice().len()).sum();
+    hasher.with_state(py, total_len, |hasher| {
+        for buf in &buffers {
+            hasher.update(buf.as_slice());
+        }
+    });
+    Ok(total_len)
+}
+
+/// Number of bytes read from a file at a time by `absorb_reader`
+const FILE_READ_LEN: usize = 1 << 20;
+
+/// A file to absorb, given as a path or as an open file descriptor
+enum PathOrFd {
+    Fd(i32),
+    Path(PathBuf),
+}
+
+impl<'py> FromPyObject<'py> for PathOrFd {
+    fn extract_bound(obj: &Bound<'py, PyAny>) -> PyResult<Self> {
+        // `bool` is a subclass of `int`, but `True` is never meant as stdout
+        if obj.is_instance_of::<PyBool>() {
+            return Err(PyTypeError::new_err(
+                "file must be a path or a file descriptor, not bool",
+            ));
+        }
+        if obj.is_instance_of::<PyInt>() {
+            return Ok(Self::Fd(obj.extract()?));
+        }
+        Ok(Self::Path(obj.extract()?))
+    }
+}
+
+/// Absorb everything left in `reader` into `hasher`, returning the number of
+/// bytes absorbed
+fn absorb_reader<H: Update>(hasher: &mut H, mut reader: impl Read) -> io::Result<u64> {
+    let mut buf = vec![0u8; FILE_READ_LEN];
+    let mut total = 0;
+    loop {
+        match reader.read(&mut buf) {
+            Ok(0) => return Ok(total),
+            Ok(n) => {
+                hasher.update(&buf[..n]);
+                total += n as u64;
+            }
+            Err(err) if err.kind() == io::ErrorKind::Interrupted => continue,
+            Err(err) => return Err(err),
+        }
+    }
+}
+
+/// Absorb a file or the file at a path, which hashers can override with a
+/// faster method
+trait AbsorbPath: Update + Sized {
+    fn absorb_path(&mut self, path: &Path) -> io::Result<u64> {
+        self.absorb_file(File::open(path)?)
+    }
+
+    fn absorb_file(&mut self, file: File) -> io::Result<u64> {
+        absorb_reader(self, file)
+    }
+}
+
+impl AbsorbPath for Shake128 {}
+impl AbsorbPath for Shake256 {}
+impl AbsorbPath for TurboShake128 {}
+impl AbsorbPath for TurboShake256 {}
+impl AbsorbPath for KT128 {}
+impl AbsorbPath for KT256 {}
+impl AbsorbPath for CShake128 {}
+impl AbsorbPath for CShake256 {}
+impl AbsorbPath for Kmac128 {}
+impl AbsorbPath for Kmac256 {}
+impl AbsorbPath for ParallelHash128 {}
+impl AbsorbPath for ParallelHash256 {}
+impl AbsorbPath for AsconXof {}
+impl AbsorbPath for AsconAXof {}
+
+/// Absorb `file` as a single element of a TupleHash tuple, whose encoded
+/// length must be absorbed before its contents
+///
+/// The length of a regular file is taken from its metadata and the current
+/// offset, and the contents are then streamed, so only one read buffer is held
+/// in memory. Other files, such as pipes, only reveal their length at the end
+/// and are read into memory first.
+fn absorb_tuple_element<H, C, F>(
+    hasher: &mut H,
+    mut file: File,
+    start_element: F,
+) -> io::Result<u64>
+where
+    H: Update,
+    C: Update,
+    F: FnOnce(&mut H, u64) -> &mut C,
+{
+    let metadata = file.metadata()?;
+    if !metadata.is_file() {
+        let mut data = Vec::new();
+        file.read_to_end(&mut data)?;
+        hasher.update(&data);
+        return Ok(data.len() as u64);
+    }
+
+    let len = metadata.len().saturating_sub(file.stream_position()?);
+    let absorbed = absorb_reader(start_element(hasher, len), file.take(len))?;
+    if absorbed != len {
+        return Err(io::Error::new(
+            io::ErrorKind::UnexpectedEof,
+            "file was truncated while it was being read",
+        ));
+    }
+    Ok(len)
+}
+
+impl AbsorbPath for TupleHash128 {
+    fn absorb_file(&mut self, file: File) -> io::Result<u64> {
+        absorb_tuple_element(self, file, TupleHash128::start_element)
+    }
+}
+
+impl AbsorbPath for TupleHash256 {
+    fn absorb_file(&mut self, file: File) -> io::Result<u64> {
+        absorb_tuple_element(self, file, TupleHash256::start_element)
+    }
+}
+
+impl AbsorbPath for Blake3 {
+    fn absorb_path(&mut self, path: &Path) -> io::Result<u64> {
+        let len = std::fs::metadata(path)?.len();
+        self.update_mmap_rayon(path)?;
+        Ok(len)
+    }
+}
+
+/// Version of the format written by `to_bytes()`, increased whenever the state
+/// of any hasher or reader is written differently
+const STATE_FORMAT_VERSION: u8 = 1;
+
+/// Export and import of the complete state of a hasher or reader, used by
+/// `to_bytes()`, `from_bytes()` and pickling
+///
+/// The ascon-hash and blake3 crates keep their state private, so their types
+/// use the default methods and cannot be serialized.
+trait SerializeState: Sized {
+    /// Append the state to `out`, returning false when it cannot be exported
+    fn write_state(&self, _out: &mut Vec<u8>) -> bool {
+        false
+    }
+
+    /// Read a state written by `write_state` from the front of `data`
+    fn read_state(_data: &mut &[u8]) -> Option<Self> {
+        None
+    }
+}
+
+impl SerializeState for AsconXof {}
+impl SerializeState for AsconAXof {}
+impl SerializeState for AsconXofReader {}
+impl SerializeState for AsconAXofReader {}
+impl SerializeState for Blake3 {}
+impl SerializeState for Blake3Reader {}
+
+/// Serialize `state` as the format version, the name of the Python class and
+/// then the state itself
+fn state_to_bytes<'py, S: SerializeState>(
+    py: Python<'py>,
+    class_name: &str,
+    state: &S,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let mut out = vec![STATE_FORMAT_VERSION, class_name.len() as u8];
+    out.extend_from_slice(class_name.as_bytes());
+    if !state.write_state(&mut out) {
+        return Err(PyTypeError::new_err(format!(
+            "the state of {} cannot be serialized",
+            class_name
+        )));
+    }
+    Ok(PyBytes::new(py, &out))
+}
+
+/// Restore a state of the Python class `class_name` written by `state_to_bytes`
+fn state_from_bytes<S: SerializeState>(class_name: &str, data: &Bound<'_, PyAny>) -> PyResult<S> {
+    let data = pybuffer_get_bytes(data)?;
+    let mut data = data.as_slice();
+
+    let [version, name_len] = take_bytes(&mut data)
+        .ok_or_else(|| PyValueError::new_err(format!("invalid {} state", class_name)))?;
+    if version != STATE_FORMAT_VERSION {
+        return Err(PyValueError::new_err(format!(
+            "unsupported state format version {}, expected {}",
+            version, STATE_FORMAT_VERSION
+        )));
+    }
+    let name_len = name_len as usize;
+    if data.get(..name_len) != Some(class_name.as_bytes()) {
+        return Err(PyValueError::new_err(format!(
+            "the state is not of a {} object",
+            class_name
+        )));
+    }
+    data = &data[name_len..];
+
+    match S::read_state(&mut data) {
+        Some(state) if data.is_empty() => Ok(state),
+        _ => Err(PyValueError::new_err(format!(
+            "invalid {} state",
+            class_name
+        ))),
+    }
+}
+
+/// Open a new handle to the file descriptor `fd`, sharing its file offset
+#[cfg(unix)]
+fn dup_fd(py: Python<'_>, fd: i32) -> PyResult<File> {
+    use std::os::fd::{FromRawFd, RawFd};
+
+    // `os.dup` validates `fd` and raises OSError for descriptors which are not
+    // open, so no borrow of a possibly closed descriptor is ever made here
+    let fd: RawFd = py.import("os")?.call_method1("dup", (fd,))?.extract()?;
+    // SAFETY: `fd` is a new descriptor returned by `os.dup`, which nothing
+    // else owns
+    Ok(unsafe { File::from_raw_fd(fd) })
+}
+
+/// Open a new handle to the file descriptor `fd`, sharing its file offset
+#[cfg(windows)]
+fn dup_fd(py: Python<'_>, fd: i32) -> PyResult<File> {
+    use std::os::windows::io::{BorrowedHandle, RawHandle};
+
+    // msvcrt validates `fd` and raises OSError for descriptors which are not open
+    let handle: isize = py
+        .import("msvcrt")?
+        .call_method1("get_osfhandle", (fd,))?
+        .extract()?;
+    // SAFETY: `handle` is the open handle behind `fd`, and is only used to
+    // create a duplicate
+    let handle = unsafe { BorrowedHandle::borrow_raw(handle as RawHandle) };
+    Ok(File::from(handle.try_clone_to_owned()?))
+}
+
+/// Absorb the contents of `file` into `hasher` with the GIL released, returning
+/// the number of bytes absorbed
+fn absorb_file_into<H: AbsorbPath + Send>(
+    py: Python<'_>,
+    hasher: impl WithState<H>,
+    file: PathOrFd,
+) -> PyResult<u64> {
+    // The length of the file is not known up front, so the GIL is always released
+    let len = match file {
+        PathOrFd::Path(path) => {
+            hasher.with_state(py, usize::MAX, |hasher| hasher.absorb_path(&path))?
+        }
+        PathOrFd::Fd(fd) => {
+            let file = dup_fd(py, fd)?;
+            hasher.with_state(py, usize::MAX, |hasher| hasher.absorb_file(file))?
+        }
+    };
+    Ok(len)
+}
+
+/// Reads of at least this many bytes from Blake3 are generated across threads
+const BLAKE3_PARALLEL_READ_THRESHOLD: usize = 1 << 20;
+
+/// Number of bytes of Blake3 output generated by each task of a parallel read,
+/// a multiple of the 64 byte block size so every task starts on a block
+const BLAKE3_PARALLEL_READ_CHUNK_LEN: usize = 1 << 16;
+
+/// Fill a buffer with output from a XOF reader
+///
+/// This is `XofReader::read`, except for readers whose output blocks are
+/// independent and can be generated in parallel.
+trait Squeeze {
+    fn squeeze(&mut self, buf: &mut [u8]);
+}
+
+macro_rules! impl_sequential_squeeze {
+    ($($reader:ident),+ $(,)?) => {
+        $(
+            impl Squeeze for $reader {
+                fn squeeze(&mut self, buf: &mut [u8]) {
+                    self.read(buf);
+                }
+            }
+        )+
+    };
+}
+
+impl_sequential_squeeze!(
+    Shake128Reader,
+    Shake256Reader,
+    TurboShake128Reader,
+    TurboShake256Reader,
+    AsconXofReader,
+    AsconAXofReader,
+);
+
+impl Squeeze for Blake3Reader {
+    fn squeeze(&mut self, buf: &mut [u8]) {
+        if buf.len() < BLAKE3_PARALLEL_READ_THRESHOLD {
+            self.fill(buf);
+            return;
+        }
+
+        // Every task seeks its own copy of the reader to the start of its chunk
+        let start = self.position();
+        let reader = &*self;
+        buf.par_chunks_mut(BLAKE3_PARALLEL_READ_CHUNK_LEN)
+            .enumerate()
+            .for_each(|(i, chunk)| {
+                let mut reader = reader.clone();
+                reader.set_position(start + (i * BLAKE3_PARALLEL_READ_CHUNK_LEN) as u64);
+                reader.fill(chunk);
+            });
+        self.set_position(start + buf.len() as u64);
+    }
+}
+
+/// Fill `buf` with bytes squeezed from `xof`
+fn squeeze_into<R: Squeeze + Send>(py: Python<'_>, xof: impl WithState<R>, buf: &mut [u8]) {
+    xof.with_state(py, buf.len(), |xof| xof.squeeze(buf));
+}
+
+/// Fill every writable buffer yielded by the Python iterable `buffers`, in order,
+/// with bytes squeezed from `xof`
+///
+/// All of the buffers are acquired before any are filled, so an invalid item
+/// leaves `xof` unchanged.
+fn squeeze_into_many<R: Squeeze + Send>(
+    py: Python<'_>,
+    xof: impl WithState<R>,
+    buffers: &Bound<'_, PyAny>,
+) -> PyResult<usize> {
+    let mut buffers = buffers
+        .try_iter()?
+        .map(|item| pybuffer_get_bytes_mut(&item?))
+        .collect::<PyResult<Vec<_>>>()?;
+
+    // A buffer may appear more than once, so only one slice is borrowed at a time
+    let total_len = buffers.iter_mut().map(|buf| buf.as_mut_slice().len()).sum();
+    xof.with_state(py, total_len, |xof| {
+        for buf in &mut buffers {
+            xof.squeeze(buf.as_mut_slice());
+        }
+    });
+    Ok(total_len)
+}
+
+/// Squeeze `nbytes` bytes from `xof` and return them as an unsigned integer with
+/// the given `byteorder`, either "little" or "big"
+fn squeeze_uint<'py, R: Squeeze + Send>(
+    py: Python<'py>,
+    xof: impl WithState<R>,
+    nbytes: usize,
+    byteorder: &str,
+) -> PyResult<Bound<'py, PyAny>> {
+    let little_endian = match byteorder {
+        "little" => true,
+        "big" => false,
+        _ => {
+            return Err(PyValueError::new_err(
+                "byteorder must be either 'little' or 'big'",
+            ))
+        }
+    };
+
+    // Small integers are built natively, larger ones with int.from_bytes
+    if nbytes <= 16 {
+        let mut bytes = [0u8; 16];
+        xof.with_state(py, nbytes, |xof| xof.squeeze(&mut bytes[..nbytes]));
+        if !little_endian {
+            bytes[..nbytes].reverse();
+        }
+        let x = u128::from_le_bytes(bytes);
+        return Ok(x.into_pyobject(py)?.into_any());
+    }
+
+    let bytes = PyBytes::new_with(py, nbytes, |bytes| {
+        squeeze_into(py, xof, bytes);
+        Ok(())
+    })?;
+    py.get_type::<PyInt>()
+        .call_method1("from_bytes", (bytes, byteorder))
+}
+
+/// The number of bytes holding `count` packed `bits`-bit fields, checking
+/// `bits` is in range(1, 65)
+fn packed_len(count: usize, bits: u32) -> PyResult<usize> {
+    if !(1..=64).contains(&bits) {
+        return Err(PyValueError::new_err("bits is not in range(1, 65)"));
+    }
+    count
+        .checked_mul(bits as usize)
+        .map(|total_bits| total_bits.div_ceil(8))
+        .ok_or_else(|| PyOverflowError::new_err("total output length is too large"))
+}
+
+/// Pass the first `count` consecutive little-endian `bits`-bit fields of
+/// `bytes`, and their indices, to `emit`
+fn unpack_ints(bytes: &[u8], count: usize, bits: u32, mut emit: impl FnMut(usize, u64)) {
+    let mask = u64::MAX >> (64 - bits);
+    let mut acc = 0u128;
+    let mut acc_bits = 0;
+    let mut bytes = bytes.iter();
+    for i in 0..count {
+        while acc_bits < bits {
+            // `bytes` holds at least `count * bits` bits
+            acc |= u128::from(*bytes.next().unwrap()) << acc_bits;
+            acc_bits += 8;
+        }
+        emit(i, acc as u64 & mask);
+        acc >>= bits;
+        acc_bits -= bits;
+    }
+}
+
+/// Squeeze `count` packed `bits`-bit fields from `xof` into the first `count`
+/// items of `out`
+fn squeeze_ints_into<R: Squeeze + Send, T: Element + Send>(
+    py: Python<'_>,
+    xof: impl WithState<R>,
+    mut out: PinnedBufferMut<T>,
+    count: usize,
+    bits: u32,
+    convert: impl Fn(u64) -> T + Send,
+) -> PyResult<()> {
+    let len = packed_len(count, bits)?;
+    let item_bits = 8 * std::mem::size_of::<T>();
+    if bits as usize > item_bits {
+        return Err(PyValueError::new_err(format!(
+            "bits is too large for a {}-bit array",
+            item_bits
+        )));
+    }
+    let out = out.as_mut_slice();
+    if out.len() < count {
+        return Err(PyValueError::new_err("array has fewer than count items"));
+    }
+
+    xof.with_state(py, len, |xof| {
+        let mut bytes = vec![0u8; len];
+        xof.squeeze(&mut bytes);
+        unpack_ints(&bytes, count, bits, |i, x| out[i] = convert(x));
+    });
+    Ok(())
+}
+
+/// Squeeze `count` packed `bits`-bit fields from `xof`, either returning them
+/// or writing them into the array of unsigned integers `into`
+fn squeeze_ints<R: Squeeze + Send>(
+    py: Python<'_>,
+    xof: impl WithState<R>,
+    count: usize,
+    bits: u32,
+    into: Option<&Bound<'_, PyAny>>,
+) -> PyResult<Option<Vec<u64>>> {
+    let Some(into) = into else {
+        let len = packed_len(count, bits)?;
+        let mut bytes = vec![0u8; len];
+        squeeze_into(py, xof, &mut bytes);
+
+        let mut values = vec![0u64; count];
+        unpack_ints(&bytes, count, bits, |i, x| values[i] = x);
+        return Ok(Some(values));
+    };
+
+    if let Some(out) = pybuffer_try_get_mut::<u8>(py, into)? {
+        squeeze_ints_into(py, xof, out, count, bits, |x| x as u8)?;
+    } else if let Some(out) = pybuffer_try_get_mut::<u16>(py, into)? {
+        squeeze_ints_into(py, xof, out, count, bits, |x| x as u16)?;
+    } else if let Some(out) = pybuffer_try_get_mut::<u32>(py, into)? {
+        squeeze_ints_into(py, xof, out, count, bits, |x| x as u32)?;
+    } else {
+        let out = pybuffer_get_mut::<u64>(into)?;
+        squeeze_ints_into(py, xof, out, count, bits, |x| x)?;
+    }
+    Ok(None)
+}
+
+/// Return a new NumPy array of `dtype` and `shape` filled with bytes squeezed
+/// from `xof`, and the number of bytes squeezed
+///
+/// NumPy is only imported when this is called, so it remains an optional
+/// dependency.
+fn squeeze_array<'py, R: Squeeze + Send>(
+    py: Python<'py>,
+    xof: impl WithState<R>,
+    dtype: &Bound<'py, PyAny>,
+    shape: &Bound<'py, PyAny>,
+) -> PyResult<(Bound<'py, PyAny>, usize)> {
+    let numpy = py.import("numpy")?;
+    let dtype = numpy.getattr("dtype")?.call1((dtype,))?;
+
+    // Arbitrary bytes are only a valid value for plain numeric types
+    let kind: String = dtype.getattr("kind")?.extract()?;
+    if !matches!(kind.as_str(), "i" | "u" | "f" | "c") {
+        return Err(PyTypeError::new_err(format!(
+            "dtype must be an integer, floating point or complex type, not {}",
+            dtype
+        )));
+    }
+
+    // `numpy.empty` returns a C-contiguous array with aligned items, which is
+    // filled through a flat view of its bytes
+    let kwargs = PyDict::new(py);
+    kwargs.set_item("dtype", &dtype)?;
+    let array = numpy.getattr("empty")?.call((shape,), Some(&kwargs))?;
+    let bytes = array
+        .call_method1("reshape", (-1,))?
+        .call_method1("view", ("u1",))?;
+
+    let mut buf = pybuffer_get_bytes_mut(&bytes)?;
+    let buf = buf.as_mut_slice();
+    squeeze_into(py, xof, buf);
+    Ok((array, buf.len()))
+}
+
+/// Number of bytes squeezed at a time by `xor_squeeze_into`
+const XOR_BLOCK_LEN: usize = 1 << 12;
+
+/// XOR the next `buf.len()` bytes squeezed from `xof` into `buf`
+fn xor_squeeze_into<R: Squeeze + Send>(py: Python<'_>, xof: impl WithState<R>, buf: &mut [u8]) {
+    xof.with_state(py, buf.len(), |xof| {
+        let mut block = [0u8; XOR_BLOCK_LEN];
+        for chunk in buf.chunks_mut(XOR_BLOCK_LEN) {
+            let keystream = &mut block[..chunk.len()];
+            xof.squeeze(keystream);
+            for (b, k) in chunk.iter_mut().zip(keystream.iter()) {
+                *b ^= k;
+            }
+        }
+    });
+}
+
+/// Parameters for rejection sampling integers uniformly from `range(q)`
+///
+/// Candidates are parsed from the XOF output as consecutive `stride`-bit
+/// little-endian fields, keeping the low `bits` bits of each, and accepted when
+/// smaller than `q`. Bytes are squeezed in whole units of `lcm(stride, 8)` bits,
+/// so the unused candidates of the final unit are discarded, matching the
+/// sampling loops of ML-KEM (`bits = 12`) and ML-DSA (`bits = 23, stride = 24`).
+#[derive(Clone, Copy)]
+struct UniformSampler {
+    q: u64,
+    mask: u64,
+    stride: u32,
+}
+
+impl UniformSampler {
+    fn new(q: u64, bits: u32, stride: Option<u32>) -> PyResult<Self> {
+        let stride = stride.unwrap_or(bits);
+        if !(1..=32).contains(&bits) {
+            return Err(PyValueError::new_err("bits is not in range(1, 33)"));
+        }
+        if !(bits..=32).contains(&stride) {
+            return Err(PyValueError::new_err("stride is not in range(bits, 33)"));
+        }
+        if q == 0 || q > 1 << bits {
+            return Err(PyValueError::new_err("q is not in range(1, 2**bits + 1)"));
+        }
+
+        Ok(Self {
+            q,
+            mask: (1 << bits) - 1,
+            stride,
+        })
+    }
+
+    /// Squeeze from `xof` until `count` values have been accepted, passing each
+    /// accepted value and its index to `emit`, returning the number of bytes
+    /// squeezed
+    fn sample<R: XofReader>(
+        &self,
+        xof: &mut R,
+        count: usize,
+        mut emit: impl FnMut(usize, u64),
+    ) -> usize {
+        let stride = self.stride as usize;
+        let unit_len = stride / gcd(stride, 8);
+        let mut unit = [0u8; 32];
+        let mut squeezed = 0;
+
+        let mut i = 0;
+        while i < count {
+            xof.read(&mut unit[..unit_len]);
+            squeezed += unit_len;
+
+            let mut acc = 0u64;
+            let mut acc_bits = 0;
+            let mut bytes = unit[..unit_len].iter();
+            for _ in 0..(8 * unit_len / stride) {
+                while acc_bits < stride {
+                    // the unit holds exactly a whole number of candidates
+                    acc |= u64::from(*bytes.next().unwrap()) << acc_bits;
+                    acc_bits += 8;
+                }
+                let candidate = acc & self.mask;
+                acc >>= stride;
+                acc_bits -= stride;
+
+                if candidate < self.q {
+                    emit(i, candidate);
+                    i += 1;
+                    if i == count {
+                        break;
+                    }
+                }
+            }
+        }
+        squeezed
+    }
+}
+
+fn gcd(a: usize, b: usize) -> usize {
+    if b == 0 {
+        a
+    } else {
+        gcd(b, a % b)
+    }
+}
+
+/// Fill the array `buf` of unsigned 16 or 32-bit integers with values sampled
+/// uniformly from `range(q)` with the bytes squeezed from `xof`, returning the
+/// number of bytes squeezed
+fn sample_uniform_into<R: XofReader + Send>(
+    py: Python<'_>,
+    xof: impl WithState<R>,
+    buf: &Bound<'_, PyAny>,
+    sampler: UniformSampler,
+) -> PyResult<usize> {
+    if let Some(mut out) = pybuffer_try_get_mut::<u16>(py, buf)? {
+        if sampler.q > 1 << 16 {
+            return Err(PyValueError::new_err("q is too large for a 16-bit array"));
+        }
+        let out = out.as_mut_slice();
+        Ok(xof.with_state(py, 3 * out.len(), |xof| {
+            sampler.sample(xof, out.len(), |i, x| out[i] = x as u16)
+        }))
+    } else {
+        let mut out = pybuffer_get_mut::<u32>(buf)?;
+        let out = out.as_mut_slice();
+        Ok(xof.with_state(py, 3 * out.len(), |xof| {
+            sampler.sample(xof, out.len(), |i, x| out[i] = x as u32)
+        }))
+    }
+}
+
+/// Ensure a TurboShake domain separation byte is in range(1, 0x80)
+fn check_domain_sep(domain_sep: u8) -> PyResult<()> {
+    if !(0x01..=0x7F).contains(&domain_sep) {
+        return Err(PyValueError::new_err("domain sep is not in range(1, 0x80)"));
+    }
+    Ok(())
+}
+
+/// Ensure an SP 800-185 output length can be encoded in bits as a 64-bit integer
+fn check_output_len(output_len: usize) -> PyResult<()> {
+    if output_len as u64 > u64::MAX / 8 {
+        return Err(PyOverflowError::new_err("output_len is too large"));
+    }
+    Ok(())
+}
+
+/// Ensure a ParallelHash block size is not zero
+fn check_block_size(block_size: usize) -> PyResult<()> {
+    if block_size == 0 {
+        return Err(PyValueError::new_err("block_size must be positive"));
+    }
+    Ok(())
+}
+
+/// Read a 32 byte BLAKE3 key from the Python buffer `key`
+fn blake3_key(key: &Bound<'_, PyAny>) -> PyResult<[u8; 32]> {
+    pybuffer_get_bytes(key)?
+        .as_slice()
+        .try_into()
+        .map_err(|_| PyValueError::new_err("key must be 32 bytes"))
+}
+
+/// Thread pools built for the `threads` argument of the `*_many()` functions,
+/// kept for later calls with the same number of threads
+static THREAD_POOLS: Mutex<BTreeMap<usize, Arc<ThreadPool>>> = Mutex::new(BTreeMap::new());
+
+/// Return the pool of `threads` threads, building it on first use, or `None`
+/// for the global rayon thread pool when `threads` is not given
+fn thread_pool(threads: Option<usize>) -> PyResult<Option<Arc<ThreadPool>>> {
+    let Some(threads) = threads else {
+        return Ok(None);
+    };
+    if threads == 0 {
+        return Err(PyValueError::new_err("threads must be at least 1"));
+    }
+
+    let mut pools = THREAD_POOLS.lock().unwrap();
+    if let Some(pool) = pools.get(&threads) {
+        return Ok(Some(pool.clone()));
+    }
+    let pool = rayon::ThreadPoolBuilder::new()
+        .num_threads(threads)
+        .build()
+        .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
+    let pool = Arc::new(pool);
+    pools.insert(threads, pool.clone());
+    Ok(Some(pool))
+}
+
+/// Acquire the buffer of every message yielded by the Python iterable `messages`
+fn pybuffer_get_bytes_many(messages: &Bound<'_, PyAny>) -> PyResult<Vec<PinnedBytes>> {
+    messages
+        .try_iter()?
+        .map(|data| pybuffer_get_bytes(&data?))
+        .collect()
+}
+
+/// Hash every message with a fresh hasher from `new_hasher` and fill the
+/// output at the same index with its output, counting every message in `counters`
+///
+/// This is the engine behind the `*_batch()` and `*_many()` functions. Small
+/// amounts of work are done in place, and anything larger is done in parallel
+/// on `pool` or the global rayon thread pool with the GIL released.
+fn hash_each_into<H, F>(
+    py: Python<'_>,
+    pool: Option<&ThreadPool>,
+    messages: &[PinnedBytes],
+    outputs: &mut [&mut [u8]],
+    counters: &AlgorithmStats,
+    new_hasher: F,
+) where
+    H: Update + ExtendableOutput,
+    F: Fn() -> H + Sync,
+{
+    let hash_one = |data: &PinnedBytes, out: &mut [u8]| {
+        let start = stats::start();
+        let mut hasher = new_hasher();
+        hasher.update(data.as_slice());
+        counters.absorb.record(start, data.as_slice().len());
+
+        let start = stats::start();
+        let mut xof = hasher.finalize_xof();
+        counters.finalize.record(start, 0);
+
+        let start = stats::start();
+        xof.read(out);
+        counters.read.record(start, out.len());
+    };
+
+    let work_len = messages
+        .iter()
+        .map(|data| data.as_slice().len())
+        .chain(outputs.iter().map(|out| out.len()))
+        .sum::<usize>();
+    if work_len < GIL_RELEASE_THRESHOLD {
+        for (data, out) in messages.iter().zip(outputs.iter_mut()) {
+            hash_one(data, out);
+        }
+        return;
+    }
+
+    let mut hash_all = || {
+        messages
+            .par_iter()
+            .zip(outputs.par_iter_mut())
+            .for_each(|(data, out)| hash_one(data, out))
+    };
+    py.allow_threads(|| match pool {
+        Some(pool) => pool.install(hash_all),
+        None => hash_all(),
+    });
+}
+
+/// Hash every buffer in `inputs` with a fresh hasher from `new_hasher` and
+/// squeeze `n` bytes from each, concatenating the outputs into one bytes object
+/// and counting every input in `counters`
+fn xof_batch<'py, H, F>(
+    py: Python<'py>,
+    inputs: &Bound<'py, PyAny>,
+    n: usize,
+    counters: &AlgorithmStats,
+    new_hasher: F,
+) -> PyResult<Bound<'py, PyBytes>>
+where
+    H: Update + ExtendableOutput,
+    F: Fn() -> H + Sync,
+{
+    let inputs = pybuffer_get_bytes_many(inputs)?;
+
+    let out_len = inputs
+        .len()
+        .checked_mul(n)
+        .ok_or_else(|| PyOverflowError::new_err("total output length is too large"))?;
+    if out_len == 0 {
+        return Ok(PyBytes::new(py, &[]));
+    }
+
+    PyBytes::new_with(py, out_len, |out| {
+        let mut outputs = out.chunks_exact_mut(n).collect::<Vec<_>>();
+        hash_each_into(py, None, &inputs, &mut outputs, counters, new_hasher);
+        Ok(())
+    })
+}
+
+/// Create a bytes object for every length in `sizes` and let `fill` write all
+/// of their contents at once
+fn new_bytes_many<'py, F>(
+    py: Python<'py>,
+    sizes: Vec<usize>,
+    fill: F,
+) -> PyResult<Vec<Bound<'py, PyBytes>>>
+where
+    F: FnOnce(&mut [&mut [u8]]),
+{
+    let outputs = sizes
+        .iter()
+        .map(|&n| PyBytes::new_with(py, n, |_| Ok(())))
+        .collect::<PyResult<Vec<_>>>()?;
+    let mut buffers = outputs
+        .iter()
+        .zip(sizes)
+        .map(|(bytes, n)| match n {
+            0 => &mut [][..],
+            // SAFETY: every non-empty bytes object was created above and has
+            // not been shared yet, so its contents can still be written, and
+            // `outputs` keeps it alive while the slice is in use
+            _ => unsafe {
+                let data = ffi::PyBytes_AsString(bytes.as_ptr()) as *mut u8;
+                std::slice::from_raw_parts_mut(data, n)
+            },
+        })
+        .collect::<Vec<_>>();
+    fill(&mut buffers);
+    Ok(outputs)
+}
+
+/// Hash every buffer in `messages` with a fresh hasher from `new_hasher` and
+/// squeeze `out_len` bytes from each, returning the outputs as a list and
+/// counting every message in `counters`
+///
+/// The messages are hashed in parallel on the global rayon thread pool, or on a
+/// pool of `threads` threads when given, and the output is written directly
+/// into the returned bytes objects.
+fn xof_many<'py, H, F>(
+    py: Python<'py>,
+    messages: &Bound<'py, PyAny>,
+    out_len: usize,
+    threads: Option<usize>,
+    counters: &AlgorithmStats,
+    new_hasher: F,
+) -> PyResult<Vec<Bound<'py, PyBytes>>>
+where
+    H: Update + ExtendableOutput,
+    F: Fn() -> H + Sync,
+{
+    let pool = thread_pool(threads)?;
+    let messages = pybuffer_get_bytes_many(messages)?;
+    messages
+        .len()
+        .checked_mul(out_len)
+        .ok_or_else(|| PyOverflowError::new_err("total output length is too large"))?;
+
+    let pool = pool.as_deref();
+    new_bytes_many(py, vec![out_len; messages.len()], |buffers| {
+        hash_each_into(py, pool, &messages, buffers, counters, new_hasher);
+    })
+}
+
+macro_rules! impl_sponge_shaker_classes {
+    // hasher is tt so we can pick the right kind of methods to generate
+    (
+        hasher_name = $hasher:tt,
+        pyclass_name = $class_name:literal,
+        reader_name = $xof_reader:ident,
+        rust_shaker_name = $shaker_name:ident,
+        rust_sponge_name = $sponge_name:ident,
+        example_hash = $example_hash:literal $(,)?
+    ) => {
+        #[pyclass(module="xoflib", name=$class_name, frozen)]
+        #[doc=concat!(stringify!($shaker_name), " implements absorption and finalization for the ", stringify!($hasher), " XOF")]
+        struct $shaker_name {
+            hasher: Locked<$hasher>,
+        }
+
+        impl Instrumented for $shaker_name {
+            fn stats() -> &'static AlgorithmStats {
+                static STATS: AlgorithmStats = AlgorithmStats::new($class_name);
+                &STATS
+            }
+        }
+
+        impl_sponge_shaker_classes!(@shaker_methods $hasher, $class_name, $shaker_name, $sponge_name);
+
+        #[pyclass(module="xoflib", frozen)]
+        #[doc=concat!(stringify!($sponge_name), " implements sponge expansion for the ", stringify!($hasher), " XOF")]
+        struct $sponge_name {
+            xof: Locked<$xof_reader>,
+        }
+
+        impl Instrumented for $sponge_name {
+            fn stats() -> &'static AlgorithmStats {
+                $shaker_name::stats()
+            }
+        }
+
+        impl_sponge_shaker_classes!(@sponge_methods $hasher, $class_name, $sponge_name, $example_hash);
+
+        impl From<$shaker_name> for $sponge_name {
+            /// Finalize a shaker which was never shared with Python, such as
+            /// the one built by a one-shot function, without locking it
+            fn from(shaker: $shaker_name) -> Self {
+                let start = stats::start();
+                let xof = shaker.hasher.into_inner().finalize_xof();
+                $shaker_name::stats().finalize.record(start, 0);
+                Self { xof: Locked::new(xof) }
+            }
+        }
+
+        impl $shaker_name {
+            /// Absorb `file` into a copy of the state and read `out_len` bytes of
+            /// output, leaving the shaker itself unchanged, for `hash_file()`
+            fn hash_file<'py>(&self, py: Python<'py>, file: PathOrFd, out_len: usize) -> PyResult<Bound<'py, PyBytes>> {
+                let mut hasher = self.hasher.cloned(py);
+                let start = stats::start();
+                let len = absorb_file_into(py, &mut hasher, file)?;
+                Self::stats().absorb.record(start, len as usize);
+
+                let start = stats::start();
+                let mut xof = hasher.finalize_xof();
+                Self::stats().finalize.record(start, 0);
+
+                let start = stats::start();
+                let bytes = PyBytes::new_with(py, out_len, |bytes| {
+                    squeeze_into(py, &mut xof, bytes);
+                    Ok(())
+                })?;
+                Self::stats().read.record(start, out_len);
+                Ok(bytes)
+            }
+        }
+    };
+
+    // "match" on Blake3 and additionally generate random access into the output stream
+    (@sponge_methods Blake3, $class_name:literal, $sponge_name:ident, $example_hash:literal) => {
+        impl_sponge_shaker_classes!(@common_sponge_methods Blake3, $class_name, $sponge_name, $example_hash, {
+            #[doc=concat!(
+                "Move the read position of the Blake3 XOF to byte `offset` of the output stream\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", $class_name, "(b\"bytes to absorb\").finalize()\n",
+                "   >>> xof.seek(10 * 2**30)\n",
+                "   >>> xof.tell()\n",
+                "   10737418240\n",
+            )]
+            fn seek(&self, py: Python<'_>, offset: u64) {
+                self.xof.with_state(py, 0, |xof| xof.set_position(offset));
+            }
+
+            #[doc=concat!(
+                "Return the current read position of the Blake3 XOF in the output stream\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", $class_name, "(b\"bytes to absorb\").finalize()\n",
+                "   >>> _ = xof.read(100)\n",
+                "   >>> xof.tell()\n",
+                "   100\n",
+            )]
+            fn tell(&self, py: Python<'_>) -> u64 {
+                self.xof.with_state(py, 0, |xof| xof.position())
+            }
+
+            #[doc=concat!(
+                "Read `n` bytes of data from the Blake3 XOF starting at byte `offset` of the output stream\n",
+                "\n",
+                "The current read position is not changed.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", $class_name, "(b\"bytes to absorb\").finalize()\n",
+                "   >>> xof.read_at(16, 16) == xof.read(32)[16:]\n",
+                "   True\n",
+            )]
+            fn read_at<'py>(&self, py: Python<'py>, offset: u64, n: usize) -> PyResult<Bound<'py, PyBytes>> {
+                let start = stats::start();
+                let mut xof = self.xof.cloned(py);
+                xof.set_position(offset);
+                let bytes = PyBytes::new_with(py, n, |bytes| {
+                    squeeze_into(py, &mut xof, bytes);
+                    Ok(())
+                })?;
+                Self::stats().read.record(start, n);
+                Ok(bytes)
+            }
+        });
+    };
+
+    (@sponge_methods $hasher:tt, $class_name:literal, $sponge_name:ident, $example_hash:literal) => {
+        impl_sponge_shaker_classes!(@common_sponge_methods $hasher, $class_name, $sponge_name, $example_hash, {});
+    };
+
+    (@common_sponge_methods $hasher:tt, $class_name:literal, $sponge_name:ident, $example_hash:literal, { $($methods:tt)* }) => {
+        #[pymethods]
+        impl $sponge_name {
+            $($methods)*
+
+            #[doc=concat!(
+                "Read `n` bytes of data from the ", stringify!($hasher), " XOF\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.absorb(bytearray(b\"Ooh just a little bit more data\")).finalize()\n",
+                "   >>> xof.read(16).hex()\n",
+                "   ", $example_hash, "\n",
+            )]
+            fn read<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyBytes>> {
+                let start = stats::start();
+                let bytes = PyBytes::new_with(py, n, |bytes| {
+                    squeeze_into(py, &self.xof, bytes);
+                    Ok(())
+                })?;
+                Self::stats().read.record(start, n);
+                Ok(bytes)
+            }
+
+            #[doc=concat!(
+                "Fill the input buffer with data from the ", stringify!($hasher), " XOF",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.absorb(bytearray(b\"Ooh just a little bit more data\")).finalize()\n",
+                "   >>> buf = bytearray(b\"\\0\" * 10)\n",
+                "   >>> xof.read_into(buf)\n",
+                "   >>> buf.hex()\n",
+                "   ", $example_hash, "\n",
+            )]
+            fn read_into(&self, py: Python<'_>, buf: &Bound<'_, PyAny>) -> PyResult<()> {
+                let start = stats::start();
+                let mut buf = pybuffer_get_bytes_mut(buf)?;
+                let buf = buf.as_mut_slice();
+                squeeze_into(py, &self.xof, buf);
+                Self::stats().read.record(start, buf.len());
+                Ok(())
+            }
+
+            #[doc=concat!(
+                "Read `nbytes` bytes from the ", stringify!($hasher), " XOF as an unsigned integer\n",
+                "\n",
+                "This is equivalent to `int.from_bytes(xof.read(nbytes), byteorder)`, where `byteorder` is\n",
+                "either `\"little\"` or `\"big\"`.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.finalize()\n",
+                "   >>> xof.copy().read_uint(8, \"little\") == int.from_bytes(xof.read(8), \"little\")\n",
+                "   True\n",
+            )]
+            fn read_uint<'py>(&self, py: Python<'py>, nbytes: usize, byteorder: &str) -> PyResult<Bound<'py, PyAny>> {
+                let start = stats::start();
+                let x = squeeze_uint(py, &self.xof, nbytes, byteorder)?;
+                Self::stats().read.record(start, nbytes);
+                Ok(x)
+            }
+
+            #[doc=concat!(
+                "Read `count` integers of `bits` bits each from the ", stringify!($hasher), " XOF\n",
+                "\n",
+                "The output is parsed as consecutive little-endian fields of `bits` bits, for `bits` between 1\n",
+                "and 64, using the first `ceil(count * bits / 8)` bytes. The values are returned as a list, or\n",
+                "when `into` is given they are written into the first `count` items of `into`, a writable array\n",
+                "of unsigned 8, 16, 32 or 64-bit integers, and `None` is returned.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from array import array\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.finalize()\n",
+                "   >>> values = xof.read_ints(256, 12)\n",
+                "   >>> all(x < 2**12 for x in values)\n",
+                "   True\n",
+                "   >>> out = array(\"H\", bytes(512))\n",
+                "   >>> xof.read_ints(256, 12, into=out)\n",
+            )]
+            #[pyo3(signature = (count, bits, into = None))]
+            fn read_ints(
+                &self,
+                py: Python<'_>,
+                count: usize,
+                bits: u32,
+                into: Option<&Bound<'_, PyAny>>,
+            ) -> PyResult<Option<Vec<u64>>> {
+                let start = stats::start();
+                let values = squeeze_ints(py, &self.xof, count, bits, into)?;
+                Self::stats().read.record(start, packed_len(count, bits)?);
+                Ok(values)
+            }
+
+            #[doc=concat!(
+                "Read a list of byte strings from the ", stringify!($hasher), " XOF, with lengths given by the iterable `sizes`\n",
+                "\n",
+                "This is equivalent to calling `read()` for each size, but crosses into Rust only once.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.finalize()\n",
+                "   >>> [len(chunk) for chunk in xof.read_many([16, 32, 1])]\n",
+                "   [16, 32, 1]\n",
+            )]
+            fn read_many<'py>(&self, py: Python<'py>, sizes: &Bound<'py, PyAny>) -> PyResult<Vec<Bound<'py, PyBytes>>> {
+                // Every size is checked before anything is read
+                let sizes = sizes
+                    .try_iter()?
+                    .map(|n| n?.extract::<usize>())
+                    .collect::<PyResult<Vec<_>>>()?;
+
+                // All of the chunks are read under one lock, so they are
+                // consecutive even when other threads read from this sponge
+                let start = stats::start();
+                let total_len = sizes.iter().sum();
+                let chunks = new_bytes_many(py, sizes, |buffers| {
+                    self.xof.with_state(py, total_len, |xof| {
+                        for buf in buffers.iter_mut() {
+                            xof.squeeze(buf);
+                        }
+                    });
+                })?;
+                Self::stats().read.record(start, total_len);
+                Ok(chunks)
+            }
+
+            #[doc=concat!(
+                "Fill every buffer in the iterable `buffers`, in order, with data from the ", stringify!($hasher), " XOF\n",
+                "\n",
+                "This is equivalent to calling `read_into()` for each buffer, but crosses into Rust only once.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.finalize()\n",
+                "   >>> buffers = [bytearray(16) for _ in range(4)]\n",
+                "   >>> xof.read_into_many(buffers)\n",
+            )]
+            fn read_into_many(&self, py: Python<'_>, buffers: &Bound<'_, PyAny>) -> PyResult<()> {
+                let start = stats::start();
+                let len = squeeze_into_many(py, &self.xof, buffers)?;
+                Self::stats().read.record(start, len);
+                Ok(())
+            }
+
+            #[doc=concat!(
+                "Read `n` bytes of data from the ", stringify!($hasher), " XOF on a background thread\n",
+                "\n",
+                "Returns an awaitable for the bytes. Reads are made in the order they are called, and\n",
+                "cancelling the awaitable does not stop the read, so the position of the XOF always\n",
+                "advances by `n` bytes.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.finalize()\n",
+                "   >>> async def read_key(xof):\n",
+                "   ...     return await xof.read_async(32)\n",
+            )]
+            fn read_async<'py>(slf: &Bound<'py, Self>, n: usize) -> PyResult<Bound<'py, PyAny>> {
+                run_in_order(slf.as_any(), "read", PyTuple::new(slf.py(), [n])?)
+            }
+
+            #[doc=concat!(
+                "Fill the input buffer with data from the ", stringify!($hasher), " XOF on a background thread\n",
+                "\n",
+                "Returns an awaitable which completes once `buf` is filled, see `read_async()`. The buffer\n",
+                "should not be used until then.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.finalize()\n",
+                "   >>> async def fill(xof, buf):\n",
+                "   ...     await xof.read_into_async(buf)\n",
+            )]
+            fn read_into_async<'py>(slf: &Bound<'py, Self>, buf: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+                run_in_order(slf.as_any(), "read_into", PyTuple::new(slf.py(), [buf])?)
+            }
+
+            #[doc=concat!(
+                "Read a new NumPy array of the given `dtype` and `shape` from the ", stringify!($hasher), " XOF\n",
+                "\n",
+                "The array is filled directly with the next `array.nbytes` bytes of output, so no\n",
+                "intermediate bytes are created. `dtype` must be an integer, floating point or complex type.\n",
+                "To fill an existing C-contiguous array, pass a byte view of it to `read_into()`, for example\n",
+                "`xof.read_into(array.view(numpy.uint8))`. NumPy is only required when this method is called.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> import numpy as np\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.finalize()\n",
+                "   >>> a = xof.read_array(np.uint32, (4, 256))\n",
+                "   >>> a.shape, a.dtype\n",
+                "   ((4, 256), dtype('uint32'))\n",
+            )]
+            fn read_array<'py>(
+                &self,
+                py: Python<'py>,
+                dtype: &Bound<'py, PyAny>,
+                shape: &Bound<'py, PyAny>,
+            ) -> PyResult<Bound<'py, PyAny>> {
+                let start = stats::start();
+                let (array, len) = squeeze_array(py, &self.xof, dtype, shape)?;
+                Self::stats().read.record(start, len);
+                Ok(array)
+            }
+
+            #[doc=concat!(
+                "XOR the next `len(buf)` bytes of data from the ", stringify!($hasher), " XOF into the input buffer in place\n",
+                "\n",
+                "This is equivalent to XORing `buf` with `read(len(buf))` without creating the intermediate bytes.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.finalize()\n",
+                "   >>> buf = bytearray(b\"attack at dawn\")\n",
+                "   >>> xof.copy().xor_into(buf)\n",
+                "   >>> xof.xor_into(buf)\n",
+                "   >>> buf\n",
+                "   bytearray(b'attack at dawn')\n",
+            )]
+            fn xor_into(&self, py: Python<'_>, buf: &Bound<'_, PyAny>) -> PyResult<()> {
+                let start = stats::start();
+                let mut buf = pybuffer_get_bytes_mut(buf)?;
+                let buf = buf.as_mut_slice();
+                xor_squeeze_into(py, &self.xof, buf);
+                Self::stats().read.record(start, buf.len());
+                Ok(())
+            }
+
+            #[doc=concat!(
+                "Fill the array `buf` with integers sampled uniformly from `range(q)` using the ", stringify!($hasher), " XOF\n",
+                "\n",
+                "`buf` must be a writable buffer of unsigned 16 or 32-bit integers, such as `array('H')` or `array('I')`.\n",
+                "Candidates are parsed from the output as consecutive little-endian fields of `stride` bits\n",
+                "(defaulting to `bits`), of which the low `bits` bits are kept, and rejected unless smaller than `q`.\n",
+                "ML-KEM uses `bits=12` and ML-DSA uses `bits=23, stride=24`.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from array import array\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.finalize()\n",
+                "   >>> poly = array(\"H\", bytes(512))\n",
+                "   >>> xof.sample_uniform(poly, 3329, 12)\n",
+                "   >>> all(c < 3329 for c in poly)\n",
+                "   True\n",
+            )]
+            #[pyo3(signature = (buf, q, bits, stride = None))]
+            fn sample_uniform(
+                &self,
+                py: Python<'_>,
+                buf: &Bound<'_, PyAny>,
+                q: u64,
+                bits: u32,
+                stride: Option<u32>,
+            ) -> PyResult<()> {
+                let start = stats::start();
+                let sampler = UniformSampler::new(q, bits, stride)?;
+                let len = sample_uniform_into(py, &self.xof, buf, sampler)?;
+                Self::stats().read.record(start, len);
+                Ok(())
+            }
+
+            #[doc=concat!(
+                "Return an independent copy of the ", stringify!($hasher), " XOF at its current position\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof = xof.finalize()\n",
+                "   >>> xof_copy = xof.copy()\n",
+                "   >>> xof.read(16) == xof_copy.read(16)\n",
+                "   True\n",
+            )]
+            fn copy(&self, py: Python<'_>) -> Self {
+                Self {
+                    xof: Locked::new(self.xof.cloned(py)),
+                }
+            }
+
+            fn __copy__(&self, py: Python<'_>) -> Self {
+                self.copy(py)
+            }
+
+            fn __deepcopy__(&self, py: Python<'_>, _memo: &Bound<'_, PyAny>) -> Self {
+                self.copy(py)
+            }
+
+            #[doc=concat!(
+                "Return the complete state of the ", stringify!($hasher), " XOF, including its read position, as bytes\n",
+                "\n",
+                "The state is restored by `", stringify!($sponge_name), ".from_bytes()` and is also used to pickle the sponge.\n",
+                "\n",
+                impl_sponge_shaker_classes!(@docs_sponge_to_bytes $hasher, $class_name),
+            )]
+            fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+                state_to_bytes(py, stringify!($sponge_name), &self.xof.cloned(py))
+            }
+
+            #[doc=concat!(
+                "Restore a ", stringify!($hasher), " XOF from the output of `", stringify!($sponge_name), ".to_bytes()`\n",
+                "\n",
+                "Raises `ValueError` when `data` is not the state of a ", stringify!($sponge_name), ".\n",
+            )]
+            #[classmethod]
+            fn from_bytes(_cls: &Bound<'_, PyType>, data: &Bound<'_, PyAny>) -> PyResult<Self> {
+                Ok(Self {
+                    xof: Locked::new(state_from_bytes(stringify!($sponge_name), data)?),
+                })
+            }
+
+            fn __reduce__<'py>(
+                slf: &Bound<'py, Self>,
+            ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, PyBytes>,))> {
+                let state = slf.borrow().to_bytes(slf.py())?;
+                Ok((slf.get_type().getattr("from_bytes")?, (state,)))
+            }
+
+            fn __str__(&self) -> String {
+                String::from(stringify!($sponge_name))
+            }
+        }
+    };
+
+    // Blake3 memory-maps files given by path and hashes them across threads
+    (@docs_absorb_file Blake3) => {
+        ", or when given a path the file is memory-mapped and hashed using all available cores"
+    };
+
+    // The length of a tuple element is absorbed before its contents
+    (@docs_absorb_file TupleHashXof128) => {
+        impl_sponge_shaker_classes!(@docs_absorb_file TupleHash)
+    };
+
+    (@docs_absorb_file TupleHashXof256) => {
+        impl_sponge_shaker_classes!(@docs_absorb_file TupleHash)
+    };
+
+    (@docs_absorb_file TupleHash) => {
+        ". The whole file is absorbed as a single element of the tuple. A regular file is streamed \
+        in chunks, with its length taken before reading starts, but other files such as pipes are \
+        first read into memory in full, as their length is only known at the end"
+    };
+
+    (@docs_absorb_file $hasher:ident) => {
+        ""
+    };
+
+    // The ascon-hash and blake3 crates keep the state of their hashers private
+    (@docs_shaker_to_bytes AsconXof, $class_name:literal) => {
+        impl_sponge_shaker_classes!(@docs_to_bytes_unsupported)
+    };
+
+    (@docs_shaker_to_bytes AsconAXof, $class_name:literal) => {
+        impl_sponge_shaker_classes!(@docs_to_bytes_unsupported)
+    };
+
+    (@docs_shaker_to_bytes Blake3, $class_name:literal) => {
+        impl_sponge_shaker_classes!(@docs_to_bytes_unsupported)
+    };
+
+    (@docs_shaker_to_bytes $hasher:ident, $class_name:literal) => {
+        concat!(
+            "Example:\n",
+            "\n",
+            ".. code-block:: python\n",
+            "\n",
+            "   >>> import pickle\n",
+            "   >>> from xoflib import ", $class_name, "\n",
+            "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+            "   >>> restored = ", $class_name, ".from_bytes(xof.to_bytes())\n",
+            "   >>> restored.finalize().read(16) == pickle.loads(pickle.dumps(xof)).finalize().read(16)\n",
+            "   True\n",
+        )
+    };
+
+    (@docs_sponge_to_bytes AsconXof, $class_name:literal) => {
+        impl_sponge_shaker_classes!(@docs_to_bytes_unsupported)
+    };
+
+    (@docs_sponge_to_bytes AsconAXof, $class_name:literal) => {
+        impl_sponge_shaker_classes!(@docs_to_bytes_unsupported)
+    };
+
+    (@docs_sponge_to_bytes Blake3, $class_name:literal) => {
+        impl_sponge_shaker_classes!(@docs_to_bytes_unsupported)
+    };
+
+    (@docs_sponge_to_bytes $hasher:ident, $class_name:literal) => {
+        concat!(
+            "Example:\n",
+            "\n",
+            ".. code-block:: python\n",
+            "\n",
+            "   >>> import pickle\n",
+            "   >>> from xoflib import ", $class_name, "\n",
+            "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), ".finalize()\n",
+            "   >>> _ = xof.read(100)\n",
+            "   >>> restored = pickle.loads(pickle.dumps(xof))\n",
+            "   >>> restored.read(16) == xof.read(16)\n",
+            "   True\n",
+        )
+    };
+
+    (@docs_to_bytes_unsupported) => {
+        "The state of this XOF is private to the crate implementing it, so this raises `TypeError`.\n"
+    };
+
+    // "match" on the TurboShakes and generate the correct constructor for them
+    (@docs_construct_hasher TurboShake128, $class_name:literal) => {
+        concat!($class_name, "(1, b\"bytes to absorb\")")
+    };
+
+    (@docs_construct_hasher TurboShake256, $class_name:literal) => {
+        concat!($class_name, "(1, b\"bytes to absorb\")")
+    };
+
+    // "match" on cSHAKE and KMAC, which take a customization string and a key
+    (@docs_construct_hasher CShake128, $class_name:literal) => {
+        concat!($class_name, "(b\"bytes to absorb\", customization=b\"my application\")")
+    };
+
+    (@docs_construct_hasher CShake256, $class_name:literal) => {
+        concat!($class_name, "(b\"bytes to absorb\", customization=b\"my application\")")
+    };
+
+    (@docs_construct_hasher KmacXof128, $class_name:literal) => {
+        concat!($class_name, "(b\"secret key\", b\"bytes to absorb\")")
+    };
+
+    (@docs_construct_hasher KmacXof256, $class_name:literal) => {
+        concat!($class_name, "(b\"secret key\", b\"bytes to absorb\")")
+    };
+
+    // "match" on ParallelHash and TupleHash, which take a block size or a tuple of buffers
+    (@docs_construct_hasher ParallelHashXof128, $class_name:literal) => {
+        concat!($class_name, "(8192, b\"bytes to absorb\")")
+    };
+
+    (@docs_construct_hasher ParallelHashXof256, $class_name:literal) => {
+        concat!($class_name, "(8192, b\"bytes to absorb\")")
+    };
+
+    (@docs_construct_hasher TupleHashXof128, $class_name:literal) => {
+        concat!($class_name, "([b\"first field\", b\"second field\"])")
+    };
+
+    (@docs_construct_hasher TupleHashXof256, $class_name:literal) => {
+        concat!($class_name, "([b\"first field\", b\"second field\"])")
+    };
+
+    (@docs_construct_hasher $hasher:ident, $class_name:literal) => {
+        concat!($class_name, "(b\"bytes to absorb\")")
+    };
+
+    // "match" on the TurboShakes and generate a unique __init__ for them with domain separation
+    (@shaker_methods TurboShake128, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@turbo_shaker_methods TurboShake128, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@shaker_methods TurboShake256, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@turbo_shaker_methods TurboShake256, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@turbo_shaker_methods $hasher:ident, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@common_shaker_methods $hasher, $class_name, $shaker_name, $sponge_name, {
+            #[new]
+            #[pyo3(signature = (domain_sep, input_bytes = None))]
+            fn new(py: Python<'_>, domain_sep: u8, input_bytes: Option<&Bound<'_, PyAny>>) -> PyResult<Self> {
+                check_domain_sep(domain_sep)?;
+
+                let mut hasher = $hasher::new(domain_sep);
+                if let Some(initial_data) = input_bytes {
+                    let start = stats::start();
+                    let len = absorb_into(py, &mut hasher, initial_data)?;
+                    Self::stats().absorb.record(start, len);
+                }
+
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+        });
+    };
+
+    // "match" on KangarooTwelve and generate an __init__ which takes a customization string
+    (@shaker_methods KT128, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@kangaroo_twelve_shaker_methods KT128, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@shaker_methods KT256, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@kangaroo_twelve_shaker_methods KT256, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@kangaroo_twelve_shaker_methods $hasher:ident, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@common_shaker_methods $hasher, $class_name, $shaker_name, $sponge_name, {
+            #[new]
+            #[pyo3(signature = (input_bytes = None, customization = None))]
+            fn new(py: Python<'_>, input_bytes: Option<&Bound<'_, PyAny>>, customization: Option<&Bound<'_, PyAny>>) -> PyResult<Self> {
+                let mut hasher = match customization {
+                    Some(customization) => $hasher::new(pybuffer_get_bytes(customization)?.as_slice()),
+                    None => $hasher::new(&[]),
+                };
+                if let Some(initial_data) = input_bytes {
+                    let start = stats::start();
+                    let len = absorb_into(py, &mut hasher, initial_data)?;
+                    Self::stats().absorb.record(start, len);
+                }
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+        });
+    };
+
+    // "match" on cSHAKE and generate an __init__ which takes a function name and customization string
+    (@shaker_methods CShake128, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@cshake_shaker_methods CShake128, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@shaker_methods CShake256, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@cshake_shaker_methods CShake256, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@cshake_shaker_methods $hasher:ident, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@common_shaker_methods $hasher, $class_name, $shaker_name, $sponge_name, {
+            #[new]
+            #[pyo3(signature = (input_bytes = None, function_name = None, customization = None))]
+            fn new(
+                py: Python<'_>,
+                input_bytes: Option<&Bound<'_, PyAny>>,
+                function_name: Option<&Bound<'_, PyAny>>,
+                customization: Option<&Bound<'_, PyAny>>,
+            ) -> PyResult<Self> {
+                let function_name = function_name.map(pybuffer_get_bytes).transpose()?;
+                let customization = customization.map(pybuffer_get_bytes).transpose()?;
+                let mut hasher = $hasher::new(
+                    function_name.as_ref().map_or(&[][..], |n| n.as_slice()),
+                    customization.as_ref().map_or(&[][..], |c| c.as_slice()),
+                );
+                if let Some(initial_data) = input_bytes {
+                    let start = stats::start();
+                    let len = absorb_into(py, &mut hasher, initial_data)?;
+                    Self::stats().absorb.record(start, len);
+                }
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+        });
+    };
+
+    // "match" on the KMAC XOFs and generate an __init__ which takes a key and customization string
+    (@shaker_methods KmacXof128, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@kmac_xof_shaker_methods KmacXof128, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@shaker_methods KmacXof256, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@kmac_xof_shaker_methods KmacXof256, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@kmac_xof_shaker_methods $hasher:ident, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@common_shaker_methods $hasher, $class_name, $shaker_name, $sponge_name, {
+            #[new]
+            #[pyo3(signature = (key, input_bytes = None, customization = None))]
+            fn new(
+                py: Python<'_>,
+                key: &Bound<'_, PyAny>,
+                input_bytes: Option<&Bound<'_, PyAny>>,
+                customization: Option<&Bound<'_, PyAny>>,
+            ) -> PyResult<Self> {
+                let key = pybuffer_get_bytes(key)?;
+                let customization = customization.map(pybuffer_get_bytes).transpose()?;
+                // KMACXOF is KMAC with the output length encoded as zero
+                let mut hasher = $hasher::new(
+                    key.as_slice(),
+                    customization.as_ref().map_or(&[][..], |c| c.as_slice()),
+                    0,
+                );
+                if let Some(initial_data) = input_bytes {
+                    let start = stats::start();
+                    let len = absorb_into(py, &mut hasher, initial_data)?;
+                    Self::stats().absorb.record(start, len);
+                }
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+        });
+    };
+
+    // "match" on the ParallelHash XOFs and generate an __init__ which takes the block size
+    (@shaker_methods ParallelHashXof128, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@parallel_hash_xof_shaker_methods ParallelHashXof128, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@shaker_methods ParallelHashXof256, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@parallel_hash_xof_shaker_methods ParallelHashXof256, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@parallel_hash_xof_shaker_methods $hasher:ident, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@common_shaker_methods $hasher, $class_name, $shaker_name, $sponge_name, {
+            #[new]
+            #[pyo3(signature = (block_size, input_bytes = None, customization = None))]
+            fn new(
+                py: Python<'_>,
+                block_size: usize,
+                input_bytes: Option<&Bound<'_, PyAny>>,
+                customization: Option<&Bound<'_, PyAny>>,
+            ) -> PyResult<Self> {
+                check_block_size(block_size)?;
+                let customization = customization.map(pybuffer_get_bytes).transpose()?;
+                // ParallelHashXOF is ParallelHash with the output length encoded as zero
+                let mut hasher = $hasher::new(
+                    block_size,
+                    customization.as_ref().map_or(&[][..], |c| c.as_slice()),
+                    0,
+                );
+                if let Some(initial_data) = input_bytes {
+                    let start = stats::start();
+                    let len = absorb_into(py, &mut hasher, initial_data)?;
+                    Self::stats().absorb.record(start, len);
+                }
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+        });
+    };
+
+    // "match" on the TupleHash XOFs and generate an __init__ which takes an iterable of buffers
+    (@shaker_methods TupleHashXof128, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@tuple_hash_xof_shaker_methods TupleHashXof128, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@shaker_methods TupleHashXof256, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@tuple_hash_xof_shaker_methods TupleHashXof256, $class_name, $shaker_name, $sponge_name);
+    };
+
+    (@tuple_hash_xof_shaker_methods $hasher:ident, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@common_shaker_methods $hasher, $class_name, $shaker_name, $sponge_name, {
+            #[new]
+            #[pyo3(signature = (input_tuple = None, customization = None))]
+            fn new(
+                py: Python<'_>,
+                input_tuple: Option<&Bound<'_, PyAny>>,
+                customization: Option<&Bound<'_, PyAny>>,
+            ) -> PyResult<Self> {
+                let customization = customization.map(pybuffer_get_bytes).transpose()?;
+                // TupleHashXOF is TupleHash with the output length encoded as zero
+                let mut hasher = $hasher::new(
+                    customization.as_ref().map_or(&[][..], |c| c.as_slice()),
+                    0,
+                );
+                if let Some(elements) = input_tuple {
+                    let start = stats::start();
+                    let len = absorb_many_into(py, &mut hasher, elements)?;
+                    Self::stats().absorb.record(start, len);
+                }
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+        });
+    };
+
+    // "match" on Blake3 and additionally generate the multi-threaded absorption methods
+    (@shaker_methods Blake3, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@common_shaker_methods Blake3, $class_name, $shaker_name, $sponge_name, {
+            #[new]
+            #[pyo3(signature = (input_bytes = None, key = None))]
+            fn new(
+                py: Python<'_>,
+                input_bytes: Option<&Bound<'_, PyAny>>,
+                key: Option<&Bound<'_, PyAny>>,
+            ) -> PyResult<Self> {
+                // A 32 byte key selects the keyed hash mode of BLAKE3
+                let mut hasher = match key {
+                    Some(key) => Blake3::new_keyed(&blake3_key(key)?),
+                    None => Blake3::default(),
+                };
+                if let Some(initial_data) = input_bytes {
+                    let start = stats::start();
+                    let len = absorb_into(py, &mut hasher, initial_data)?;
+                    Self::stats().absorb.record(start, len);
+                }
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+
+            #[doc=concat!(
+                "Create a Blake3 XOF in key derivation mode and absorb `key_material`\n",
+                "\n",
+                "`context` should be a hardcoded, globally unique and application-specific string. When\n",
+                "many keys are derived with the same context, `Blake3KeyContext` hashes the context once\n",
+                "rather than for every key.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> context = \"example.com 2024-01-01 session keys\"\n",
+                "   >>> xof = ", $class_name, ".derive_key(context, b\"input key material\").finalize()\n",
+                "   >>> subkey = xof.read(32)\n",
+            )]
+            #[classmethod]
+            #[pyo3(signature = (context, key_material = None))]
+            fn derive_key(
+                cls: &Bound<'_, PyType>,
+                context: &str,
+                key_material: Option<&Bound<'_, PyAny>>,
+            ) -> PyResult<Self> {
+                let mut hasher = Blake3::new_derive_key(context);
+                if let Some(key_material) = key_material {
+                    let start = stats::start();
+                    let len = absorb_into(cls.py(), &mut hasher, key_material)?;
+                    Self::stats().absorb.record(start, len);
+                }
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+
+            #[doc=concat!(
+                "Absorb `input_bytes` into the Blake3 state using all available cores\n",
+                "\n",
+                "The output is identical to `absorb()`. Inputs of at least 128KB are needed before the\n",
+                "multi-threaded implementation is faster than the single-threaded one.\n",
+                "\n",
+                "Note: this method can be chained, i.e. .absorb_parallel().absorb()\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", $class_name, "()\n",
+                "   >>> xof.absorb_parallel(bytes(2**20))\n",
+            )]
+            fn absorb_parallel<'py>(slf: PyRef<'py, Self>, input_bytes: &Bound<'py, PyAny>) -> PyResult<PyRef<'py, Self>> {
+                let data = pybuffer_get_bytes(input_bytes)?;
+                let bytes = data.as_slice();
+                let start = stats::start();
+                slf.hasher.with_state(slf.py(), bytes.len(), |hasher| {
+                    hasher.update_rayon(bytes);
+                });
+                Self::stats().absorb.record(start, bytes.len());
+                Ok(slf)
+            }
+        });
+    };
+
+    (@shaker_methods $hasher:ident, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
+        impl_sponge_shaker_classes!(@common_shaker_methods $hasher, $class_name, $shaker_name, $sponge_name, {
+            #[new]
+            #[pyo3(signature = (input_bytes = None))]
+            fn new(py: Python<'_>, input_bytes: Option<&Bound<'_, PyAny>>) -> PyResult<Self> {
+                let mut hasher = $hasher::default();
+                if let Some(initial_data) = input_bytes {
+                    let start = stats::start();
+                    let len = absorb_into(py, &mut hasher, initial_data)?;
+                    Self::stats().absorb.record(start, len);
+                }
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+        });
+    };
+
+    // You cannot use a macro within a #[pymethods] block to define methods, so the methods which
+    // differ between hashers (such as __init__) are passed in as tokens and spliced into the block
+    // alongside the methods common to every shaker.
+    (@common_shaker_methods $hasher:ident, $class_name:literal, $shaker_name:ident, $sponge_name:ident, { $($methods:tt)* }) => {
+        #[pymethods]
+        impl $shaker_name {
+            $($methods)*
+
+            #[doc=concat!(
+                "Absorb `input_bytes` into the ", stringify!($hasher), " state\n",
+                "\n",
+                "Note: this method can be chained, i.e. .absorb().absorb()\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof.absorb(bytearray(b\"Ooh just a little bit more data\"))\n",
+            )]
+            fn absorb<'py>(slf: PyRef<'py, Self>, input_bytes: &Bound<'py, PyAny>) -> PyResult<PyRef<'py, Self>> {
+                let start = stats::start();
+                let len = absorb_into(slf.py(), &slf.hasher, input_bytes)?;
+                Self::stats().absorb.record(start, len);
+                Ok(slf)
+            }
+
+            #[doc=concat!(
+                "Absorb every buffer in the iterable `input_bytes` into the ", stringify!($hasher), " state, in order\n",
+                "\n",
+                "This is equivalent to calling `absorb()` for each buffer, but crosses into Rust only once,\n",
+                "which is much faster for many small inputs.\n",
+                "\n",
+                "Note: this method can be chained, i.e. .absorb_many().absorb()\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof.absorb_many([b\"field one\", b\"field two\", bytearray(b\"field three\")])\n",
+            )]
+            fn absorb_many<'py>(slf: PyRef<'py, Self>, input_bytes: &Bound<'py, PyAny>) -> PyResult<PyRef<'py, Self>> {
+                let start = stats::start();
+                let len = absorb_many_into(slf.py(), &slf.hasher, input_bytes)?;
+                Self::stats().absorb.record(start, len);
+                Ok(slf)
+            }
 
-        #[pyclass(module="xoflib")]
-        #[doc=concat!(stringify!($sponge_name), " implements sponge expansion for the ", stringify!($hasher), " XOF")]
-        struct $sponge_name {
-            xof: $xof_reader,
-        }
+            #[doc=concat!(
+                "Absorb the contents of a file into the ", stringify!($hasher), " state\n",
+                "\n",
+                "`file` is either a path or an open file descriptor, which is read from its current offset\n",
+                "to the end of the file and is not closed. The file is read in large chunks with the GIL\n",
+                "released", impl_sponge_shaker_classes!(@docs_absorb_file $hasher), ".\n",
+                "\n",
+                "Note: this method can be chained, i.e. .absorb_file().absorb()\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof.absorb_file(\"large_file.bin\")\n",
+            )]
+            fn absorb_file<'py>(slf: PyRef<'py, Self>, file: PathOrFd) -> PyResult<PyRef<'py, Self>> {
+                let start = stats::start();
+                let len = absorb_file_into(slf.py(), &slf.hasher, file)?;
+                Self::stats().absorb.record(start, len as usize);
+                Ok(slf)
+            }
 
-        #[pymethods]
-        impl $sponge_name {
             #[doc=concat!(
-                "Read `n` bytes of data from the ", stringify!($hasher), " XOF\n",
+                "Absorb `input_bytes` into the ", stringify!($hasher), " state on a background thread\n",
+                "\n",
+                "Returns an awaitable for the shaker. Calls are applied in the order they are made, and\n",
+                "cancelling the awaitable does not stop the data being absorbed. Mutable buffers are\n",
+                "copied when this is called. Every call should be awaited before `finalize()`.\n",
                 "\n",
                 "Example:\n",
                 "\n",
@@ -72,19 +2146,25 @@ macro_rules! impl_sponge_shaker_classes {
                 "\n",
                 "   >>> from xoflib import ", $class_name, "\n",
                 "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
-                "   >>> xof = xof.absorb(bytearray(b\"Ooh just a little bit more data\")).finalize()\n",
-                "   >>> xof.read(16).hex()\n",
-                "   ", $example_hash, "\n",
+                "   >>> async def absorb_stream(xof, stream):\n",
+                "   ...     async for chunk in stream:\n",
+                "   ...         await xof.absorb_async(chunk)\n",
+                "   ...     return xof.finalize()\n",
             )]
-            fn read<'py>(&mut self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyBytes>> {
-                PyBytes::new_with(py, n, |bytes| {
-                    self.xof.read(bytes);
-                    Ok(())
-                })
+            fn absorb_async<'py>(slf: &Bound<'py, Self>, input_bytes: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+                let py = slf.py();
+                let input_bytes = if input_bytes.is_exact_instance_of::<PyBytes>() {
+                    input_bytes.clone()
+                } else {
+                    PyBytes::new(py, pybuffer_get_bytes(input_bytes)?.as_slice()).into_any()
+                };
+                run_in_order(slf.as_any(), "absorb", PyTuple::new(py, [input_bytes])?)
             }
 
             #[doc=concat!(
-                "Fill the input buffer with data from the ", stringify!($hasher), " XOF",
+                "Finalize the ", stringify!($hasher), " XOF into a sponge for expansion\n",
+                "\n",
+                "This method also resets the state, allowing more data to be absorbed.",
                 "\n",
                 "Example:\n",
                 "\n",
@@ -92,156 +2172,573 @@ macro_rules! impl_sponge_shaker_classes {
                 "\n",
                 "   >>> from xoflib import ", $class_name, "\n",
                 "   >>> xof = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
-                "   >>> xof = xof.absorb(bytearray(b\"Ooh just a little bit more data\")).finalize()\n",
-                "   >>> buf = bytearray(b\"\\0\" * 10)\n",
-                "   >>> xof.read_into(buf)\n",
-                "   >>> buf.hex()\n",
-                "   ", $example_hash, "\n",
+                "   >>> xof = xof.finalize()\n",
             )]
-            fn read_into(&mut self, buf: &Bound<'_, PyAny>) -> PyResult<()> {
-                self.xof.read(pybuffer_get_bytes_mut(buf)?);
-                Ok(())
+            fn finalize(&self, py: Python<'_>) -> $sponge_name {
+                let start = stats::start();
+                let xof = self.hasher.with_state(py, 0, |hasher| hasher.finalize_xof_reset());
+                Self::stats().finalize.record(start, 0);
+                $sponge_name { xof: Locked::new(xof) }
+            }
+
+            #[doc=concat!(
+                "Return an independent copy of the ", stringify!($hasher), " state\n",
+                "\n",
+                "This allows a shared prefix to be absorbed once and then extended in several ways.\n",
+                "\n",
+                "Example:\n",
+                "\n",
+                ".. code-block:: python\n",
+                "\n",
+                "   >>> from xoflib import ", $class_name, "\n",
+                "   >>> prefix = ", impl_sponge_shaker_classes!(@docs_construct_hasher $hasher, $class_name), "\n",
+                "   >>> xof1 = prefix.copy().absorb(b\"first suffix\").finalize()\n",
+                "   >>> xof2 = prefix.copy().absorb(b\"second suffix\").finalize()\n",
+            )]
+            fn copy(&self, py: Python<'_>) -> Self {
+                Self {
+                    hasher: Locked::new(self.hasher.cloned(py)),
+                }
+            }
+
+            fn __copy__(&self, py: Python<'_>) -> Self {
+                self.copy(py)
+            }
+
+            fn __deepcopy__(&self, py: Python<'_>, _memo: &Bound<'_, PyAny>) -> Self {
+                self.copy(py)
+            }
+
+            #[doc=concat!(
+                "Return the complete state of the ", stringify!($hasher), " hasher as bytes\n",
+                "\n",
+                "The state is restored by `", $class_name, ".from_bytes()`, which may run in another process, and\n",
+                "is also used to pickle the shaker.\n",
+                "\n",
+                impl_sponge_shaker_classes!(@docs_shaker_to_bytes $hasher, $class_name),
+            )]
+            fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+                state_to_bytes(py, $class_name, &self.hasher.cloned(py))
+            }
+
+            #[doc=concat!(
+                "Restore a ", stringify!($hasher), " hasher from the output of `", $class_name, ".to_bytes()`\n",
+                "\n",
+                "Raises `ValueError` when `data` is not the state of a ", $class_name, ".\n",
+            )]
+            #[classmethod]
+            fn from_bytes(_cls: &Bound<'_, PyType>, data: &Bound<'_, PyAny>) -> PyResult<Self> {
+                Ok(Self {
+                    hasher: Locked::new(state_from_bytes($class_name, data)?),
+                })
+            }
+
+            fn __reduce__<'py>(
+                slf: &Bound<'py, Self>,
+            ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, PyBytes>,))> {
+                let state = slf.borrow().to_bytes(slf.py())?;
+                Ok((slf.get_type().getattr("from_bytes")?, (state,)))
             }
 
             fn __str__(&self) -> String {
-                String::from(stringify!($sponge_name))
+                String::from($class_name)
             }
         }
     };
+}
 
-    // "match" on the TurboShakes and generate the correct constructor for them
-    (@docs_construct_hasher TurboShake128, $class_name:literal) => {
-        concat!($class_name, "(1, b\"bytes to absorb\")")
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = Shake128,
+    pyclass_name     = "Shake128",
+    reader_name      = Shake128Reader,
+    rust_shaker_name = Shaker128,
+    rust_sponge_name = Sponge128,
+    example_hash     = "'2c67a3c30e75de37d30e3f6d94e05a00'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = Shake256,
+    pyclass_name     = "Shake256",
+    reader_name      = Shake256Reader,
+    rust_shaker_name = Shaker256,
+    rust_sponge_name = Sponge256,
+    example_hash = "'82786e027034dccb6f41224c22a227c9'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = TurboShake128,
+    pyclass_name     = "TurboShake128",
+    reader_name      = TurboShake128Reader,
+    rust_shaker_name = TurboShaker128,
+    rust_sponge_name = TurboSponge128,
+    example_hash = "'b6be317e80aa741b9f0ac9330d584506'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = TurboShake256,
+    pyclass_name     = "TurboShake256",
+    reader_name      = TurboShake256Reader,
+    rust_shaker_name = TurboShaker256,
+    rust_sponge_name = TurboSponge256,
+    example_hash = "'2e9d18d326438ea968b071ab958f6260'",
+);
+
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = AsconXof,
+    pyclass_name     = "AsconXof",
+    reader_name      = AsconXofReader,
+    rust_shaker_name = Ascon,
+    rust_sponge_name = AsconSponge,
+    example_hash = "'202e12280fb6781470016dc067d3b213'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = AsconAXof,
+    pyclass_name     = "AsconAXof",
+    reader_name      = AsconAXofReader,
+    rust_shaker_name = AsconA,
+    rust_sponge_name = AsconASponge,
+    example_hash = "'e3d5593d0e08c5a7c6cbf751fb817f0a'",
+);
+
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = Blake3,
+    pyclass_name     = "Blake3",
+    reader_name      = Blake3Reader,
+    rust_shaker_name = Blake3Xof,
+    rust_sponge_name = Blake3Sponge,
+    example_hash = "'79c528b01f9519031bb3ebfbb4d99ecb'",
+);
+
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = KT128,
+    pyclass_name     = "KT128",
+    reader_name      = TurboShake128Reader,
+    rust_shaker_name = KTShaker128,
+    rust_sponge_name = KTSponge128,
+    example_hash = "'bc1da5be7c5c85d547c82c280d2bb7bf'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = KT256,
+    pyclass_name     = "KT256",
+    reader_name      = TurboShake256Reader,
+    rust_shaker_name = KTShaker256,
+    rust_sponge_name = KTSponge256,
+    example_hash = "'d2074a87b378d6eaf074fbe6507bedb1'",
+);
+
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = CShake128,
+    pyclass_name     = "CShake128",
+    reader_name      = Shake128Reader,
+    rust_shaker_name = CShaker128,
+    rust_sponge_name = CShakeSponge128,
+    example_hash     = "'fe86f7c3815491e8ba6e34929f228fce'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = CShake256,
+    pyclass_name     = "CShake256",
+    reader_name      = Shake256Reader,
+    rust_shaker_name = CShaker256,
+    rust_sponge_name = CShakeSponge256,
+    example_hash     = "'3c44fef874717625c77443b34ef8ae50'",
+);
+
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = KmacXof128,
+    pyclass_name     = "KmacXof128",
+    reader_name      = Shake128Reader,
+    rust_shaker_name = KmacXofShaker128,
+    rust_sponge_name = KmacXofSponge128,
+    example_hash     = "'db3cea98f7c373e8093ee0636230c23c'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = KmacXof256,
+    pyclass_name     = "KmacXof256",
+    reader_name      = Shake256Reader,
+    rust_shaker_name = KmacXofShaker256,
+    rust_sponge_name = KmacXofSponge256,
+    example_hash     = "'26efd431b7ca54e223d65aca519455f8'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = TupleHashXof128,
+    pyclass_name     = "TupleHashXof128",
+    reader_name      = Shake128Reader,
+    rust_shaker_name = TupleHashXofShaker128,
+    rust_sponge_name = TupleHashXofSponge128,
+    example_hash     = "'65f6f54fb52dddb62869d1fe3b4d5e76'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = TupleHashXof256,
+    pyclass_name     = "TupleHashXof256",
+    reader_name      = Shake256Reader,
+    rust_shaker_name = TupleHashXofShaker256,
+    rust_sponge_name = TupleHashXofSponge256,
+    example_hash     = "'cf9ae6e91e8d056c1b1d253192a4ffaa'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = ParallelHashXof128,
+    pyclass_name     = "ParallelHashXof128",
+    reader_name      = Shake128Reader,
+    rust_shaker_name = ParallelHashXofShaker128,
+    rust_sponge_name = ParallelHashXofSponge128,
+    example_hash     = "'23365a932b8f5768f4fc59043b527e44'",
+);
+#[rustfmt::skip]
+impl_sponge_shaker_classes!(
+    hasher_name      = ParallelHashXof256,
+    pyclass_name     = "ParallelHashXof256",
+    reader_name      = Shake256Reader,
+    rust_shaker_name = ParallelHashXofShaker256,
+    rust_sponge_name = ParallelHashXofSponge256,
+    example_hash     = "'392634350886a6ca27bad0dc4d44bca7'",
+);
+
+// The SP 800-185 functions with a fixed output length have no sponge, as their
+// output is a single tag which depends on the requested length
+macro_rules! impl_fixed_output_classes {
+    (
+        hasher_name = $hasher:ident,
+        pyclass_name = $class_name:literal,
+        rust_name = $rust_name:ident,
+        example_tag = $example_tag:literal $(,)?
+    ) => {
+        #[pyclass(module="xoflib", name=$class_name, frozen)]
+        #[doc=concat!(stringify!($rust_name), " implements absorption and finalization for ", stringify!($hasher))]
+        struct $rust_name {
+            hasher: Locked<$hasher>,
+        }
+
+        impl Instrumented for $rust_name {
+            fn stats() -> &'static AlgorithmStats {
+                static STATS: AlgorithmStats = AlgorithmStats::new($class_name);
+                &STATS
+            }
+        }
+
+        impl_fixed_output_classes!(@methods $hasher, $class_name, $rust_name, $example_tag);
     };
 
-    (@docs_construct_hasher TurboShake256, $class_name:literal) => {
-        concat!($class_name, "(1, b\"bytes to absorb\")")
+    // "match" on KMAC and generate an __init__ which takes a key
+    (@methods Kmac128, $class_name:literal, $rust_name:ident, $example_tag:literal) => {
+        impl_fixed_output_classes!(@kmac_methods Kmac128, $class_name, $rust_name, $example_tag);
     };
 
-    (@docs_construct_hasher $hasher:ident, $class_name:literal) => {
-        concat!($class_name, "(b\"bytes to absorb\")")
+    (@methods Kmac256, $class_name:literal, $rust_name:ident, $example_tag:literal) => {
+        impl_fixed_output_classes!(@kmac_methods Kmac256, $class_name, $rust_name, $example_tag);
     };
 
-    // "match" on the TurboShakes and generate a unique __init__ for them with domain separation
-    (@shaker_methods TurboShake128, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
-        impl_sponge_shaker_classes!(@turbo_shaker_methods TurboShake128Core, $class_name, $shaker_name, $sponge_name);
+    (@kmac_methods $hasher:ident, $class_name:literal, $rust_name:ident, $example_tag:literal) => {
+        impl_fixed_output_classes!(@common_methods $hasher, $class_name, $rust_name, $example_tag, {
+            #[new]
+            #[pyo3(signature = (key, output_len, input_bytes = None, customization = None))]
+            fn new(
+                py: Python<'_>,
+                key: &Bound<'_, PyAny>,
+                output_len: usize,
+                input_bytes: Option<&Bound<'_, PyAny>>,
+                customization: Option<&Bound<'_, PyAny>>,
+            ) -> PyResult<Self> {
+                check_output_len(output_len)?;
+                let key = pybuffer_get_bytes(key)?;
+                let customization = customization.map(pybuffer_get_bytes).transpose()?;
+                let mut hasher = $hasher::new(
+                    key.as_slice(),
+                    customization.as_ref().map_or(&[][..], |c| c.as_slice()),
+                    output_len,
+                );
+                if let Some(initial_data) = input_bytes {
+                    let start = stats::start();
+                    let len = absorb_into(py, &mut hasher, initial_data)?;
+                    Self::stats().absorb.record(start, len);
+                }
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+        });
     };
 
-    (@shaker_methods TurboShake256, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
-        impl_sponge_shaker_classes!(@turbo_shaker_methods TurboShake256Core, $class_name, $shaker_name, $sponge_name);
+    // "match" on TupleHash and generate an __init__ which takes an iterable of buffers
+    (@methods TupleHash128, $class_name:literal, $rust_name:ident, $example_tag:literal) => {
+        impl_fixed_output_classes!(@tuple_hash_methods TupleHash128, $class_name, $rust_name, $example_tag);
     };
 
-    (@turbo_shaker_methods $hasher_core:ident, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
-        #[pymethods]
-        impl $shaker_name {
+    (@methods TupleHash256, $class_name:literal, $rust_name:ident, $example_tag:literal) => {
+        impl_fixed_output_classes!(@tuple_hash_methods TupleHash256, $class_name, $rust_name, $example_tag);
+    };
+
+    (@tuple_hash_methods $hasher:ident, $class_name:literal, $rust_name:ident, $example_tag:literal) => {
+        impl_fixed_output_classes!(@common_methods $hasher, $class_name, $rust_name, $example_tag, {
             #[new]
-            #[pyo3(signature = (domain_sep, input_bytes = None))]
-            fn new(domain_sep: u8, input_bytes: Option<&Bound<'_, PyAny>>) -> PyResult<Self> {
-                if !(0x01..=0x7F).contains(&domain_sep) {
-                    return Err(PyValueError::new_err("domain sep is not in range(1, 0x80)"))
+            #[pyo3(signature = (output_len, input_tuple = None, customization = None))]
+            fn new(
+                py: Python<'_>,
+                output_len: usize,
+                input_tuple: Option<&Bound<'_, PyAny>>,
+                customization: Option<&Bound<'_, PyAny>>,
+            ) -> PyResult<Self> {
+                check_output_len(output_len)?;
+                let customization = customization.map(pybuffer_get_bytes).transpose()?;
+                let mut hasher = $hasher::new(
+                    customization.as_ref().map_or(&[][..], |c| c.as_slice()),
+                    output_len,
+                );
+                if let Some(elements) = input_tuple {
+                    let start = stats::start();
+                    let len = absorb_many_into(py, &mut hasher, elements)?;
+                    Self::stats().absorb.record(start, len);
                 }
+                Ok(Self { hasher: Locked::new(hasher) })
+            }
+        });
+    };
+
+    // "match" on ParallelHash and generate an __init__ which takes the block size
+    (@methods ParallelHash128, $class_name:literal, $rust_name:ident, $example_tag:literal) => {
+        impl_fixed_output_classes!(@parallel_hash_methods ParallelHash128, $class_name, $rust_name, $example_tag);
+    };
+
+    (@methods ParallelHash256, $class_name:literal, $rust_name:ident, $example_tag:literal) => {
+        impl_fixed_output_classes!(@parallel_hash_methods ParallelHash256, $class_name, $rust_name, $example_tag);
+    };
 
-                let mut hasher = CoreWrapper::from_core($hasher_core::new(domain_sep));
+    (@parallel_hash_methods $hasher:ident, $class_name:literal, $rust_name:ident, $example_tag:literal) => {
+        impl_fixed_output_classes!(@common_methods $hasher, $class_name, $rust_name, $example_tag, {
+            #[new]
+            #[pyo3(signature = (block_size, output_len, input_bytes = None, customization = None))]
+            fn new(
+                py: Python<'_>,
+                block_size: usize,
+                output_len: usize,
+                input_bytes: Option<&Bound<'_, PyAny>>,
+                customization: Option<&Bound<'_, PyAny>>,
+            ) -> PyResult<Self> {
+                check_block_size(block_size)?;
+                check_output_len(output_len)?;
+                let customization = customization.map(pybuffer_get_bytes).transpose()?;
+                let mut hasher = $hasher::new(
+                    block_size,
+                    customization.as_ref().map_or(&[][..], |c| c.as_slice()),
+                    output_len,
+                );
                 if let Some(initial_data) = input_bytes {
-                    hasher.update(pybuffer_get_bytes(initial_data)?);
+                    let start = stats::start();
+                    let len = absorb_into(py, &mut hasher, initial_data)?;
+                    Self::stats().absorb.record(start, len);
                 }
-
-                Ok(Self { hasher })
+                Ok(Self { hasher: Locked::new(hasher) })
             }
+        });
+    };
+
+    (@docs_construct Kmac128, $class_name:literal) => {
+        concat!($class_name, "(b\"secret key\", 16, b\"message to authenticate\")")
+    };
+
+    (@docs_construct Kmac256, $class_name:literal) => {
+        concat!($class_name, "(b\"secret key\", 16, b\"message to authenticate\")")
+    };
+
+    (@docs_construct TupleHash128, $class_name:literal) => {
+        concat!($class_name, "(16, [b\"first field\", b\"second field\"])")
+    };
+
+    (@docs_construct TupleHash256, $class_name:literal) => {
+        concat!($class_name, "(16, [b\"first field\", b\"second field\"])")
+    };
+
+    (@docs_construct ParallelHash128, $class_name:literal) => {
+        concat!($class_name, "(8192, 16, b\"message to hash\")")
+    };
+
+    (@docs_construct ParallelHash256, $class_name:literal) => {
+        concat!($class_name, "(8192, 16, b\"message to hash\")")
+    };
+
+    (@docs_absorb_file TupleHash128) => {
+        impl_sponge_shaker_classes!(@docs_absorb_file TupleHashXof128)
+    };
+
+    (@docs_absorb_file TupleHash256) => {
+        impl_sponge_shaker_classes!(@docs_absorb_file TupleHashXof256)
+    };
+
+    (@docs_absorb_file $hasher:ident) => {
+        ""
+    };
+
+    (@common_methods $hasher:ident, $class_name:literal, $rust_name:ident, $example_tag:literal, { $($methods:tt)* }) => {
+        #[pymethods]
+        impl $rust_name {
+            $($methods)*
 
             #[doc=concat!(
-                "Absorb `input_bytes` into the ", stringify!($hasher_core), " state\n",
+                "Absorb `input_bytes` into the ", stringify!($hasher), " state\n",
                 "\n",
                 "Note: this method can be chained, i.e. .absorb().absorb()\n",
+            )]
+            fn absorb<'py>(slf: PyRef<'py, Self>, input_bytes: &Bound<'py, PyAny>) -> PyResult<PyRef<'py, Self>> {
+                let start = stats::start();
+                let len = absorb_into(slf.py(), &slf.hasher, input_bytes)?;
+                Self::stats().absorb.record(start, len);
+                Ok(slf)
+            }
+
+            #[doc=concat!(
+                "Absorb every buffer in the iterable `input_bytes` into the ", stringify!($hasher), " state, in order\n",
+                "\n",
+                "Note: this method can be chained, i.e. .absorb_many().absorb()\n",
+            )]
+            fn absorb_many<'py>(slf: PyRef<'py, Self>, input_bytes: &Bound<'py, PyAny>) -> PyResult<PyRef<'py, Self>> {
+                let start = stats::start();
+                let len = absorb_many_into(slf.py(), &slf.hasher, input_bytes)?;
+                Self::stats().absorb.record(start, len);
+                Ok(slf)
+            }
+
+            #[doc=concat!(
+                "Absorb the contents of a file into the ", stringify!($hasher), " state\n",
+                "\n",
+                "`file` is either a path or an open file descriptor, which is read from its current offset\n",
+                "to the end of the file and is not closed. The file is read with the GIL released",
+                impl_fixed_output_classes!(@docs_absorb_file $hasher), ".\n",
+                "\n",
+                "Note: this method can be chained, i.e. .absorb_file().absorb()\n",
                 "\n",
                 "Example:\n",
                 "\n",
                 ".. code-block:: python\n",
                 "\n",
                 "   >>> from xoflib import ", $class_name, "\n",
-                "   >>> xof = ", $class_name, "(1, b\"Some initial data\")\n",
-                "   >>> xof.absorb(bytearray(b\"Ooh just a little bit more data\"))\n",
+                "   >>> xof = ", impl_fixed_output_classes!(@docs_construct $hasher, $class_name), "\n",
+                "   >>> xof.absorb_file(\"large_file.bin\")\n",
             )]
-            fn absorb<'py>(mut slf: PyRefMut<'py, Self>, input_bytes: &Bound<'py, PyAny>) -> PyResult<PyRefMut<'py, Self>> {
-                slf.hasher.update(pybuffer_get_bytes(input_bytes)?);
+            fn absorb_file<'py>(slf: PyRef<'py, Self>, file: PathOrFd) -> PyResult<PyRef<'py, Self>> {
+                let start = stats::start();
+                let len = absorb_file_into(slf.py(), &slf.hasher, file)?;
+                Self::stats().absorb.record(start, len as usize);
                 Ok(slf)
             }
 
             #[doc=concat!(
-                "Finalize the ", stringify!($hasher_core), " XOF into a sponge for expansion\n",
+                "Absorb `input_bytes` into the ", stringify!($hasher), " state on a background thread\n",
                 "\n",
-                "This method also resets the state, allowing more data to be absorbed.",
+                "Returns an awaitable for the hasher. Calls are applied in the order they are made, and\n",
+                "cancelling the awaitable does not stop the data being absorbed. Mutable buffers are\n",
+                "copied when this is called. Every call should be awaited before `finalize()`.\n",
                 "\n",
                 "Example:\n",
                 "\n",
                 ".. code-block:: python\n",
                 "\n",
                 "   >>> from xoflib import ", $class_name, "\n",
-                "   >>> xof = ", $class_name, "(1, b\"Some initial data\")\n",
-                "   >>> xof = xof.finalize()\n",
+                "   >>> xof = ", impl_fixed_output_classes!(@docs_construct $hasher, $class_name), "\n",
+                "   >>> async def absorb_stream(xof, stream):\n",
+                "   ...     async for chunk in stream:\n",
+                "   ...         await xof.absorb_async(chunk)\n",
+                "   ...     return xof.finalize()\n",
             )]
-            fn finalize(&mut self) -> $sponge_name {
-                $sponge_name {
-                    xof: self.hasher.finalize_xof_reset(),
-                }
-            }
-
-            fn __str__(&self) -> String {
-                String::from($class_name)
-            }
-        }
-    };
-
-    // I would love to be more specific with the template but annoyingly you cannot use a macro in
-    // a #[pymethods] block to define methods :(
-    (@shaker_methods $hasher:ident, $class_name:literal, $shaker_name:ident, $sponge_name:ident) => {
-        #[pymethods]
-        impl $shaker_name {
-            #[new]
-            #[pyo3(signature = (input_bytes = None))]
-            fn new(input_bytes: Option<&Bound<'_, PyAny>>) -> PyResult<Self> {
-                let mut hasher = $hasher::default();
-                if let Some(initial_data) = input_bytes {
-                    hasher.update(pybuffer_get_bytes(initial_data)?);
-                }
-                Ok(Self { hasher })
+            fn absorb_async<'py>(slf: &Bound<'py, Self>, input_bytes: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+                let py = slf.py();
+                let input_bytes = if input_bytes.is_exact_instance_of::<PyBytes>() {
+                    input_bytes.clone()
+                } else {
+                    PyBytes::new(py, pybuffer_get_bytes(input_bytes)?.as_slice()).into_any()
+                };
+                run_in_order(slf.as_any(), "absorb", PyTuple::new(py, [input_bytes])?)
             }
 
             #[doc=concat!(
-                "Absorb `input_bytes` into the ", stringify!($hasher), " state\n",
+                "Return the `output_len` byte ", stringify!($hasher), " output for the absorbed input\n",
                 "\n",
-                "Note: this method can be chained, i.e. .absorb().absorb()\n",
+                "This method also resets the state to the one after construction, allowing another\n",
+                "message to be absorbed without encoding the parameters again.\n",
                 "\n",
                 "Example:\n",
                 "\n",
                 ".. code-block:: python\n",
                 "\n",
                 "   >>> from xoflib import ", $class_name, "\n",
-                "   >>> xof = ", $class_name, "(b\"Some initial data\")\n",
-                "   >>> xof.absorb(bytearray(b\"Ooh just a little bit more data\"))\n",
+                "   >>> xof = ", impl_fixed_output_classes!(@docs_construct $hasher, $class_name), "\n",
+                "   >>> xof.finalize().hex()\n",
+                "   ", $example_tag, "\n",
             )]
-            fn absorb<'py>(mut slf: PyRefMut<'py, Self>, input_bytes: &Bound<'py, PyAny>) -> PyResult<PyRefMut<'py, Self>> {
-                slf.hasher.update(pybuffer_get_bytes(input_bytes)?);
-                Ok(slf)
+            fn finalize<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+                let start = stats::start();
+                let (output_len, mut xof) = self.hasher.with_state(py, 0, |hasher| {
+                    (hasher.output_len(), hasher.finalize_xof_reset())
+                });
+                let output = PyBytes::new_with(py, output_len, |bytes| {
+                    squeeze_into(py, &mut xof, bytes);
+                    Ok(())
+                })?;
+                Self::stats().finalize.record(start, output_len);
+                Ok(output)
+            }
+
+            /// The length in bytes of the output returned by `finalize()`
+            #[getter]
+            fn output_len(&self, py: Python<'_>) -> usize {
+                self.hasher.with_state(py, 0, |hasher| hasher.output_len())
             }
 
             #[doc=concat!(
-                "Finalize the ", stringify!($hasher), " XOF into a sponge for expansion\n",
+                "Return an independent copy of the ", stringify!($hasher), " state\n",
                 "\n",
-                "This method also resets the state, allowing more data to be absorbed.",
-                "\n",
-                "Example:\n",
+                "This allows a shared prefix to be absorbed once and then extended in several ways.\n",
+            )]
+            fn copy(&self, py: Python<'_>) -> Self {
+                Self {
+                    hasher: Locked::new(self.hasher.cloned(py)),
+                }
+            }
+
+            fn __copy__(&self, py: Python<'_>) -> Self {
+                self.copy(py)
+            }
+
+            fn __deepcopy__(&self, py: Python<'_>, _memo: &Bound<'_, PyAny>) -> Self {
+                self.copy(py)
+            }
+
+            #[doc=concat!(
+                "Return the complete state of the ", stringify!($hasher), " hasher as bytes\n",
                 "\n",
-                ".. code-block:: python\n",
+                "The state is restored by `", $class_name, ".from_bytes()` and is also used for pickling.\n",
+                "For KMAC it includes the absorbed key, so it must be kept as secret as the key itself.\n",
+            )]
+            fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+                state_to_bytes(py, $class_name, &self.hasher.cloned(py))
+            }
+
+            #[doc=concat!(
+                "Restore a ", stringify!($hasher), " hasher from the output of `", $class_name, ".to_bytes()`\n",
                 "\n",
-                "   >>> from xoflib import ", $class_name, "\n",
-                "   >>> xof = ", $class_name, "(b\"Some initial data\")\n",
-                "   >>> xof = xof.finalize()\n",
+                "Raises `ValueError` when `data` is not the state of a ", $class_name, ".\n",
             )]
-            fn finalize(&mut self) -> $sponge_name {
-                $sponge_name {
-                    xof: self.hasher.finalize_xof_reset(),
-                }
+            #[classmethod]
+            fn from_bytes(_cls: &Bound<'_, PyType>, data: &Bound<'_, PyAny>) -> PyResult<Self> {
+                Ok(Self {
+                    hasher: Locked::new(state_from_bytes($class_name, data)?),
+                })
+            }
+
+            fn __reduce__<'py>(
+                slf: &Bound<'py, Self>,
+            ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, PyBytes>,))> {
+                let state = slf.borrow().to_bytes(slf.py())?;
+                Ok((slf.get_type().getattr("from_bytes")?, (state,)))
             }
 
             fn __str__(&self) -> String {
@@ -252,69 +2749,46 @@ macro_rules! impl_sponge_shaker_classes {
 }
 
 #[rustfmt::skip]
-impl_sponge_shaker_classes!(
-    hasher_name      = Shake128,
-    pyclass_name     = "Shake128",
-    reader_name      = Shake128Reader,
-    rust_shaker_name = Shaker128,
-    rust_sponge_name = Sponge128,
-    example_hash     = "'2c67a3c30e75de37d30e3f6d94e05a00'",
-);
-#[rustfmt::skip]
-impl_sponge_shaker_classes!(
-    hasher_name      = Shake256,
-    pyclass_name     = "Shake256",
-    reader_name      = Shake256Reader,
-    rust_shaker_name = Shaker256,
-    rust_sponge_name = Sponge256,
-    example_hash = "'82786e027034dccb6f41224c22a227c9'",
+impl_fixed_output_classes!(
+    hasher_name  = Kmac128,
+    pyclass_name = "Kmac128",
+    rust_name    = KmacShaker128,
+    example_tag  = "'8cae18debc8120bd1f6a08aa3dac2190'",
 );
 #[rustfmt::skip]
-impl_sponge_shaker_classes!(
-    hasher_name      = TurboShake128,
-    pyclass_name     = "TurboShake128",
-    reader_name      = TurboShake128Reader,
-    rust_shaker_name = TurboShaker128,
-    rust_sponge_name = TurboSponge128,
-    example_hash = "'b6be317e80aa741b9f0ac9330d584506'",
+impl_fixed_output_classes!(
+    hasher_name  = Kmac256,
+    pyclass_name = "Kmac256",
+    rust_name    = KmacShaker256,
+    example_tag  = "'66bca638b8412d1772672493041b0218'",
 );
 #[rustfmt::skip]
-impl_sponge_shaker_classes!(
-    hasher_name      = TurboShake256,
-    pyclass_name     = "TurboShake256",
-    reader_name      = TurboShake256Reader,
-    rust_shaker_name = TurboShaker256,
-    rust_sponge_name = TurboSponge256,
-    example_hash = "'2e9d18d326438ea968b071ab958f6260'",
+impl_fixed_output_classes!(
+    hasher_name  = TupleHash128,
+    pyclass_name = "TupleHash128",
+    rust_name    = TupleHasher128,
+    example_tag  = "'5c10d00ead10b888c46b0f67c0c059fd'",
 );
-
 #[rustfmt::skip]
-impl_sponge_shaker_classes!(
-    hasher_name      = AsconXof,
-    pyclass_name     = "AsconXof",
-    reader_name      = AsconXofReader,
-    rust_shaker_name = Ascon,
-    rust_sponge_name = AsconSponge,
-    example_hash = "'202e12280fb6781470016dc067d3b213'",
+impl_fixed_output_classes!(
+    hasher_name  = TupleHash256,
+    pyclass_name = "TupleHash256",
+    rust_name    = TupleHasher256,
+    example_tag  = "'4e7261ab206771407cc07a5c633fb4d1'",
 );
 #[rustfmt::skip]
-impl_sponge_shaker_classes!(
-    hasher_name      = AsconAXof,
-    pyclass_name     = "AsconAXof",
-    reader_name      = AsconAXofReader,
-    rust_shaker_name = AsconA,
-    rust_sponge_name = AsconASponge,
-    example_hash = "'e3d5593d0e08c5a7c6cbf751fb817f0a'",
+impl_fixed_output_classes!(
+    hasher_name  = ParallelHash128,
+    pyclass_name = "ParallelHash128",
+    rust_name    = ParallelHasher128,
+    example_tag  = "'2d12968475a3ac3fda372772f6c8a634'",
 );
-
 #[rustfmt::skip]
-impl_sponge_shaker_classes!(
-    hasher_name      = Blake3,
-    pyclass_name     = "Blake3",
-    reader_name      = Blake3Reader,
-    rust_shaker_name = Blake3Xof,
-    rust_sponge_name = Blake3Sponge,
-    example_hash = "'79c528b01f9519031bb3ebfbb4d99ecb'",
+impl_fixed_output_classes!(
+    hasher_name  = ParallelHash256,
+    pyclass_name = "ParallelHash256",
+    rust_name    = ParallelHasher256,
+    example_tag  = "'7cce1681e979ba0662ed39e40f8cb0a7'",
 );
 
 /// Construct a TurboSponge128 directly from `domain_sep` and `data`
@@ -328,8 +2802,12 @@ impl_sponge_shaker_classes!(
 ///    >>> xof.read(16).hex()
 ///    '4bb4e35b21335fcc6ae6cd3d0a5fe005'
 #[pyfunction]
-fn turbo_shake128(domain_sep: u8, data: &Bound<'_, PyAny>) -> PyResult<TurboSponge128> {
-    Ok(TurboShaker128::new(domain_sep, Some(data))?.finalize())
+fn turbo_shake128(
+    py: Python<'_>,
+    domain_sep: u8,
+    data: &Bound<'_, PyAny>,
+) -> PyResult<TurboSponge128> {
+    Ok(TurboShaker128::new(py, domain_sep, Some(data))?.into())
 }
 
 /// Construct a TurboSponge256 directly from `domain_sep` and `data`
@@ -343,8 +2821,129 @@ fn turbo_shake128(domain_sep: u8, data: &Bound<'_, PyAny>) -> PyResult<TurboSpon
 ///    >>> xof.read(16).hex()
 ///    'd671d0021e9f22293d062259e68e6e89'
 #[pyfunction]
-fn turbo_shake256(domain_sep: u8, data: &Bound<'_, PyAny>) -> PyResult<TurboSponge256> {
-    Ok(TurboShaker256::new(domain_sep, Some(data))?.finalize())
+fn turbo_shake256(
+    py: Python<'_>,
+    domain_sep: u8,
+    data: &Bound<'_, PyAny>,
+) -> PyResult<TurboSponge256> {
+    Ok(TurboShaker256::new(py, domain_sep, Some(data))?.into())
+}
+
+/// Construct a KTSponge128 directly from `data` and an optional `customization` string
+///
+/// Example:
+///
+/// .. code-block:: python
+///
+///    >>> from xoflib import kt128
+///    >>> xof = kt128(b"bytes to absorb")
+///    >>> xof.read(16).hex()
+///    'bb0c616126de592945a76b4db3ede4d7'
+///    >>> xof = kt128(b"bytes to absorb", b"my app")
+///    >>> xof.read(16).hex()
+///    '6a535dba773a23a6ca7a0d90da13cc61'
+#[pyfunction]
+#[pyo3(signature = (data, customization = None))]
+fn kt128(
+    py: Python<'_>,
+    data: &Bound<'_, PyAny>,
+    customization: Option<&Bound<'_, PyAny>>,
+) -> PyResult<KTSponge128> {
+    Ok(KTShaker128::new(py, Some(data), customization)?.into())
+}
+
+/// Construct a KTSponge256 directly from `data` and an optional `customization` string
+///
+/// Example:
+///
+/// .. code-block:: python
+///
+///    >>> from xoflib import kt256
+///    >>> xof = kt256(b"bytes to absorb")
+///    >>> xof.read(16).hex()
+///    '6322357fdd249949bbd2954a5cc81301'
+#[pyfunction]
+#[pyo3(signature = (data, customization = None))]
+fn kt256(
+    py: Python<'_>,
+    data: &Bound<'_, PyAny>,
+    customization: Option<&Bound<'_, PyAny>>,
+) -> PyResult<KTSponge256> {
+    Ok(KTShaker256::new(py, Some(data), customization)?.into())
+}
+
+/// Absorb `file` with the shaker class or instance `algorithm` and read
+/// `out_len` bytes, or return `None` when `algorithm` is not a `$shaker` class
+/// or instance
+macro_rules! hash_file_with {
+    ($py:ident, $algorithm:ident, $file:ident, $out_len:ident, [$($shaker:ident),+ $(,)?]) => {
+        $(
+            if let Ok(shaker) = $algorithm.downcast::<$shaker>() {
+                return shaker.get().hash_file($py, $file, $out_len);
+            }
+            if let Ok(cls) = $algorithm.downcast::<PyType>() {
+                if cls.is_subclass_of::<$shaker>()? {
+                    // Classes which take arguments, such as TurboShake128, raise TypeError here
+                    let shaker = cls.call0()?;
+                    return shaker.downcast::<$shaker>()?.get().hash_file($py, $file, $out_len);
+                }
+            }
+        )+
+    };
+}
+
+/// Hash the contents of a file, returning `out_len` bytes of output
+///
+/// `algorithm` is a shaker class which takes no arguments, such as `Shake256`,
+/// or a shaker, such as `TurboShake128(1)` or a `KT128` with some data already
+/// absorbed, which is left unchanged. `path` is a path or an open file
+/// descriptor, see `absorb_file()`. The file is absorbed and the output is read
+/// in Rust, with the GIL released while the file is read.
+///
+/// Raises `TypeError` when `algorithm` is not a shaker class or shaker.
+///
+/// Example:
+///
+/// .. code-block:: python
+///
+///    >>> from xoflib import hash_file, Shake256
+///    >>> digest = hash_file(Shake256, "large_file.bin", 64)
+#[pyfunction]
+fn hash_file<'py>(
+    py: Python<'py>,
+    algorithm: &Bound<'py, PyAny>,
+    path: PathOrFd,
+    out_len: usize,
+) -> PyResult<Bound<'py, PyBytes>> {
+    hash_file_with!(
+        py,
+        algorithm,
+        path,
+        out_len,
+        [
+            Shaker128,
+            Shaker256,
+            TurboShaker128,
+            TurboShaker256,
+            Ascon,
+            AsconA,
+            Blake3Xof,
+            KTShaker128,
+            KTShaker256,
+            CShaker128,
+            CShaker256,
+            KmacXofShaker128,
+            KmacXofShaker256,
+            TupleHashXofShaker128,
+            TupleHashXofShaker256,
+            ParallelHashXofShaker128,
+            ParallelHashXofShaker256,
+        ]
+    );
+    Err(PyTypeError::new_err(format!(
+        "algorithm must be a shaker class or shaker, not {}",
+        algorithm.get_type().name()?
+    )))
 }
 
 #[rustfmt::skip]
@@ -363,8 +2962,8 @@ macro_rules! impl_sponge_constructor {
             "   '", $example_hash, "'\n",
         )]
         #[pyfunction]
-        fn $func_name(data: &Bound<'_, PyAny>) -> PyResult<$sponge> {
-            Ok($xof::new(Some(data))?.finalize())
+        fn $func_name(py: Python<'_>, data: &Bound<'_, PyAny>) -> PyResult<$sponge> {
+            Ok($xof::new(py, Some(data))?.into())
         }
     };
 }
@@ -407,37 +3006,359 @@ impl_sponge_constructor!(
     example_hash  = "not yet",
 );
 
+#[rustfmt::skip]
+macro_rules! impl_batch_function {
+    (function_name = $func_name:ident, hasher = $hasher:ident, rust_shaker_name = $shaker_name:ident, example_hash = $example_hash:literal $(,)?) => {
+        #[doc=concat!(
+            "Hash each buffer in `inputs` independently with ", stringify!($hasher), " and read `n` bytes from each\n",
+            "\n",
+            "The outputs are returned concatenated in a single bytes object of length `len(inputs) * n`,\n",
+            "with the output for `inputs[i]` found at `[i * n : (i + 1) * n]`.\n",
+            "\n",
+            "Example:\n",
+            "\n",
+            ".. code-block:: python\n",
+            "\n",
+            "   >>> from xoflib import ", stringify!($func_name), "\n",
+            "   >>> ", stringify!($func_name), "([b\"seed 0\", b\"seed 1\"], 8).hex()\n",
+            "   '", $example_hash, "'\n",
+        )]
+        #[pyfunction]
+        fn $func_name<'py>(py: Python<'py>, inputs: &Bound<'py, PyAny>, n: usize) -> PyResult<Bound<'py, PyBytes>> {
+            xof_batch(py, inputs, n, $shaker_name::stats(), $hasher::default)
+        }
+    };
+}
+
+#[rustfmt::skip]
+impl_batch_function!(
+    function_name    = shake128_batch,
+    hasher           = Shake128,
+    rust_shaker_name = Shaker128,
+    example_hash  = "6d8e2c27fc253d9c7675388adacbb4dc",
+);
+#[rustfmt::skip]
+impl_batch_function!(
+    function_name    = shake256_batch,
+    hasher           = Shake256,
+    rust_shaker_name = Shaker256,
+    example_hash  = "03cac611859b059d3b59461eccca2178",
+);
+
+/// Hash each buffer in `inputs` independently with TurboShake128 and read `n` bytes from each
+///
+/// The outputs are returned concatenated in a single bytes object of length `len(inputs) * n`,
+/// with the output for `inputs[i]` found at `[i * n : (i + 1) * n]`.
+///
+/// Example:
+///
+/// .. code-block:: python
+///
+///    >>> from xoflib import turbo_shake128_batch
+///    >>> turbo_shake128_batch(1, [b"seed 0", b"seed 1"], 8).hex()
+///    '2511d8192c89d539fb219da639e0fb58'
+#[pyfunction]
+fn turbo_shake128_batch<'py>(
+    py: Python<'py>,
+    domain_sep: u8,
+    inputs: &Bound<'py, PyAny>,
+    n: usize,
+) -> PyResult<Bound<'py, PyBytes>> {
+    check_domain_sep(domain_sep)?;
+    xof_batch(py, inputs, n, TurboShaker128::stats(), || {
+        TurboShake128::new(domain_sep)
+    })
+}
+
+/// Hash each buffer in `inputs` independently with TurboShake256 and read `n` bytes from each
+///
+/// The outputs are returned concatenated in a single bytes object of length `len(inputs) * n`,
+/// with the output for `inputs[i]` found at `[i * n : (i + 1) * n]`.
+///
+/// Example:
+///
+/// .. code-block:: python
+///
+///    >>> from xoflib import turbo_shake256_batch
+///    >>> turbo_shake256_batch(1, [b"seed 0", b"seed 1"], 8).hex()
+///    '2c2cc88ef7ba7b175951f5a41b9b4f18'
+#[pyfunction]
+fn turbo_shake256_batch<'py>(
+    py: Python<'py>,
+    domain_sep: u8,
+    inputs: &Bound<'py, PyAny>,
+    n: usize,
+) -> PyResult<Bound<'py, PyBytes>> {
+    check_domain_sep(domain_sep)?;
+    xof_batch(py, inputs, n, TurboShaker256::stats(), || {
+        TurboShake256::new(domain_sep)
+    })
+}
+
+#[rustfmt::skip]
+macro_rules! impl_many_function {
+    (function_name = $func_name:ident, hasher = $hasher:ident, rust_shaker_name = $shaker_name:ident, single_function = $single:ident $(,)?) => {
+        #[doc=concat!(
+            "Hash each message in `messages` independently with ", stringify!($hasher), " and read `out_len` bytes from each\n",
+            "\n",
+            "The messages are hashed in parallel with the GIL released, using all available cores or a pool\n",
+            "of `threads` threads, and a list with the output for each message is returned.\n",
+            "\n",
+            "Example:\n",
+            "\n",
+            ".. code-block:: python\n",
+            "\n",
+            "   >>> from xoflib import ", stringify!($func_name), ", ", stringify!($single), "\n",
+            "   >>> outputs = ", stringify!($func_name), "([b\"record 0\", b\"record 1\"], 16, threads=2)\n",
+            "   >>> outputs[1] == ", stringify!($single), "(b\"record 1\").read(16)\n",
+            "   True\n",
+        )]
+        #[pyfunction]
+        #[pyo3(signature = (messages, out_len, threads = None))]
+        fn $func_name<'py>(
+            py: Python<'py>,
+            messages: &Bound<'py, PyAny>,
+            out_len: usize,
+            threads: Option<usize>,
+        ) -> PyResult<Vec<Bound<'py, PyBytes>>> {
+            xof_many(py, messages, out_len, threads, $shaker_name::stats(), $hasher::default)
+        }
+    };
+}
+
+#[rustfmt::skip]
+impl_many_function!(
+    function_name    = shake128_many,
+    hasher           = Shake128,
+    rust_shaker_name = Shaker128,
+    single_function  = shake128,
+);
+#[rustfmt::skip]
+impl_many_function!(
+    function_name    = shake256_many,
+    hasher           = Shake256,
+    rust_shaker_name = Shaker256,
+    single_function  = shake256,
+);
+#[rustfmt::skip]
+impl_many_function!(
+    function_name    = ascon_xof_many,
+    hasher           = AsconXof,
+    rust_shaker_name = Ascon,
+    single_function  = ascon_xof,
+);
+#[rustfmt::skip]
+impl_many_function!(
+    function_name    = ascona_xof_many,
+    hasher           = AsconAXof,
+    rust_shaker_name = AsconA,
+    single_function  = ascona_xof,
+);
+#[rustfmt::skip]
+impl_many_function!(
+    function_name    = blake3_xof_many,
+    hasher           = Blake3,
+    rust_shaker_name = Blake3Xof,
+    single_function  = blake3_xof,
+);
+
+#[rustfmt::skip]
+macro_rules! impl_turbo_shake_many_function {
+    (function_name = $func_name:ident, hasher = $hasher:ident, rust_shaker_name = $shaker_name:ident, single_function = $single:ident $(,)?) => {
+        #[doc=concat!(
+            "Hash each message in `messages` independently with ", stringify!($hasher), " and read `out_len` bytes from each\n",
+            "\n",
+            "The messages are hashed in parallel with the GIL released, using all available cores or a pool\n",
+            "of `threads` threads, and a list with the output for each message is returned.\n",
+            "\n",
+            "Example:\n",
+            "\n",
+            ".. code-block:: python\n",
+            "\n",
+            "   >>> from xoflib import ", stringify!($func_name), ", ", stringify!($single), "\n",
+            "   >>> outputs = ", stringify!($func_name), "(1, [b\"record 0\", b\"record 1\"], 16, threads=2)\n",
+            "   >>> outputs[1] == ", stringify!($single), "(1, b\"record 1\").read(16)\n",
+            "   True\n",
+        )]
+        #[pyfunction]
+        #[pyo3(signature = (domain_sep, messages, out_len, threads = None))]
+        fn $func_name<'py>(
+            py: Python<'py>,
+            domain_sep: u8,
+            messages: &Bound<'py, PyAny>,
+            out_len: usize,
+            threads: Option<usize>,
+        ) -> PyResult<Vec<Bound<'py, PyBytes>>> {
+            check_domain_sep(domain_sep)?;
+            xof_many(py, messages, out_len, threads, $shaker_name::stats(), || $hasher::new(domain_sep))
+        }
+    };
+}
+
+#[rustfmt::skip]
+impl_turbo_shake_many_function!(
+    function_name    = turbo_shake128_many,
+    hasher           = TurboShake128,
+    rust_shaker_name = TurboShaker128,
+    single_function  = turbo_shake128,
+);
+#[rustfmt::skip]
+impl_turbo_shake_many_function!(
+    function_name    = turbo_shake256_many,
+    hasher           = TurboShake256,
+    rust_shaker_name = TurboShaker256,
+    single_function  = turbo_shake256,
+);
+
+#[rustfmt::skip]
+macro_rules! impl_kangaroo_twelve_many_function {
+    (function_name = $func_name:ident, hasher = $hasher:ident, rust_shaker_name = $shaker_name:ident, single_function = $single:ident $(,)?) => {
+        #[doc=concat!(
+            "Hash each message in `messages` independently with ", stringify!($hasher), " and read `out_len` bytes from each\n",
+            "\n",
+            "Every message uses the same optional `customization` string. The messages are hashed in parallel\n",
+            "with the GIL released, using all available cores or a pool of `threads` threads, and a list with\n",
+            "the output for each message is returned.\n",
+            "\n",
+            "Example:\n",
+            "\n",
+            ".. code-block:: python\n",
+            "\n",
+            "   >>> from xoflib import ", stringify!($func_name), ", ", stringify!($single), "\n",
+            "   >>> outputs = ", stringify!($func_name), "([b\"record 0\", b\"record 1\"], 16, threads=2)\n",
+            "   >>> outputs[1] == ", stringify!($single), "(b\"record 1\").read(16)\n",
+            "   True\n",
+        )]
+        #[pyfunction]
+        #[pyo3(signature = (messages, out_len, customization = None, threads = None))]
+        fn $func_name<'py>(
+            py: Python<'py>,
+            messages: &Bound<'py, PyAny>,
+            out_len: usize,
+            customization: Option<&Bound<'py, PyAny>>,
+            threads: Option<usize>,
+        ) -> PyResult<Vec<Bound<'py, PyBytes>>> {
+            let customization = match customization {
+                Some(customization) => pybuffer_get_bytes(customization)?.as_slice().to_vec(),
+                None => Vec::new(),
+            };
+            xof_many(py, messages, out_len, threads, $shaker_name::stats(), || $hasher::new(&customization))
+        }
+    };
+}
+
+#[rustfmt::skip]
+impl_kangaroo_twelve_many_function!(
+    function_name    = kt128_many,
+    hasher           = KT128,
+    rust_shaker_name = KTShaker128,
+    single_function  = kt128,
+);
+#[rustfmt::skip]
+impl_kangaroo_twelve_many_function!(
+    function_name    = kt256_many,
+    hasher           = KT256,
+    rust_shaker_name = KTShaker256,
+    single_function  = kt256,
+);
+
 /// A Python package for the Shake extendable-output functions (XOFs): Shake128,
-/// Shake256 and the turbo variants built with pyO3 bindings to the sha3 Rust
-/// crate.
-#[pymodule]
+/// Shake256 and the turbo variants built with pyO3 on the Keccak permutation of
+/// the keccak Rust crate.
+//
+// The module does not need the GIL. Independent objects can be used from any
+// number of threads at once. Every shaker, sponge and hasher keeps its state in
+// a `Locked`, so calls made on one object from several threads run one after
+// another, and `PrefixCache`, `XofRandom` and `XofBitGenerator` lock their own
+// state too.
+//
+// Classes with counters are added with `stats::add_class`, which also reports
+// their counters in `stats()`.
+#[pymodule(gil_used = false)]
 fn xoflib(m: &Bound<'_, PyModule>) -> PyResult<()> {
-    m.add_class::<Sponge128>()?;
-    m.add_class::<Shaker128>()?;
-    m.add_class::<Sponge256>()?;
-    m.add_class::<Shaker256>()?;
-    m.add_class::<TurboSponge128>()?;
-    m.add_class::<TurboShaker128>()?;
-    m.add_class::<TurboSponge256>()?;
-    m.add_class::<TurboShaker256>()?;
+    stats::add_class::<Sponge128>(m)?;
+    stats::add_class::<Shaker128>(m)?;
+    stats::add_class::<Sponge256>(m)?;
+    stats::add_class::<Shaker256>(m)?;
+    stats::add_class::<TurboSponge128>(m)?;
+    stats::add_class::<TurboShaker128>(m)?;
+    stats::add_class::<TurboSponge256>(m)?;
+    stats::add_class::<TurboShaker256>(m)?;
 
     m.add_function(wrap_pyfunction!(shake128, m)?)?;
     m.add_function(wrap_pyfunction!(shake256, m)?)?;
     m.add_function(wrap_pyfunction!(turbo_shake128, m)?)?;
     m.add_function(wrap_pyfunction!(turbo_shake256, m)?)?;
+    m.add_function(wrap_pyfunction!(shake128_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(shake256_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(turbo_shake128_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(turbo_shake256_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(shake128_many, m)?)?;
+    m.add_function(wrap_pyfunction!(shake256_many, m)?)?;
+    m.add_function(wrap_pyfunction!(turbo_shake128_many, m)?)?;
+    m.add_function(wrap_pyfunction!(turbo_shake256_many, m)?)?;
+
+    stats::add_class::<KTShaker128>(m)?;
+    stats::add_class::<KTSponge128>(m)?;
+    stats::add_class::<KTShaker256>(m)?;
+    stats::add_class::<KTSponge256>(m)?;
+    m.add("KangarooTwelve", m.getattr("KT128")?)?;
+
+    m.add_function(wrap_pyfunction!(kt128, m)?)?;
+    m.add_function(wrap_pyfunction!(kt256, m)?)?;
+    m.add_function(wrap_pyfunction!(kt128_many, m)?)?;
+    m.add_function(wrap_pyfunction!(kt256_many, m)?)?;
 
-    m.add_class::<Ascon>()?;
-    m.add_class::<AsconSponge>()?;
-    m.add_class::<AsconA>()?;
-    m.add_class::<AsconASponge>()?;
+    stats::add_class::<CShaker128>(m)?;
+    stats::add_class::<CShakeSponge128>(m)?;
+    stats::add_class::<CShaker256>(m)?;
+    stats::add_class::<CShakeSponge256>(m)?;
+    stats::add_class::<KmacShaker128>(m)?;
+    stats::add_class::<KmacShaker256>(m)?;
+    stats::add_class::<KmacXofShaker128>(m)?;
+    stats::add_class::<KmacXofSponge128>(m)?;
+    stats::add_class::<KmacXofShaker256>(m)?;
+    stats::add_class::<KmacXofSponge256>(m)?;
+    stats::add_class::<TupleHasher128>(m)?;
+    stats::add_class::<TupleHasher256>(m)?;
+    stats::add_class::<TupleHashXofShaker128>(m)?;
+    stats::add_class::<TupleHashXofSponge128>(m)?;
+    stats::add_class::<TupleHashXofShaker256>(m)?;
+    stats::add_class::<TupleHashXofSponge256>(m)?;
+    stats::add_class::<ParallelHasher128>(m)?;
+    stats::add_class::<ParallelHasher256>(m)?;
+    stats::add_class::<ParallelHashXofShaker128>(m)?;
+    stats::add_class::<ParallelHashXofSponge128>(m)?;
+    stats::add_class::<ParallelHashXofShaker256>(m)?;
+    stats::add_class::<ParallelHashXofSponge256>(m)?;
+
+    stats::add_class::<Ascon>(m)?;
+    stats::add_class::<AsconSponge>(m)?;
+    stats::add_class::<AsconA>(m)?;
+    stats::add_class::<AsconASponge>(m)?;
 
     m.add_function(wrap_pyfunction!(ascon_xof, m)?)?;
     m.add_function(wrap_pyfunction!(ascona_xof, m)?)?;
+    m.add_function(wrap_pyfunction!(ascon_xof_many, m)?)?;
+    m.add_function(wrap_pyfunction!(ascona_xof_many, m)?)?;
 
-    m.add_class::<Blake3Xof>()?;
-    m.add_class::<Blake3Sponge>()?;
+    stats::add_class::<Blake3Xof>(m)?;
+    stats::add_class::<Blake3Sponge>(m)?;
+    m.add_class::<Blake3KeyContext>()?;
 
     m.add_function(wrap_pyfunction!(blake3_xof, m)?)?;
+    m.add_function(wrap_pyfunction!(blake3_xof_many, m)?)?;
+
+    m.add_function(wrap_pyfunction!(hash_file, m)?)?;
+
+    m.add_class::<PrefixCache>()?;
+    m.add_class::<XofBitGenerator>()?;
+    add_xof_random(m)?;
+
+    m.add_function(wrap_pyfunction!(stats::enable_stats, m)?)?;
+    m.add_function(wrap_pyfunction!(stats::stats, m)?)?;
+    m.add_function(wrap_pyfunction!(stats::reset_stats, m)?)?;
+    stats::enable_from_env();
 
     Ok(())
 }
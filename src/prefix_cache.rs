@@ -0,0 +1,169 @@
+use std::collections::{BTreeMap, HashMap};
+use std::sync::Mutex;
+
+use pyo3::prelude::*;
+
+use crate::pybuffer_get_bytes;
+
+/// Cached shakers ordered by when they were last used
+#[derive(Default)]
+struct LruState {
+    // key -> (shaker, tick of last use)
+    entries: HashMap<Vec<u8>, (Py<PyAny>, u64)>,
+    // tick of last use -> key, the first entry is the least recently used
+    order: BTreeMap<u64, Vec<u8>>,
+    tick: u64,
+    hits: u64,
+    misses: u64,
+}
+
+impl LruState {
+    fn get(&mut self, py: Python<'_>, key: &[u8]) -> Option<Py<PyAny>> {
+        self.tick += 1;
+        match self.entries.get_mut(key) {
+            Some((shaker, last_used)) => {
+                self.order.remove(&*last_used);
+                self.order.insert(self.tick, key.to_vec());
+                *last_used = self.tick;
+                self.hits += 1;
+                Some(shaker.clone_ref(py))
+            }
+            None => {
+                self.misses += 1;
+                None
+            }
+        }
+    }
+
+    /// Insert `shaker`, returning any entries which were evicted so they can be
+    /// dropped after the lock is released
+    fn insert(&mut self, key: Vec<u8>, shaker: Py<PyAny>, maxsize: usize) -> Vec<Py<PyAny>> {
+        if maxsize == 0 {
+            return vec![shaker];
+        }
+
+        let mut evicted = Vec::new();
+        self.tick += 1;
+        if let Some((old, last_used)) = self.entries.insert(key.clone(), (shaker, self.tick)) {
+            self.order.remove(&last_used);
+            evicted.push(old);
+        }
+        self.order.insert(self.tick, key);
+
+        while self.entries.len() > maxsize {
+            let Some((_, oldest)) = self.order.pop_first() else {
+                break;
+            };
+            if let Some((old, _)) = self.entries.remove(&oldest) {
+                evicted.push(old);
+            }
+        }
+        evicted
+    }
+}
+
+/// A thread-safe cache of shakers which have already absorbed a prefix
+///
+/// `algorithm` is called with no arguments to create a new shaker, for example
+/// `Shake256` or `lambda: TurboShake128(1)`. When the cache holds more than
+/// `maxsize` prefixes, the least recently used one is evicted.
+///
+/// Example:
+///
+/// .. code-block:: python
+///
+///    >>> from xoflib import PrefixCache, Shake256
+///    >>> cache = PrefixCache(Shake256, maxsize=1024)
+///    >>> xof1 = cache.get(b"shared prefix").absorb(b"message").finalize()
+///    >>> xof2 = cache.get(b"shared prefix").absorb(b"message").finalize()
+///    >>> xof1.read(16) == xof2.read(16)
+///    True
+///    >>> cache.hits, cache.misses
+///    (1, 1)
+#[pyclass(module = "xoflib")]
+pub struct PrefixCache {
+    algorithm: Py<PyAny>,
+    maxsize: usize,
+    // The lock is never held while calling into Python: absorbing may release
+    // the GIL, and another thread waiting on the lock with the GIL held would
+    // then deadlock.
+    state: Mutex<LruState>,
+}
+
+#[pymethods]
+impl PrefixCache {
+    #[new]
+    #[pyo3(signature = (algorithm, maxsize = 128))]
+    fn new(algorithm: Py<PyAny>, maxsize: usize) -> Self {
+        Self {
+            algorithm,
+            maxsize,
+            state: Mutex::new(LruState::default()),
+        }
+    }
+
+    /// Return a new shaker which has absorbed `prefix`
+    ///
+    /// Entries are looked up by `key`, which defaults to `prefix` itself. On a
+    /// miss the prefix is absorbed and the resulting state is cached, and every
+    /// call returns an independent copy of the cached state.
+    #[pyo3(signature = (prefix, key = None))]
+    fn get<'py>(
+        &self,
+        py: Python<'py>,
+        prefix: &Bound<'py, PyAny>,
+        key: Option<&Bound<'py, PyAny>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let key = pybuffer_get_bytes(key.unwrap_or(prefix))?
+            .as_slice()
+            .to_vec();
+
+        let cached = self.state.lock().unwrap().get(py, &key);
+        let shaker = match cached {
+            Some(shaker) => shaker.into_bound(py),
+            None => {
+                let shaker = self.algorithm.bind(py).call0()?;
+                shaker.call_method1("absorb", (prefix,))?;
+                let evicted =
+                    self.state
+                        .lock()
+                        .unwrap()
+                        .insert(key, shaker.clone().unbind(), self.maxsize);
+                drop(evicted);
+                shaker
+            }
+        };
+        shaker.call_method0("copy")
+    }
+
+    /// Remove every entry from the cache and reset the hit and miss counts
+    fn clear(&self) {
+        let state = std::mem::take(&mut *self.state.lock().unwrap());
+        drop(state);
+    }
+
+    /// The number of calls to `get()` which found a cached prefix
+    #[getter]
+    fn hits(&self) -> u64 {
+        self.state.lock().unwrap().hits
+    }
+
+    /// The number of calls to `get()` which had to absorb the prefix
+    #[getter]
+    fn misses(&self) -> u64 {
+        self.state.lock().unwrap().misses
+    }
+
+    #[getter]
+    fn maxsize(&self) -> usize {
+        self.maxsize
+    }
+
+    fn __len__(&self) -> usize {
+        self.state.lock().unwrap().entries.len()
+    }
+
+    fn __str__(&self) -> String {
+        String::from("PrefixCache")
+    }
+}
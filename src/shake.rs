@@ -0,0 +1,328 @@
+//! Shake128, Shake256, TurboShake128 and TurboShake256 from FIPS 202 and
+//! RFC 9861, built on the Keccak permutation of the keccak crate.
+//!
+//! These implement the same `digest` traits as the sponges of the sha3 crate,
+//! but the complete state of the hashers and readers, including the position
+//! in the current block, can be exported and restored. This is what allows a
+//! shaker or sponge to be pickled part way through a stream.
+
+use digest::{ExtendableOutput, ExtendableOutputReset, Reset, Update, XofReader};
+
+use crate::SerializeState;
+
+/// Number of 64-bit lanes in the Keccak state
+const LANES: usize = 25;
+
+/// Domain separation byte of Shake128 and Shake256
+const SHAKE_DOMAIN: u8 = 0x1F;
+
+/// The Keccak state with `RATE` bytes per block, permuted with the last
+/// `ROUNDS` rounds of Keccak-f[1600]
+#[derive(Clone)]
+struct Sponge<const RATE: usize, const ROUNDS: usize> {
+    lanes: [u64; LANES],
+    // bytes of the current block already absorbed or squeezed
+    pos: usize,
+}
+
+impl<const RATE: usize, const ROUNDS: usize> Sponge<RATE, ROUNDS> {
+    const fn new() -> Self {
+        Self {
+            lanes: [0; LANES],
+            pos: 0,
+        }
+    }
+
+    fn permute(&mut self) {
+        keccak::p1600(&mut self.lanes, ROUNDS);
+    }
+
+    fn xor_byte(&mut self, i: usize, byte: u8) {
+        self.lanes[i / 8] ^= u64::from(byte) << (8 * (i % 8));
+    }
+
+    fn byte(&self, i: usize) -> u8 {
+        (self.lanes[i / 8] >> (8 * (i % 8))) as u8
+    }
+
+    /// XOR `data` into the block starting at byte `start`, a lane at a time
+    ///
+    /// Bytes which only cover part of a lane, at either end of `data`, are
+    /// padded with zeros into a whole lane first.
+    fn xor_bytes(&mut self, start: usize, mut data: &[u8]) {
+        // A few bytes are cheaper to shift in one at a time
+        if data.len() < 8 {
+            for (i, &byte) in data.iter().enumerate() {
+                self.xor_byte(start + i, byte);
+            }
+            return;
+        }
+
+        let mut i = start / 8;
+        let offset = start % 8;
+        if offset != 0 {
+            let take = (8 - offset).min(data.len());
+            let mut bytes = [0u8; 8];
+            bytes[offset..offset + take].copy_from_slice(&data[..take]);
+            self.lanes[i] ^= u64::from_le_bytes(bytes);
+            i += 1;
+            data = &data[take..];
+        }
+
+        let chunks = data.chunks_exact(8);
+        let rest = chunks.remainder();
+        for (lane, bytes) in self.lanes[i..].iter_mut().zip(chunks) {
+            *lane ^= u64::from_le_bytes(bytes.try_into().unwrap());
+        }
+        if !rest.is_empty() {
+            let mut bytes = [0u8; 8];
+            bytes[..rest.len()].copy_from_slice(rest);
+            self.lanes[i + data.len() / 8] ^= u64::from_le_bytes(bytes);
+        }
+    }
+
+    /// Copy the block starting at byte `start` into `out`, a lane at a time
+    fn copy_bytes(&self, start: usize, mut out: &mut [u8]) {
+        if out.len() < 8 {
+            for (i, byte) in out.iter_mut().enumerate() {
+                *byte = self.byte(start + i);
+            }
+            return;
+        }
+
+        let mut i = start / 8;
+        let offset = start % 8;
+        if offset != 0 {
+            let take = (8 - offset).min(out.len());
+            let bytes = self.lanes[i].to_le_bytes();
+            let (head, tail) = out.split_at_mut(take);
+            head.copy_from_slice(&bytes[offset..offset + take]);
+            i += 1;
+            out = tail;
+        }
+
+        let whole = out.len() / 8;
+        let mut chunks = out.chunks_exact_mut(8);
+        for (bytes, lane) in (&mut chunks).zip(&self.lanes[i..]) {
+            bytes.copy_from_slice(&lane.to_le_bytes());
+        }
+        let rest = chunks.into_remainder();
+        if !rest.is_empty() {
+            let bytes = self.lanes[i + whole].to_le_bytes();
+            rest.copy_from_slice(&bytes[..rest.len()]);
+        }
+    }
+
+    fn absorb(&mut self, mut data: &[u8]) {
+        while !data.is_empty() {
+            let take = (RATE - self.pos).min(data.len());
+            let (block, rest) = data.split_at(take);
+            self.xor_bytes(self.pos, block);
+            self.pos += take;
+            data = rest;
+
+            if self.pos == RATE {
+                self.permute();
+                self.pos = 0;
+            }
+        }
+    }
+
+    /// Pad the absorbed input with the domain separation byte `domain` and
+    /// switch to squeezing
+    fn pad(&mut self, domain: u8) {
+        self.xor_byte(self.pos, domain);
+        self.xor_byte(RATE - 1, 0x80);
+        self.permute();
+        self.pos = 0;
+    }
+
+    fn squeeze(&mut self, mut out: &mut [u8]) {
+        while !out.is_empty() {
+            if self.pos == RATE {
+                self.permute();
+                self.pos = 0;
+            }
+
+            let take = (RATE - self.pos).min(out.len());
+            let (block, rest) = out.split_at_mut(take);
+            self.copy_bytes(self.pos, block);
+            self.pos += take;
+            out = rest;
+        }
+    }
+
+    /// Append the lanes and the position in the block to `out`
+    fn write_state(&self, out: &mut Vec<u8>) {
+        for lane in &self.lanes {
+            out.extend_from_slice(&lane.to_le_bytes());
+        }
+        out.push(self.pos as u8);
+    }
+
+    /// Read a state written by `write_state` from the front of `data`, where
+    /// the position in the block is at most `max_pos`
+    fn read_state(data: &mut &[u8], max_pos: usize) -> Option<Self> {
+        let mut sponge = Self::new();
+        for lane in sponge.lanes.iter_mut() {
+            *lane = u64::from_le_bytes(take_bytes(data)?);
+        }
+        let [pos] = take_bytes(data)?;
+        sponge.pos = pos as usize;
+        (sponge.pos <= max_pos).then_some(sponge)
+    }
+}
+
+/// Remove and return the first `N` bytes of `data`
+pub fn take_bytes<const N: usize>(data: &mut &[u8]) -> Option<[u8; N]> {
+    let bytes = data.get(..N)?.try_into().ok()?;
+    *data = &data[N..];
+    Some(bytes)
+}
+
+/// Take a length as 8 little-endian bytes followed by that many bytes from the
+/// front of `data`, failing when the length is above `max_len`
+pub fn take_vec(data: &mut &[u8], max_len: usize) -> Option<Vec<u8>> {
+    let len = usize::try_from(u64::from_le_bytes(take_bytes(data)?)).ok()?;
+    if len > max_len || len > data.len() {
+        return None;
+    }
+    let (bytes, rest) = data.split_at(len);
+    *data = rest;
+    Some(bytes.to_vec())
+}
+
+macro_rules! impl_keccak_xof {
+    (
+        name = $name:ident,
+        reader = $reader:ident,
+        rate = $rate:literal,
+        rounds = $rounds:literal $(,)?
+    ) => {
+        #[doc = concat!("The ", stringify!($name), " hasher with the domain separation byte chosen on creation")]
+        #[derive(Clone)]
+        pub struct $name {
+            sponge: Sponge<$rate, $rounds>,
+            domain: u8,
+        }
+
+        #[doc = concat!("The output stream of a ", stringify!($name), " hasher")]
+        #[derive(Clone)]
+        pub struct $reader {
+            sponge: Sponge<$rate, $rounds>,
+        }
+
+        impl $name {
+            pub const fn new(domain: u8) -> Self {
+                Self {
+                    sponge: Sponge::new(),
+                    domain,
+                }
+            }
+        }
+
+        impl Update for $name {
+            fn update(&mut self, data: &[u8]) {
+                self.sponge.absorb(data);
+            }
+        }
+
+        impl ExtendableOutput for $name {
+            type Reader = $reader;
+
+            fn finalize_xof(mut self) -> Self::Reader {
+                self.sponge.pad(self.domain);
+                $reader {
+                    sponge: self.sponge,
+                }
+            }
+        }
+
+        impl Reset for $name {
+            fn reset(&mut self) {
+                self.sponge = Sponge::new();
+            }
+        }
+
+        impl ExtendableOutputReset for $name {
+            fn finalize_xof_reset(&mut self) -> Self::Reader {
+                let fresh = Self::new(self.domain);
+                std::mem::replace(self, fresh).finalize_xof()
+            }
+        }
+
+        impl XofReader for $reader {
+            fn read(&mut self, buffer: &mut [u8]) {
+                self.sponge.squeeze(buffer);
+            }
+        }
+
+        impl SerializeState for $name {
+            fn write_state(&self, out: &mut Vec<u8>) -> bool {
+                self.sponge.write_state(out);
+                out.push(self.domain);
+                true
+            }
+
+            fn read_state(data: &mut &[u8]) -> Option<Self> {
+                // The block is permuted as soon as it is full while absorbing
+                let sponge = Sponge::read_state(data, $rate - 1)?;
+                let [domain] = take_bytes(data)?;
+                (1..0x80).contains(&domain).then_some(Self { sponge, domain })
+            }
+        }
+
+        impl SerializeState for $reader {
+            fn write_state(&self, out: &mut Vec<u8>) -> bool {
+                self.sponge.write_state(out);
+                true
+            }
+
+            fn read_state(data: &mut &[u8]) -> Option<Self> {
+                // The block is only permuted when more output is needed
+                let sponge = Sponge::read_state(data, $rate)?;
+                Some(Self { sponge })
+            }
+        }
+    };
+}
+
+impl_keccak_xof!(
+    name = Shake128,
+    reader = Shake128Reader,
+    rate = 168,
+    rounds = 24,
+);
+
+impl_keccak_xof!(
+    name = Shake256,
+    reader = Shake256Reader,
+    rate = 136,
+    rounds = 24,
+);
+
+impl_keccak_xof!(
+    name = TurboShake128,
+    reader = TurboShake128Reader,
+    rate = 168,
+    rounds = 12,
+);
+
+impl_keccak_xof!(
+    name = TurboShake256,
+    reader = TurboShake256Reader,
+    rate = 136,
+    rounds = 12,
+);
+
+impl Default for Shake128 {
+    fn default() -> Self {
+        Self::new(SHAKE_DOMAIN)
+    }
+}
+
+impl Default for Shake256 {
+    fn default() -> Self {
+        Self::new(SHAKE_DOMAIN)
+    }
+}
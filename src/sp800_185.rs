@@ -0,0 +1,473 @@
+//! cSHAKE, KMAC, TupleHash and ParallelHash from NIST SP 800-185, built on the
+//! Shake implementations of the `shake` module.
+//!
+//! The function name, customization string and key are encoded and absorbed
+//! once, when the hasher is created. Resetting the hasher restores this
+//! precomputed state, so each further message only costs its own absorption.
+//!
+//! The blocks of ParallelHash are independent, so the chaining values of large
+//! absorbs are computed across threads with rayon.
+
+use digest::{ExtendableOutput, ExtendableOutputReset, Reset, Update, XofReader};
+use rayon::prelude::*;
+
+use crate::shake::{take_bytes, take_vec, Shake128, Shake128Reader, Shake256, Shake256Reader};
+use crate::SerializeState;
+
+/// Domain separation byte of cSHAKE with a function name or customization
+const CSHAKE_DOMAIN: u8 = 0x04;
+
+/// Function name of KMAC
+const KMAC_FUNCTION_NAME: &[u8] = b"KMAC";
+/// Function name of TupleHash
+const TUPLE_HASH_FUNCTION_NAME: &[u8] = b"TupleHash";
+/// Function name of ParallelHash
+const PARALLEL_HASH_FUNCTION_NAME: &[u8] = b"ParallelHash";
+
+/// The big-endian bytes of `x` with leading zero bytes removed, keeping at
+/// least one byte
+fn encode_bytes(x: u64) -> ([u8; 8], usize) {
+    let bytes = x.to_be_bytes();
+    let skip = bytes.iter().take_while(|&&b| b == 0).count().min(7);
+    (bytes, skip)
+}
+
+/// `left_encode(x)` from SP 800-185: the number of bytes used, followed by the
+/// big-endian bytes of `x`
+fn left_encode(x: u64) -> Vec<u8> {
+    let (bytes, skip) = encode_bytes(x);
+    let mut encoded = vec![(bytes.len() - skip) as u8];
+    encoded.extend_from_slice(&bytes[skip..]);
+    encoded
+}
+
+/// `right_encode(x)` from SP 800-185: the big-endian bytes of `x`, followed by
+/// the number of bytes used
+fn right_encode(x: u64) -> Vec<u8> {
+    let (bytes, skip) = encode_bytes(x);
+    let mut encoded = bytes[skip..].to_vec();
+    encoded.push((bytes.len() - skip) as u8);
+    encoded
+}
+
+/// Absorb `bytepad(encode_string(s_1) || ... || encode_string(s_n), rate)`
+fn absorb_bytepad(hasher: &mut impl Update, strings: &[&[u8]], rate: usize) {
+    let mut absorb = |data: &[u8], len: &mut usize| {
+        hasher.update(data);
+        *len += data.len();
+    };
+
+    let mut len = 0;
+    absorb(&left_encode(rate as u64), &mut len);
+    for string in strings {
+        absorb(&left_encode(8 * string.len() as u64), &mut len);
+        absorb(string, &mut len);
+    }
+    absorb(&vec![0; (rate - len % rate) % rate], &mut len);
+}
+
+macro_rules! impl_sp800_185 {
+    (
+        cshake = $cshake:ident,
+        kmac = $kmac:ident,
+        tuple_hash = $tuple_hash:ident,
+        parallel_hash = $parallel_hash:ident,
+        hasher = $hasher:ident,
+        reader = $reader:ident,
+        rate = $rate:literal,
+        chaining_value_len = $cv_len:literal $(,)?
+    ) => {
+        #[doc = concat!("The ", stringify!($cshake), " XOF from SP 800-185 with a fixed function name and customization string")]
+        #[derive(Clone)]
+        pub struct $cshake {
+            // the state after absorbing the function name and customization
+            initial: $hasher,
+            hasher: $hasher,
+        }
+
+        impl $cshake {
+            pub fn new(function_name: &[u8], customization: &[u8]) -> Self {
+                Self::from_initial(Self::initial_state(function_name, customization))
+            }
+
+            fn initial_state(function_name: &[u8], customization: &[u8]) -> $hasher {
+                // With neither string cSHAKE is defined to be Shake
+                if function_name.is_empty() && customization.is_empty() {
+                    return $hasher::default();
+                }
+                let mut hasher = $hasher::new(CSHAKE_DOMAIN);
+                absorb_bytepad(&mut hasher, &[function_name, customization], $rate);
+                hasher
+            }
+
+            fn from_initial(initial: $hasher) -> Self {
+                Self {
+                    hasher: initial.clone(),
+                    initial,
+                }
+            }
+        }
+
+        impl Update for $cshake {
+            fn update(&mut self, data: &[u8]) {
+                self.hasher.update(data);
+            }
+        }
+
+        impl ExtendableOutput for $cshake {
+            type Reader = $reader;
+
+            fn finalize_xof(self) -> Self::Reader {
+                self.hasher.finalize_xof()
+            }
+        }
+
+        impl Reset for $cshake {
+            fn reset(&mut self) {
+                self.hasher = self.initial.clone();
+            }
+        }
+
+        impl ExtendableOutputReset for $cshake {
+            fn finalize_xof_reset(&mut self) -> Self::Reader {
+                let fresh = self.initial.clone();
+                std::mem::replace(&mut self.hasher, fresh).finalize_xof()
+            }
+        }
+
+        impl SerializeState for $cshake {
+            fn write_state(&self, out: &mut Vec<u8>) -> bool {
+                self.initial.write_state(out) && self.hasher.write_state(out)
+            }
+
+            fn read_state(data: &mut &[u8]) -> Option<Self> {
+                Some(Self {
+                    initial: $hasher::read_state(data)?,
+                    hasher: $hasher::read_state(data)?,
+                })
+            }
+        }
+
+        #[doc = concat!("The ", stringify!($kmac), " MAC from SP 800-185 with a fixed key, customization string and output length")]
+        ///
+        /// An output length of zero gives the XOF variant, where the output
+        /// length is not bound into the MAC.
+        #[derive(Clone)]
+        pub struct $kmac {
+            cshake: $cshake,
+            output_bits: u64,
+        }
+
+        impl $kmac {
+            pub fn new(key: &[u8], customization: &[u8], output_len: usize) -> Self {
+                let mut initial = $cshake::initial_state(KMAC_FUNCTION_NAME, customization);
+                absorb_bytepad(&mut initial, &[key], $rate);
+                Self {
+                    cshake: $cshake::from_initial(initial),
+                    output_bits: 8 * output_len as u64,
+                }
+            }
+
+            pub fn output_len(&self) -> usize {
+                (self.output_bits / 8) as usize
+            }
+        }
+
+        impl Update for $kmac {
+            fn update(&mut self, data: &[u8]) {
+                self.cshake.update(data);
+            }
+        }
+
+        impl ExtendableOutput for $kmac {
+            type Reader = $reader;
+
+            fn finalize_xof(mut self) -> Self::Reader {
+                self.cshake.update(&right_encode(self.output_bits));
+                self.cshake.finalize_xof()
+            }
+        }
+
+        impl Reset for $kmac {
+            fn reset(&mut self) {
+                self.cshake.reset();
+            }
+        }
+
+        impl ExtendableOutputReset for $kmac {
+            fn finalize_xof_reset(&mut self) -> Self::Reader {
+                self.cshake.update(&right_encode(self.output_bits));
+                self.cshake.finalize_xof_reset()
+            }
+        }
+
+        impl SerializeState for $kmac {
+            fn write_state(&self, out: &mut Vec<u8>) -> bool {
+                out.extend_from_slice(&self.output_bits.to_le_bytes());
+                self.cshake.write_state(out)
+            }
+
+            fn read_state(data: &mut &[u8]) -> Option<Self> {
+                let output_bits = u64::from_le_bytes(take_bytes(data)?);
+                Some(Self {
+                    cshake: $cshake::read_state(data)?,
+                    output_bits,
+                })
+            }
+        }
+
+        #[doc = concat!("The ", stringify!($tuple_hash), " hash from SP 800-185 with a fixed customization string and output length")]
+        ///
+        /// Every call to `update` absorbs one complete element of the tuple.
+        /// An output length of zero gives the XOF variant.
+        #[derive(Clone)]
+        pub struct $tuple_hash {
+            cshake: $cshake,
+            output_bits: u64,
+        }
+
+        impl $tuple_hash {
+            pub fn new(customization: &[u8], output_len: usize) -> Self {
+                Self {
+                    cshake: $cshake::new(TUPLE_HASH_FUNCTION_NAME, customization),
+                    output_bits: 8 * output_len as u64,
+                }
+            }
+
+            pub fn output_len(&self) -> usize {
+                (self.output_bits / 8) as usize
+            }
+
+            /// Start an element of the tuple which is `len` bytes long,
+            /// returning the hasher that exactly `len` bytes of the element
+            /// must then be absorbed into
+            pub fn start_element(&mut self, len: u64) -> &mut $cshake {
+                self.cshake.update(&left_encode(8 * len));
+                &mut self.cshake
+            }
+        }
+
+        impl Update for $tuple_hash {
+            fn update(&mut self, element: &[u8]) {
+                self.start_element(element.len() as u64).update(element);
+            }
+        }
+
+        impl ExtendableOutput for $tuple_hash {
+            type Reader = $reader;
+
+            fn finalize_xof(mut self) -> Self::Reader {
+                self.finalize_xof_reset()
+            }
+        }
+
+        impl Reset for $tuple_hash {
+            fn reset(&mut self) {
+                self.cshake.reset();
+            }
+        }
+
+        impl ExtendableOutputReset for $tuple_hash {
+            fn finalize_xof_reset(&mut self) -> Self::Reader {
+                self.cshake.update(&right_encode(self.output_bits));
+                self.cshake.finalize_xof_reset()
+            }
+        }
+
+        impl SerializeState for $tuple_hash {
+            fn write_state(&self, out: &mut Vec<u8>) -> bool {
+                out.extend_from_slice(&self.output_bits.to_le_bytes());
+                self.cshake.write_state(out)
+            }
+
+            fn read_state(data: &mut &[u8]) -> Option<Self> {
+                let output_bits = u64::from_le_bytes(take_bytes(data)?);
+                Some(Self {
+                    cshake: $cshake::read_state(data)?,
+                    output_bits,
+                })
+            }
+        }
+
+        #[doc = concat!("The ", stringify!($parallel_hash), " hash from SP 800-185 with a fixed block size, customization string and output length")]
+        ///
+        /// An output length of zero gives the XOF variant.
+        #[derive(Clone)]
+        pub struct $parallel_hash {
+            // absorbs the chaining values of the blocks
+            cshake: $cshake,
+            block_size: usize,
+            // input which is not yet part of a block, always shorter than a block
+            pending: Vec<u8>,
+            block_count: u64,
+            output_bits: u64,
+        }
+
+        impl $parallel_hash {
+            /// Create a hasher for blocks of `block_size` bytes, which must not be zero
+            pub fn new(block_size: usize, customization: &[u8], output_len: usize) -> Self {
+                assert!(block_size > 0, "the block size must not be zero");
+                let mut initial = $cshake::initial_state(PARALLEL_HASH_FUNCTION_NAME, customization);
+                initial.update(&left_encode(block_size as u64));
+                Self {
+                    cshake: $cshake::from_initial(initial),
+                    block_size,
+                    pending: Vec::new(),
+                    block_count: 0,
+                    output_bits: 8 * output_len as u64,
+                }
+            }
+
+            pub fn output_len(&self) -> usize {
+                (self.output_bits / 8) as usize
+            }
+
+            fn chaining_value(block: &[u8]) -> [u8; $cv_len] {
+                let mut cv = [0u8; $cv_len];
+                $hasher::default().chain(block).finalize_xof().read(&mut cv);
+                cv
+            }
+
+            /// Absorb the whole blocks at the start of `data`, computing their
+            /// chaining values in parallel, and return the rest
+            fn absorb_blocks<'a>(&mut self, data: &'a [u8]) -> &'a [u8] {
+                let blocks_len = data.len() / self.block_size * self.block_size;
+                let (blocks, rest) = data.split_at(blocks_len);
+
+                let cvs: Vec<[u8; $cv_len]> = blocks
+                    .par_chunks(self.block_size)
+                    .map(Self::chaining_value)
+                    .collect();
+                for cv in &cvs {
+                    self.cshake.update(cv);
+                }
+                self.block_count += cvs.len() as u64;
+
+                rest
+            }
+        }
+
+        impl Update for $parallel_hash {
+            fn update(&mut self, mut data: &[u8]) {
+                while !data.is_empty() {
+                    if self.pending.is_empty() && data.len() >= self.block_size {
+                        data = self.absorb_blocks(data);
+                        continue;
+                    }
+
+                    let take = (self.block_size - self.pending.len()).min(data.len());
+                    self.pending.extend_from_slice(&data[..take]);
+                    data = &data[take..];
+
+                    if self.pending.len() == self.block_size {
+                        let cv = Self::chaining_value(&self.pending);
+                        self.cshake.update(&cv);
+                        self.block_count += 1;
+                        self.pending.clear();
+                    }
+                }
+            }
+        }
+
+        impl ExtendableOutput for $parallel_hash {
+            type Reader = $reader;
+
+            fn finalize_xof(mut self) -> Self::Reader {
+                self.finalize_xof_reset()
+            }
+        }
+
+        impl Reset for $parallel_hash {
+            fn reset(&mut self) {
+                self.cshake.reset();
+                self.pending.clear();
+                self.block_count = 0;
+            }
+        }
+
+        impl ExtendableOutputReset for $parallel_hash {
+            fn finalize_xof_reset(&mut self) -> Self::Reader {
+                // The last block may be shorter than the block size
+                let mut block_count = self.block_count;
+                if !self.pending.is_empty() {
+                    let cv = Self::chaining_value(&self.pending);
+                    self.cshake.update(&cv);
+                    block_count += 1;
+                }
+                self.cshake.update(&right_encode(block_count));
+                self.cshake.update(&right_encode(self.output_bits));
+                let reader = self.cshake.finalize_xof_reset();
+                self.reset();
+                reader
+            }
+        }
+
+        impl SerializeState for $parallel_hash {
+            fn write_state(&self, out: &mut Vec<u8>) -> bool {
+                out.extend_from_slice(&self.output_bits.to_le_bytes());
+                out.extend_from_slice(&(self.block_size as u64).to_le_bytes());
+                out.extend_from_slice(&self.block_count.to_le_bytes());
+                out.extend_from_slice(&(self.pending.len() as u64).to_le_bytes());
+                out.extend_from_slice(&self.pending);
+                self.cshake.write_state(out)
+            }
+
+            fn read_state(data: &mut &[u8]) -> Option<Self> {
+                let output_bits = u64::from_le_bytes(take_bytes(data)?);
+                let block_size = usize::try_from(u64::from_le_bytes(take_bytes(data)?)).ok()?;
+                let block_count = u64::from_le_bytes(take_bytes(data)?);
+                if block_size == 0 {
+                    return None;
+                }
+                let pending = take_vec(data, block_size - 1)?;
+                Some(Self {
+                    cshake: $cshake::read_state(data)?,
+                    block_size,
+                    pending,
+                    block_count,
+                    output_bits,
+                })
+            }
+        }
+    };
+}
+
+impl_sp800_185!(
+    cshake = CShake128,
+    kmac = Kmac128,
+    tuple_hash = TupleHash128,
+    parallel_hash = ParallelHash128,
+    hasher = Shake128,
+    reader = Shake128Reader,
+    rate = 168,
+    chaining_value_len = 32,
+);
+
+impl_sp800_185!(
+    cshake = CShake256,
+    kmac = Kmac256,
+    tuple_hash = TupleHash256,
+    parallel_hash = ParallelHash256,
+    hasher = Shake256,
+    reader = Shake256Reader,
+    rate = 136,
+    chaining_value_len = 64,
+);
+
+/// KMACXOF128, which is KMAC128 with an output length of zero
+pub type KmacXof128 = Kmac128;
+
+/// KMACXOF256, which is KMAC256 with an output length of zero
+pub type KmacXof256 = Kmac256;
+
+/// TupleHashXOF128, which is TupleHash128 with an output length of zero
+pub type TupleHashXof128 = TupleHash128;
+
+/// TupleHashXOF256, which is TupleHash256 with an output length of zero
+pub type TupleHashXof256 = TupleHash256;
+
+/// ParallelHashXOF128, which is ParallelHash128 with an output length of zero
+pub type ParallelHashXof128 = ParallelHash128;
+
+/// ParallelHashXOF256, which is ParallelHash256 with an output length of zero
+pub type ParallelHashXof256 = ParallelHash256;
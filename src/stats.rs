@@ -0,0 +1,176 @@
+//! Opt-in counters of the calls, bytes and time spent absorbing, finalizing and
+//! reading for every algorithm.
+//!
+//! Counting is disabled by default. While it is disabled, every instrumented
+//! method only performs a single relaxed atomic load.
+
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::Mutex;
+use std::time::Instant;
+
+use pyo3::{prelude::*, types::PyDict, PyClass};
+
+static ENABLED: AtomicBool = AtomicBool::new(false);
+
+/// The counters of every algorithm, in the order their classes were added to
+/// the module
+static REGISTRY: Mutex<Vec<&'static AlgorithmStats>> = Mutex::new(Vec::new());
+
+/// Return the start time of an operation, or `None` when counting is disabled
+#[inline]
+pub fn start() -> Option<Instant> {
+    if ENABLED.load(Ordering::Relaxed) {
+        Some(Instant::now())
+    } else {
+        None
+    }
+}
+
+/// Counters for one kind of operation
+pub struct OpStats {
+    calls: AtomicU64,
+    bytes: AtomicU64,
+    nanos: AtomicU64,
+}
+
+impl OpStats {
+    const fn new() -> Self {
+        Self {
+            calls: AtomicU64::new(0),
+            bytes: AtomicU64::new(0),
+            nanos: AtomicU64::new(0),
+        }
+    }
+
+    /// Count an operation on `bytes` bytes which began at `start`
+    #[inline]
+    pub fn record(&self, start: Option<Instant>, bytes: usize) {
+        if let Some(start) = start {
+            let nanos = start.elapsed().as_nanos() as u64;
+            self.calls.fetch_add(1, Ordering::Relaxed);
+            self.bytes.fetch_add(bytes as u64, Ordering::Relaxed);
+            self.nanos.fetch_add(nanos, Ordering::Relaxed);
+        }
+    }
+
+    fn reset(&self) {
+        self.calls.store(0, Ordering::Relaxed);
+        self.bytes.store(0, Ordering::Relaxed);
+        self.nanos.store(0, Ordering::Relaxed);
+    }
+
+    fn to_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = PyDict::new(py);
+        dict.set_item("calls", self.calls.load(Ordering::Relaxed))?;
+        dict.set_item("bytes", self.bytes.load(Ordering::Relaxed))?;
+        dict.set_item("ns", self.nanos.load(Ordering::Relaxed))?;
+        Ok(dict)
+    }
+}
+
+/// Counters for every operation of a single algorithm
+pub struct AlgorithmStats {
+    name: &'static str,
+    pub absorb: OpStats,
+    pub finalize: OpStats,
+    pub read: OpStats,
+}
+
+impl AlgorithmStats {
+    pub const fn new(name: &'static str) -> Self {
+        Self {
+            name,
+            absorb: OpStats::new(),
+            finalize: OpStats::new(),
+            read: OpStats::new(),
+        }
+    }
+
+    fn reset(&self) {
+        self.absorb.reset();
+        self.finalize.reset();
+        self.read.reset();
+    }
+
+    fn to_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = PyDict::new(py);
+        dict.set_item("absorb", self.absorb.to_dict(py)?)?;
+        dict.set_item("finalize", self.finalize.to_dict(py)?)?;
+        dict.set_item("read", self.read.to_dict(py)?)?;
+        Ok(dict)
+    }
+}
+
+/// A Python class with its own counters, implemented by the shaker and hasher
+/// classes generated by the class macros
+pub trait Instrumented {
+    fn stats() -> &'static AlgorithmStats;
+}
+
+/// Add the class `T` to the module `m` and report its counters in `stats()`
+pub fn add_class<T: PyClass + Instrumented>(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<T>()?;
+    let stats = T::stats();
+    let mut registry = REGISTRY.lock().unwrap();
+    // Never report an algorithm twice, even if the module is initialized again
+    if !registry.iter().any(|other| std::ptr::eq(*other, stats)) {
+        registry.push(stats);
+    }
+    Ok(())
+}
+
+/// The counters of every algorithm, in the order reported by `stats()`
+fn all_stats() -> Vec<&'static AlgorithmStats> {
+    REGISTRY.lock().unwrap().clone()
+}
+
+/// Enable or disable counting the calls, bytes and time of every XOF operation
+///
+/// Counting is disabled by default, or enabled on import when the environment
+/// variable `XOFLIB_STATS` is set to `1`. Disabling keeps the current counts.
+///
+/// Example:
+///
+/// .. code-block:: python
+///
+///    >>> import xoflib
+///    >>> xoflib.enable_stats()
+///    >>> _ = xoflib.shake128(b"bytes to absorb").read(100)
+///    >>> xoflib.stats()["Shake128"]["read"]["bytes"]
+///    100
+#[pyfunction]
+#[pyo3(signature = (enabled = true))]
+pub fn enable_stats(enabled: bool) {
+    ENABLED.store(enabled, Ordering::Relaxed);
+}
+
+/// Return the counts of calls, bytes and cumulative nanoseconds for every algorithm
+///
+/// The result maps each algorithm name to a dictionary with the keys `"absorb"`,
+/// `"finalize"` and `"read"`, each of which maps `"calls"`, `"bytes"` and `"ns"`
+/// to their totals since counting was enabled or `reset_stats()` was called.
+/// The `*_batch()` and `*_many()` functions and `Blake3KeyContext` count every
+/// message they hash as one absorb, finalize and read of its algorithm.
+#[pyfunction]
+pub fn stats(py: Python<'_>) -> PyResult<Bound<'_, PyDict>> {
+    let dict = PyDict::new(py);
+    for algorithm in all_stats() {
+        dict.set_item(algorithm.name, algorithm.to_dict(py)?)?;
+    }
+    Ok(dict)
+}
+
+/// Reset every count returned by `stats()` to zero
+#[pyfunction]
+pub fn reset_stats() {
+    for algorithm in all_stats() {
+        algorithm.reset();
+    }
+}
+
+/// Enable counting when `XOFLIB_STATS=1` is set in the environment
+pub fn enable_from_env() {
+    if std::env::var_os("XOFLIB_STATS").is_some_and(|value| value == "1") {
+        enable_stats(true);
+    }
+}
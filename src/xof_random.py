@@ -0,0 +1,59 @@
+import os
+import random
+
+
+class XofRandom(random.Random):
+    """
+    A `random.Random` whose output is read from a XOF seeded with `seed`
+
+    `algorithm` is one of "turboshake128" (the default), "turboshake256",
+    "shake128", "shake256" or "blake3". Seeds may be bytes-like, `str`
+    (encoded as UTF-8) or `int` (encoded as signed little-endian bytes), and
+    a `seed` of `None` uses 32 bytes from `os.urandom()`. The XOF output is
+    buffered natively, so each draw avoids creating intermediate bytes.
+
+    Example:
+
+    .. code-block:: python
+
+       >>> from xoflib import XofRandom
+       >>> rng = XofRandom(b"seed", algorithm="blake3")
+       >>> rng.randrange(3329) < 3329
+       True
+    """
+
+    def __new__(cls, seed=None, algorithm="turboshake128"):
+        # random.Random.__new__ seeds the unused Mersenne Twister state from
+        # its arguments, which may not be hashable
+        return super().__new__(cls)
+
+    def __init__(self, seed=None, algorithm="turboshake128"):
+        self._algorithm = algorithm
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        if a is None:
+            a = os.urandom(32)
+        elif isinstance(a, int):
+            a = a.to_bytes((a.bit_length() + 8) // 8, "little", signed=True)
+        elif isinstance(a, str):
+            a = a.encode()
+        self._core = XofRandomCore(a, self._algorithm)
+        self.gauss_next = None
+
+    def random(self):
+        return self._core.random()
+
+    def getrandbits(self, k):
+        return self._core.getrandbits(k)
+
+    def randbytes(self, n):
+        return self._core.randbytes(n)
+
+    def getstate(self):
+        return self._core.copy(), self.gauss_next
+
+    def setstate(self, state):
+        core, self.gauss_next = state
+        self._core = core.copy()
+        self._algorithm = core.algorithm
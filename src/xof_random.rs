@@ -0,0 +1,127 @@
+//! `XofRandom`, a subclass of `random.Random`. PyO3 classes cannot extend
+//! Python classes, so the subclass is defined in `xof_random.py` and draws
+//! from the buffered XOF of an `XofRandomCore`.
+
+use std::ffi::CString;
+use std::sync::Mutex;
+
+use pyo3::{
+    exceptions::PyValueError,
+    ffi::c_str,
+    prelude::*,
+    types::{PyBytes, PyInt},
+};
+
+use crate::buffered_xof::{BufferedXof, SeededXof};
+use crate::{allow_threads_for_len, pybuffer_get_bytes};
+
+/// The seeded XOF behind an `XofRandom`
+///
+/// Like `random.Random`, one instance can be shared between threads, so the XOF
+/// is behind a lock rather than relying on the GIL. The lock is never held
+/// while calling into Python or waiting for the GIL, so it cannot deadlock.
+#[pyclass(module = "xoflib")]
+pub struct XofRandomCore {
+    algorithm: String,
+    xof: Mutex<BufferedXof>,
+}
+
+impl Clone for XofRandomCore {
+    fn clone(&self) -> Self {
+        Self {
+            algorithm: self.algorithm.clone(),
+            xof: Mutex::new(self.xof.lock().unwrap().clone()),
+        }
+    }
+}
+
+#[pymethods]
+impl XofRandomCore {
+    #[new]
+    fn new(seed: &Bound<'_, PyAny>, algorithm: &str) -> PyResult<Self> {
+        let seed = pybuffer_get_bytes(seed)?;
+        Ok(Self {
+            algorithm: algorithm.to_string(),
+            xof: Mutex::new(BufferedXof::new(SeededXof::new(
+                seed.as_slice(),
+                algorithm,
+            )?)),
+        })
+    }
+
+    /// A float in [0, 1) from the top 53 bits of the next 8 bytes
+    fn random(&self) -> f64 {
+        self.xof.lock().unwrap().next_f64()
+    }
+
+    /// An integer from the low `k` bits of the next `ceil(k / 8)` bytes,
+    /// read as a little-endian integer
+    fn getrandbits<'py>(&self, py: Python<'py>, k: i64) -> PyResult<Bound<'py, PyAny>> {
+        if k < 0 {
+            return Err(PyValueError::new_err("number of bits must be non-negative"));
+        }
+        let k = k as usize;
+
+        if k <= 64 {
+            let mut bytes = [0u8; 8];
+            self.xof.lock().unwrap().fill(&mut bytes[..k.div_ceil(8)]);
+            let mask = u64::MAX.checked_shr(64 - k as u32).unwrap_or(0);
+            let x = u64::from_le_bytes(bytes) & mask;
+            return Ok(x.into_pyobject(py)?.into_any());
+        }
+
+        let mut bytes = vec![0u8; k.div_ceil(8)];
+        self.xof.lock().unwrap().fill(&mut bytes);
+        if let Some(last) = bytes.last_mut() {
+            *last &= 0xFF >> (bytes.len() * 8 - k);
+        }
+        py.get_type::<PyInt>()
+            .call_method1("from_bytes", (PyBytes::new(py, &bytes), "little"))
+    }
+
+    /// The next `n` bytes
+    fn randbytes<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyBytes>> {
+        PyBytes::new_with(py, n, |bytes| {
+            allow_threads_for_len(py, n, || self.xof.lock().unwrap().fill(bytes));
+            Ok(())
+        })
+    }
+
+    fn copy(&self) -> Self {
+        self.clone()
+    }
+
+    fn __copy__(&self) -> Self {
+        self.clone()
+    }
+
+    fn __deepcopy__(&self, _memo: &Bound<'_, PyAny>) -> Self {
+        self.clone()
+    }
+
+    #[getter]
+    fn algorithm(&self) -> &str {
+        &self.algorithm
+    }
+
+    fn __str__(&self) -> String {
+        String::from("XofRandomCore")
+    }
+}
+
+/// Define `XofRandom` and add it to the module `m`
+pub fn add_xof_random(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    let py = m.py();
+    let code = CString::new(include_str!("xof_random.py"))?;
+    let module = PyModule::from_code(
+        py,
+        &code,
+        c_str!("xoflib/xof_random.py"),
+        c_str!("xoflib._xof_random"),
+    )?;
+    module.add("XofRandomCore", py.get_type::<XofRandomCore>())?;
+
+    let xof_random = module.getattr("XofRandom")?;
+    xof_random.setattr("__module__", "xoflib")?;
+    m.add("XofRandom", xof_random)
+}
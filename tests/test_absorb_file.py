@@ -0,0 +1,104 @@
+import os
+import pathlib
+import tempfile
+import unittest
+from utilities import XOF_CLASSES
+from xoflib import (
+    Blake3,
+    Shake128,
+    Shake256,
+    TurboShake128,
+    hash_file,
+)
+
+
+class TestAbsorbFile(unittest.TestCase):
+    def setUp(self):
+        # Larger than a single read from the file
+        self.data = os.urandom(2**21 + 123)
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(self.data)
+        self.path = f.name
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_path(self):
+        for Xof in XOF_CLASSES:
+            expected = Xof(b"prefix" + self.data + b"suffix").finalize().read(100)
+            for path in [self.path, pathlib.Path(self.path)]:
+                xof = Xof(b"prefix").absorb_file(path).absorb(b"suffix").finalize()
+                self.assertEqual(xof.read(100), expected)
+
+    def test_empty_file(self):
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            pass
+        try:
+            for Xof in XOF_CLASSES:
+                xof = Xof(b"prefix").absorb_file(f.name).finalize()
+                self.assertEqual(xof.read(100), Xof(b"prefix").finalize().read(100))
+        finally:
+            os.remove(f.name)
+
+    def test_file_descriptor(self):
+        for Xof in XOF_CLASSES:
+            with open(self.path, "rb") as f:
+                # The file is read from the current offset of the descriptor
+                f.seek(1000)
+                xof = Xof().absorb_file(f.fileno()).finalize()
+                self.assertEqual(xof.read(100), Xof(self.data[1000:]).finalize().read(100))
+
+                # The descriptor is left open at the end of the file
+                self.assertFalse(f.closed)
+                self.assertEqual(os.lseek(f.fileno(), 0, os.SEEK_CUR), len(self.data))
+
+    def test_missing_file(self):
+        for Xof in XOF_CLASSES:
+            with self.assertRaises(FileNotFoundError):
+                Xof().absorb_file("does/not/exist")
+
+    def test_invalid_file_descriptor(self):
+        with self.assertRaises((OSError, ValueError)):
+            Shake128().absorb_file(-1)
+
+        # Only integers which are not bool are file descriptors
+        for file in [True, False]:
+            with self.assertRaises(TypeError):
+                Shake128().absorb_file(file)
+
+    def test_hash_file(self):
+        self.assertEqual(
+            hash_file(Shake256, self.path, 64),
+            Shake256(self.data).finalize().read(64),
+        )
+        self.assertEqual(
+            hash_file(TurboShake128(1), pathlib.Path(self.path), 32),
+            TurboShake128(1, self.data).finalize().read(32),
+        )
+        with open(self.path, "rb") as f:
+            self.assertEqual(
+                hash_file(Blake3, f.fileno(), 32),
+                Blake3(self.data).finalize().read(32),
+            )
+
+    def test_hash_file_prefix(self):
+        for Xof in XOF_CLASSES:
+            # The shaker is copied, so its own state is left unchanged
+            prefix = Xof(b"prefix")
+            self.assertEqual(
+                hash_file(prefix, self.path, 100),
+                Xof(b"prefix" + self.data).finalize().read(100),
+            )
+            self.assertEqual(
+                prefix.finalize().read(100), Xof(b"prefix").finalize().read(100)
+            )
+
+    def test_hash_file_invalid_algorithm(self):
+        # Only shaker classes and shakers are accepted, not arbitrary callables
+        for algorithm in [lambda: Shake256(), Shake256().finalize(), bytes, "Shake256"]:
+            with self.assertRaises(TypeError):
+                hash_file(algorithm, self.path, 32)
+
+        # Shaker classes which need arguments cannot be constructed
+        with self.assertRaises(TypeError):
+            hash_file(TurboShake128, self.path, 32)
@@ -0,0 +1,76 @@
+import asyncio
+import os
+import unittest
+from utilities import XOF_CLASSES
+from xoflib import (
+    Shake128,
+    Shake256,
+    TurboShake128,
+)
+
+
+class TestAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_absorb_async(self):
+        chunks = [os.urandom(n) for n in [0, 1, 100, 10_000, 100_000]]
+        for Xof in XOF_CLASSES:
+            xof = Xof()
+            for chunk in chunks:
+                self.assertIs(await xof.absorb_async(chunk), xof)
+            expected = Xof(b"".join(chunks)).finalize().read(100)
+            self.assertEqual(xof.finalize().read(100), expected)
+
+    async def test_read_async(self):
+        for Xof in XOF_CLASSES:
+            xof1 = Xof(b"async").finalize()
+            xof2 = Xof(b"async").finalize()
+            buf = bytearray(10_000)
+            self.assertEqual(await xof1.read_async(100), xof2.read(100))
+            self.assertIsNone(await xof1.read_into_async(buf))
+            self.assertEqual(buf, xof2.read(10_000))
+
+    async def test_strict_order(self):
+        chunks = [os.urandom(50_000) for _ in range(20)]
+        xof = Shake256()
+        # All chunks are queued before any are awaited
+        await asyncio.gather(*[xof.absorb_async(chunk) for chunk in chunks])
+        expected = Shake256(b"".join(chunks)).finalize().read(100)
+        self.assertEqual(xof.finalize().read(100), expected)
+
+        xof1 = Shake256(b"async").finalize()
+        xof2 = Shake256(b"async").finalize()
+        reads = await asyncio.gather(*[xof1.read_async(n) for n in range(1, 50)])
+        self.assertEqual(reads, [xof2.read(n) for n in range(1, 50)])
+
+    async def test_buffer_is_copied(self):
+        xof = Shake128()
+        chunk = bytearray(b"first chunk")
+        pending = xof.absorb_async(chunk)
+        chunk[:] = b"later write"
+        await pending
+        self.assertEqual(xof.finalize().read(32), Shake128(b"first chunk").finalize().read(32))
+
+    async def test_cancellation(self):
+        chunks = [os.urandom(100_000) for _ in range(10)]
+        xof = TurboShake128(1)
+        pending = [xof.absorb_async(chunk) for chunk in chunks]
+        pending[4].cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending[4]
+
+        # cancelling the wait does not drop the chunk
+        await asyncio.gather(*pending[5:])
+        expected = TurboShake128(1, b"".join(chunks)).finalize().read(100)
+        self.assertEqual(xof.finalize().read(100), expected)
+
+    async def test_errors(self):
+        xof = Shake128()
+        with self.assertRaises(TypeError):
+            await xof.absorb_async("not a buffer")
+        with self.assertRaises(TypeError):
+            await xof.finalize().read_into_async(b"immutable")
+
+
+class TestAsyncNoLoop(unittest.TestCase):
+    def test_requires_running_loop(self):
+        with self.assertRaises(RuntimeError):
+            Shake128().absorb_async(b"data")
@@ -0,0 +1,68 @@
+import threading
+import unittest
+from xoflib import (
+    Blake3,
+    Shake128,
+    Shake256,
+    TurboShake128,
+    TurboShake256,
+    XofBitGenerator,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ALGORITHMS = {
+    "turboshake128": lambda seed: TurboShake128(0x1F, seed),
+    "turboshake256": lambda seed: TurboShake256(0x1F, seed),
+    "shake128": Shake128,
+    "shake256": Shake256,
+    "blake3": Blake3,
+}
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestXofBitGenerator(unittest.TestCase):
+    def test_uint64_stream(self):
+        for algorithm, Xof in ALGORITHMS.items():
+            rng = np.random.Generator(XofBitGenerator(b"seed", algorithm=algorithm))
+            # The full uint64 range draws directly from next_uint64, reading
+            # past the end of the internal buffer
+            values = rng.integers(0, 2**64, size=1000, dtype=np.uint64)
+            expected = np.frombuffer(Xof(b"seed").finalize().read(8000), dtype="<u8")
+            self.assertTrue(np.array_equal(values, expected))
+
+    def test_default_algorithm(self):
+        rng1 = np.random.Generator(XofBitGenerator(b"seed"))
+        rng2 = np.random.Generator(XofBitGenerator(b"seed", "turboshake128"))
+        self.assertTrue(np.array_equal(rng1.random(100), rng2.random(100)))
+
+    def test_reproducible(self):
+        for algorithm in ALGORITHMS:
+            rng1 = np.random.Generator(XofBitGenerator(b"seed", algorithm))
+            rng2 = np.random.Generator(XofBitGenerator(b"seed", algorithm))
+            rng3 = np.random.Generator(XofBitGenerator(b"other seed", algorithm))
+            a = rng1.standard_normal(1000)
+            self.assertTrue(np.array_equal(a, rng2.standard_normal(1000)))
+            self.assertFalse(np.array_equal(a, rng3.standard_normal(1000)))
+
+    def test_distributions(self):
+        rng = np.random.Generator(XofBitGenerator(b"seed"))
+        x = rng.random(100_000)
+        self.assertTrue(np.all((0 <= x) & (x < 1)))
+        self.assertAlmostEqual(x.mean(), 0.5, places=2)
+
+        n = rng.integers(0, 3329, size=100_000, dtype=np.uint32)
+        self.assertTrue(np.all(n < 3329))
+
+    def test_attributes(self):
+        bit_generator = XofBitGenerator(b"seed", algorithm="blake3")
+        self.assertEqual(bit_generator.algorithm, "blake3")
+        self.assertIsInstance(bit_generator.lock, type(threading.Lock()))
+        self.assertIs(bit_generator.lock, bit_generator.lock)
+
+    def test_invalid_algorithm(self):
+        with self.assertRaises(ValueError):
+            XofBitGenerator(b"seed", algorithm="md5")
@@ -1,9 +1,10 @@
 import json
 import unittest
-from xoflib import Blake3, blake3_xof
+from xoflib import Blake3, Blake3KeyContext, blake3_xof
 from utilities import create_pattern
 import os
 import random
+import tempfile
 
 # Data parsed for KAT vectors downloaded from
 # https://github.com/BLAKE3-team/BLAKE3/blob/master/test_vectors/test_vectors.json
@@ -17,6 +18,32 @@ class TestBlake3KAT(unittest.TestCase):
             input_bytes = create_pattern(250, int(data["input_len"]))
             self.assertEqual(kat_hash, blake3_xof(input_bytes).read(131))
 
+    def test_blake3_keyed_kat(self):
+        with open("tests/assets/blake3/test_vectors.json") as f:
+            kat_data = json.load(f)
+
+        key = kat_data["key"].encode()
+        context = Blake3KeyContext(key=key)
+        for data in kat_data["cases"]:
+            kat_hash = bytes.fromhex(data["keyed_hash"])
+            input_bytes = create_pattern(250, int(data["input_len"]))
+            xof = Blake3(input_bytes, key=key).finalize()
+            self.assertEqual(kat_hash, xof.read(131))
+            self.assertEqual(kat_hash, context.digest(input_bytes, 131))
+
+    def test_blake3_derive_key_kat(self):
+        with open("tests/assets/blake3/test_vectors.json") as f:
+            kat_data = json.load(f)
+
+        context_string = kat_data["context_string"]
+        context = Blake3KeyContext(context=context_string)
+        for data in kat_data["cases"]:
+            kat_hash = bytes.fromhex(data["derive_key"])
+            input_bytes = create_pattern(250, int(data["input_len"]))
+            xof = Blake3.derive_key(context_string, input_bytes).finalize()
+            self.assertEqual(kat_hash, xof.read(131))
+            self.assertEqual(kat_hash, context.digest(input_bytes, 131))
+
 class TestBlake(unittest.TestCase):
     def class_function_comparison(self, ClassHash, function_hash):
         for _ in range(50):
@@ -41,3 +68,122 @@ class TestBlake(unittest.TestCase):
         xof1 = Blake3(data).finalize()
         xof2 = blake3_xof(data)
         self.assertEqual(xof1.read(100), xof2.read(100))
+
+    def test_absorb_parallel(self):
+        for data_len in [0, 1, 2**10, 2**17 + 1, 2**22]:
+            data = os.urandom(data_len)
+            xof1 = Blake3(b"prefix").absorb_parallel(data).absorb(b"suffix").finalize()
+            xof2 = blake3_xof(b"prefix" + data + b"suffix")
+            self.assertEqual(xof1.read(131), xof2.read(131))
+
+    def test_absorb_file(self):
+        for data_len in [0, 1, 2**14 - 1, 2**14, 2**20 + 1]:
+            data = os.urandom(data_len)
+            with tempfile.NamedTemporaryFile(delete=False) as f:
+                f.write(data)
+            try:
+                xof1 = Blake3(b"prefix").absorb_file(f.name).finalize()
+                xof2 = blake3_xof(b"prefix" + data)
+                self.assertEqual(xof1.read(131), xof2.read(131))
+            finally:
+                os.remove(f.name)
+
+    def test_absorb_missing_file(self):
+        self.assertRaises(
+            FileNotFoundError, lambda: Blake3().absorb_file("does/not/exist")
+        )
+
+    def test_seek_and_tell(self):
+        xof = Blake3(b"seekable output").finalize()
+        stream = xof.copy().read(10_000)
+
+        self.assertEqual(xof.tell(), 0)
+        xof.read(123)
+        self.assertEqual(xof.tell(), 123)
+
+        for offset in [0, 1, 63, 64, 65, 1023, 1024, 5000]:
+            xof.seek(offset)
+            self.assertEqual(xof.tell(), offset)
+            self.assertEqual(xof.read(1000), stream[offset : offset + 1000])
+            self.assertEqual(xof.tell(), offset + 1000)
+
+    def test_read_at(self):
+        xof = Blake3(b"seekable output").finalize()
+        stream = xof.copy().read(10_000)
+        xof.read(10)
+        for offset in [0, 1, 64, 1025, 9000]:
+            self.assertEqual(xof.read_at(offset, 1000), stream[offset : offset + 1000])
+
+        # read_at does not move the read position
+        self.assertEqual(xof.tell(), 10)
+        self.assertEqual(xof.read(10), stream[10:20])
+
+    def test_seek_far(self):
+        offset = 10 * 2**30
+        xof1 = Blake3(b"seekable output").finalize()
+        xof1.seek(offset)
+        xof2 = Blake3(b"seekable output").finalize()
+        self.assertEqual(xof1.read(64), xof2.read_at(offset, 64))
+
+    def test_parallel_read(self):
+        # Reads of at least 1MB are generated across threads
+        n = 2**21 + 12345
+        xof = Blake3(b"large output").finalize()
+        xof.read(17)
+        sequential = xof.copy()
+        expected = b"".join(sequential.read(2**12) for _ in range(n // 2**12 + 1))[:n]
+
+        self.assertEqual(xof.copy().read(n), expected)
+        buf = bytearray(n)
+        xof.copy().read_into(buf)
+        self.assertEqual(buf, expected)
+        self.assertEqual(xof.read_at(17, n), expected)
+
+        # the read position is left at the end of the parallel read
+        xof.read(n)
+        self.assertEqual(xof.tell(), 17 + n)
+        self.assertEqual(xof.read(100), xof.read_at(17 + n, 100))
+
+    def test_key_context(self):
+        key = os.urandom(32)
+        context_string = "xoflib 2024-06-01 key context tests"
+        inputs = [os.urandom(n) for n in [0, 1, 64, 1024, 5000]]
+        for context, new_hasher in [
+            (Blake3KeyContext(key=key), lambda: Blake3(key=key)),
+            (
+                Blake3KeyContext(context=context_string),
+                lambda: Blake3.derive_key(context_string),
+            ),
+        ]:
+            expected = [new_hasher().absorb(x).finalize().read(32) for x in inputs]
+            self.assertEqual([context.digest(x) for x in inputs], expected)
+            self.assertEqual(context.digest_batch(inputs), b"".join(expected))
+            self.assertEqual(context.digest_batch(inputs, 0), b"")
+
+            # every hasher starts from an independent copy of the context
+            xof = context.hasher(b"a")
+            context.hasher().absorb(b"b")
+            self.assertEqual(
+                xof.absorb(inputs[2]).finalize().read(32),
+                new_hasher().absorb(b"a" + inputs[2]).finalize().read(32),
+            )
+
+    def test_modes_are_distinct(self):
+        key = bytes(32)
+        outputs = {
+            Blake3(b"input").finalize().read(32),
+            Blake3(b"input", key=key).finalize().read(32),
+            Blake3.derive_key("context", b"input").finalize().read(32),
+            Blake3.derive_key("other context", b"input").finalize().read(32),
+        }
+        self.assertEqual(len(outputs), 4)
+
+    def test_invalid_key(self):
+        for key in [b"", bytes(31), bytes(33)]:
+            self.assertRaises(ValueError, lambda: Blake3(key=key))
+            self.assertRaises(ValueError, lambda: Blake3KeyContext(key=key))
+        self.assertRaises(TypeError, lambda: Blake3(key="a" * 32))
+        self.assertRaises(ValueError, lambda: Blake3KeyContext())
+        self.assertRaises(
+            ValueError, lambda: Blake3KeyContext(key=bytes(32), context="context")
+        )
@@ -0,0 +1,39 @@
+import copy
+import unittest
+from utilities import XOF_CLASSES
+
+
+class TestCopy(unittest.TestCase):
+    def test_shaker_copy(self):
+        for Xof in XOF_CLASSES:
+            prefix = Xof(b"a long shared prefix")
+            for copy_fn in [lambda x: x.copy(), copy.copy, copy.deepcopy]:
+                xof1 = copy_fn(prefix).absorb(b"suffix 1").finalize()
+                xof2 = copy_fn(prefix).absorb(b"suffix 2").finalize()
+                self.assertEqual(
+                    xof1.read(100),
+                    Xof(b"a long shared prefix").absorb(b"suffix 1").finalize().read(100),
+                )
+                self.assertEqual(
+                    xof2.read(100),
+                    Xof(b"a long shared prefixsuffix 2").finalize().read(100),
+                )
+
+            # the original prefix is unchanged by the copies
+            self.assertEqual(
+                prefix.finalize().read(100),
+                Xof(b"a long shared prefix").finalize().read(100),
+            )
+
+    def test_sponge_copy(self):
+        for Xof in XOF_CLASSES:
+            xof = Xof(b"testing copies").finalize()
+            xof.read(123)
+            for copy_fn in [lambda x: x.copy(), copy.copy, copy.deepcopy]:
+                xof_copy = copy_fn(xof)
+                self.assertEqual(xof_copy.read(1000), xof.copy().read(1000))
+
+            # reading from a copy does not advance the original
+            expected = xof.copy().read(100)
+            xof.copy().read(100)
+            self.assertEqual(xof.read(100), expected)
@@ -0,0 +1,157 @@
+import os
+import random
+import subprocess
+import sys
+import sysconfig
+import threading
+import unittest
+from utilities import XOF_CLASSES
+from xoflib import XofRandom
+
+
+THREAD_COUNT = 8
+
+FREE_THREADED = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+
+def run_threads(target, count=THREAD_COUNT):
+    """
+    Run `target(i)` on `count` threads which all start at once, returning the
+    results in order and re-raising the first exception
+    """
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    errors = []
+
+    def run(i):
+        barrier.wait()
+        try:
+            results[i] = target(i)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def mixed_workload(Xof, seed):
+    """
+    Absorb and read chunks of varying sizes, returning every read
+    """
+    rng = random.Random(seed)
+    chunks = [rng.randbytes(rng.choice([0, 1, 100, 5000, 70000])) for _ in range(20)]
+
+    xof = Xof(chunks[0])
+    xof.absorb_many(chunks[1:10])
+    for chunk in chunks[10:]:
+        xof.absorb(chunk)
+    sponge = xof.finalize()
+
+    out = [sponge.read(rng.choice([1, 32, 5000]))]
+    buf = bytearray(rng.choice([16, 8192]))
+    sponge.read_into(buf)
+    out.append(bytes(buf))
+    out.extend(sponge.read_many([7, 9000, 64]))
+    return out
+
+
+class TestFreeThreading(unittest.TestCase):
+    @unittest.skipUnless(FREE_THREADED, "requires a free-threaded build of Python")
+    def test_gil_stays_disabled(self):
+        code = "import sys, xoflib; print(sys._is_gil_enabled())"
+        env = {k: v for k, v in os.environ.items() if k != "PYTHON_GIL"}
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+        self.assertEqual(output.stdout.strip(), "False")
+
+    def test_independent_objects(self):
+        # Every thread hashes with its own objects, which must give the same
+        # output as running the work on a single thread
+        for Xof in XOF_CLASSES:
+            expected = [mixed_workload(Xof, i) for i in range(THREAD_COUNT)]
+            for _ in range(5):
+                output = run_threads(lambda i: mixed_workload(Xof, i))
+                self.assertEqual(output, expected)
+
+    def test_shared_buffer(self):
+        # Many threads may absorb the same immutable input at once
+        data = os.urandom(2**16 + 3)
+        for Xof in XOF_CLASSES:
+            expected = Xof(data).finalize().read(64)
+            output = run_threads(lambda _: Xof(data).finalize().read(64))
+            self.assertEqual(output, [expected] * THREAD_COUNT)
+
+    def test_shared_shaker(self):
+        # Every call on a shared shaker absorbs its whole input before or after
+        # the others, so absorbing the same chunk from every thread gives the
+        # same state as absorbing all of the chunks on one thread
+        chunk = os.urandom(5000)
+        absorbs = 16
+        for Xof in XOF_CLASSES:
+            xof = Xof()
+
+            def absorb(_):
+                for _ in range(absorbs):
+                    xof.absorb(chunk)
+
+            run_threads(absorb)
+            expected = Xof(chunk * absorbs * THREAD_COUNT).finalize().read(64)
+            self.assertEqual(xof.finalize().read(64), expected)
+
+    def test_shared_sponge(self):
+        # Concurrent calls on one sponge each read the next chunk of the
+        # stream, they never fail and are never interleaved
+        n = 2**13
+        reads = 16
+        for Xof in XOF_CLASSES:
+            sponge = Xof(b"shared").finalize()
+            stream = sponge.copy().read(n * reads * THREAD_COUNT)
+            chunks = [stream[i : i + n] for i in range(0, len(stream), n)]
+
+            output = run_threads(lambda _: [sponge.read(n) for _ in range(reads)])
+            output = [chunk for out in output for chunk in out]
+            self.assertEqual(sorted(output), sorted(chunks))
+
+    def test_shared_sponge_read_many(self):
+        # A single read_many() call returns consecutive output even when other
+        # threads read from the same sponge
+        sizes = [1, 100, 5000, 32]
+        total = sum(sizes)
+        for Xof in XOF_CLASSES:
+            sponge = Xof(b"shared").finalize()
+            stream = sponge.copy().read(total * THREAD_COUNT)
+
+            output = run_threads(lambda _: b"".join(sponge.read_many(sizes)))
+            self.assertEqual(
+                sorted(output),
+                sorted(stream[i : i + total] for i in range(0, len(stream), total)),
+            )
+
+    def test_shared_xof_random(self):
+        # XofRandom locks its state, so sharing one between threads works and
+        # every draw comes from a distinct part of the stream
+        n = 32
+        draws = 200
+        rng = XofRandom(b"seed")
+        stream = XofRandom(b"seed").randbytes(n * draws * THREAD_COUNT)
+
+        output = run_threads(lambda _: [rng.randbytes(n) for _ in range(draws)])
+        output = [chunk for out in output for chunk in out]
+        self.assertEqual(
+            sorted(output), sorted(stream[i : i + n] for i in range(0, len(stream), n))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import random
+import unittest
+from test_kangaroo_twelve_data import kt128_test_vectors, kt256_test_vectors
+from xoflib import kt128, kt256, KangarooTwelve, KT128, KT256
+
+
+class TestKangarooTwelveDocumentation(unittest.TestCase):
+    def parsed_data_test(self, kt, vectors):
+        for test_vector in vectors:
+            output = kt(test_vector["msg"], test_vector["customization"]).read(
+                test_vector["out_len"]
+            )
+            if test_vector.get("last"):
+                last = test_vector.get("last")
+                output = output[-last:]
+            output_kat = bytes.fromhex(test_vector["output_bytes"].replace(" ", ""))
+            self.assertEqual(output, output_kat)
+
+    def test_kt128(self):
+        # The one-shot function is checked directly, not only through KT128
+        self.parsed_data_test(kt128, kt128_test_vectors)
+
+    def test_kt256(self):
+        self.parsed_data_test(kt256, kt256_test_vectors)
+
+    def test_kt128_class(self):
+        self.parsed_data_test(lambda m, c: KT128(m, c).finalize(), kt128_test_vectors)
+
+    def test_kt256_class(self):
+        self.parsed_data_test(lambda m, c: KT256(m, c).finalize(), kt256_test_vectors)
+
+
+class TestKangarooTwelve(unittest.TestCase):
+    def chunked_absorb(self, KT, kt):
+        # Cover messages on either side of the 8KiB chunk boundaries
+        for msg_len in [0, 1, 8191, 8192, 8193, 3 * 8192, 3 * 8192 + 1, 100_000]:
+            msg = os.urandom(msg_len)
+            customization = os.urandom(random.randint(0, 10_000))
+            xof = KT(customization=customization)
+            i = 0
+            while i < msg_len:
+                j = i + random.choice([1, 100, 8191, 8192, 8193, 50_000])
+                xof.absorb(msg[i:j])
+                i = j
+
+            expected = kt(msg, customization).read(100)
+            self.assertEqual(xof.finalize().read(100), expected)
+
+            # finalize resets the state but keeps the customization string
+            self.assertEqual(xof.absorb(msg).finalize().read(100), expected)
+
+    def test_kt128_chunked_absorb(self):
+        self.chunked_absorb(KT128, kt128)
+
+    def test_kt256_chunked_absorb(self):
+        self.chunked_absorb(KT256, kt256)
+
+    def test_kangaroo_twelve_alias(self):
+        self.assertIs(KangarooTwelve, KT128)
+
+    def test_customization(self):
+        a = kt128(b"testing kangaroo twelve").read(32)
+        b = kt128(b"testing kangaroo twelve", b"custom").read(32)
+        c = KT128(b"testing kangaroo twelve", b"custom").finalize().read(32)
+        self.assertNotEqual(a, b)
+        self.assertEqual(b, c)
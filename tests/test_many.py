@@ -0,0 +1,136 @@
+import os
+import random
+import unittest
+from utilities import XOF_CLASSES
+from xoflib import (
+    AsconAXof,
+    AsconXof,
+    Blake3,
+    KT128,
+    KT256,
+    Shake128,
+    Shake256,
+    TurboShake128,
+    TurboShake256,
+    ascon_xof_many,
+    ascona_xof_many,
+    blake3_xof_many,
+    kt128_many,
+    kt256_many,
+    shake128_many,
+    shake256_many,
+    turbo_shake128_many,
+    turbo_shake256_many,
+)
+
+
+class TestMany(unittest.TestCase):
+    def test_absorb_many(self):
+        fields = [os.urandom(random.randint(0, 64)) for _ in range(1000)]
+        fields.append(os.urandom(100_000))
+        for Xof in XOF_CLASSES:
+            expected = Xof(b"prefix" + b"".join(fields)).finalize().read(100)
+            xof = Xof(b"prefix").absorb_many(fields).finalize()
+            self.assertEqual(xof.read(100), expected)
+
+            # Any iterable of buffers is accepted
+            buffers = (bytearray(f) if i % 2 else memoryview(f) for i, f in enumerate(fields))
+            xof = Xof(b"prefix").absorb_many(buffers).finalize()
+            self.assertEqual(xof.read(100), expected)
+
+            xof = Xof(b"prefix").absorb_many([]).finalize()
+            self.assertEqual(xof.read(100), Xof(b"prefix").finalize().read(100))
+
+    def test_absorb_many_invalid(self):
+        xof = Shake128(b"prefix")
+        with self.assertRaises(TypeError):
+            xof.absorb_many([b"valid", "not a buffer"])
+        with self.assertRaises(TypeError):
+            xof.absorb_many(b"abc")
+        # Nothing was absorbed by the failed calls
+        self.assertEqual(xof.finalize().read(32), Shake128(b"prefix").finalize().read(32))
+
+    def test_read_many(self):
+        sizes = [random.randint(0, 64) for _ in range(1000)] + [100_000]
+        for Xof in XOF_CLASSES:
+            xof1 = Xof(b"read many").finalize()
+            xof2 = Xof(b"read many").finalize()
+            chunks = xof1.read_many(sizes)
+            self.assertEqual(chunks, [xof2.read(n) for n in sizes])
+            self.assertEqual(xof1.read_many(iter([])), [])
+            self.assertEqual(xof1.read(32), xof2.read(32))
+
+    def test_read_many_invalid(self):
+        xof1 = Shake128(b"read many").finalize()
+        with self.assertRaises(OverflowError):
+            xof1.read_many([16, -1])
+        # Nothing was read by the failed call
+        xof2 = Shake128(b"read many").finalize()
+        self.assertEqual(xof1.read(32), xof2.read(32))
+
+    def test_read_into_many(self):
+        sizes = [random.randint(0, 64) for _ in range(1000)] + [100_000]
+        for Xof in XOF_CLASSES:
+            xof1 = Xof(b"read many").finalize()
+            xof2 = Xof(b"read many").finalize()
+            buffers = [bytearray(n) for n in sizes]
+            xof1.read_into_many(buffers)
+            self.assertEqual(buffers, [xof2.read(n) for n in sizes])
+            self.assertEqual(xof1.read(32), xof2.read(32))
+
+    def test_read_into_many_repeated_buffer(self):
+        xof1 = Shake128(b"read many").finalize()
+        xof2 = Shake128(b"read many").finalize()
+        buf = bytearray(16)
+        xof1.read_into_many([buf, buf])
+        xof2.read(16)
+        self.assertEqual(buf, xof2.read(16))
+
+    def test_read_into_many_invalid(self):
+        xof1 = Shake128(b"read many").finalize()
+        with self.assertRaises(TypeError):
+            xof1.read_into_many([bytearray(16), b"immutable"])
+        xof2 = Shake128(b"read many").finalize()
+        self.assertEqual(xof1.read(32), xof2.read(32))
+
+
+MANY_FUNCTIONS = [
+    (AsconXof, ascon_xof_many),
+    (AsconAXof, ascona_xof_many),
+    (Blake3, blake3_xof_many),
+    (KT128, kt128_many),
+    (KT256, kt256_many),
+    (Shake128, shake128_many),
+    (Shake256, shake256_many),
+    (lambda data: TurboShake128(1, data), lambda *a, **k: turbo_shake128_many(1, *a, **k)),
+    (lambda data: TurboShake256(1, data), lambda *a, **k: turbo_shake256_many(1, *a, **k)),
+]
+
+
+class TestManyFunctions(unittest.TestCase):
+    def test_many(self):
+        messages = [os.urandom(random.randint(0, 200)) for _ in range(1000)]
+        messages.append(os.urandom(100_000))
+        for Xof, xof_many in MANY_FUNCTIONS:
+            expected = [Xof(m).finalize().read(33) for m in messages]
+            self.assertEqual(xof_many(messages, 33), expected)
+            for threads in [1, 3]:
+                self.assertEqual(xof_many(iter(messages), 33, threads=threads), expected)
+
+            self.assertEqual(xof_many([], 33), [])
+            self.assertEqual(xof_many(messages[:5], 0), [b""] * 5)
+
+    def test_kangaroo_twelve_customization(self):
+        messages = [os.urandom(random.randint(0, 200)) for _ in range(100)]
+        for KT, kt_many in [(KT128, kt128_many), (KT256, kt256_many)]:
+            expected = [KT(m, b"custom").finalize().read(32) for m in messages]
+            self.assertEqual(kt_many(messages, 32, b"custom"), expected)
+            self.assertEqual(kt_many(messages, 32, customization=b"custom", threads=2), expected)
+
+    def test_many_invalid(self):
+        with self.assertRaises(ValueError):
+            shake128_many([b"a"], 16, threads=0)
+        with self.assertRaises(TypeError):
+            shake128_many([b"a", "not a buffer"], 16)
+        with self.assertRaises(ValueError):
+            turbo_shake128_many(0, [b"a"], 16)
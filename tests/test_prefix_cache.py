@@ -0,0 +1,58 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from xoflib import Blake3, PrefixCache, Shake256, TurboShake128
+
+
+class TestPrefixCache(unittest.TestCase):
+    def test_cached_prefix(self):
+        for algorithm in [Blake3, Shake256, lambda: TurboShake128(1)]:
+            cache = PrefixCache(algorithm)
+            expected = algorithm().absorb(b"prefix").absorb(b"message").finalize()
+            expected = expected.read(100)
+            for _ in range(3):
+                xof = cache.get(b"prefix").absorb(b"message").finalize()
+                self.assertEqual(xof.read(100), expected)
+            self.assertEqual((cache.hits, cache.misses, len(cache)), (2, 1, 1))
+
+    def test_custom_key(self):
+        cache = PrefixCache(Shake256)
+        xof1 = cache.get(b"a" * 10_000, key=b"key").finalize()
+        xof2 = cache.get(b"different prefix", key=b"key").finalize()
+        self.assertEqual(xof1.read(32), xof2.read(32))
+        self.assertEqual(xof1.read(32), Shake256(b"a" * 10_000).finalize().read(64)[32:])
+
+    def test_lru_eviction(self):
+        cache = PrefixCache(Shake256, maxsize=2)
+        cache.get(b"a")
+        cache.get(b"b")
+        cache.get(b"a")  # b is now least recently used
+        cache.get(b"c")  # evicts b
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        cache.get(b"a")
+        cache.get(b"b")
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_maxsize_zero(self):
+        cache = PrefixCache(Shake256, maxsize=0)
+        cache.get(b"a")
+        cache.get(b"a")
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 2))
+
+    def test_threaded_access(self):
+        cache = PrefixCache(Shake256, maxsize=8)
+        prefixes = [bytes([i % 16]) * 2**13 for i in range(256)]
+
+        def digest(prefix):
+            return cache.get(prefix).absorb(b"message").finalize().read(32)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            output = list(executor.map(digest, prefixes))
+
+        for prefix, out in zip(prefixes, output):
+            self.assertEqual(out, Shake256(prefix + b"message").finalize().read(32))
+        self.assertEqual(cache.hits + cache.misses, len(prefixes))
+        self.assertLessEqual(len(cache), 8)
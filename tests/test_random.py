@@ -0,0 +1,87 @@
+import copy
+import random
+import unittest
+from xoflib import Blake3, Shake128, Shake256, TurboShake128, TurboShake256, XofRandom
+
+ALGORITHMS = {
+    "turboshake128": lambda seed: TurboShake128(0x1F, seed),
+    "turboshake256": lambda seed: TurboShake256(0x1F, seed),
+    "shake128": Shake128,
+    "shake256": Shake256,
+    "blake3": Blake3,
+}
+
+
+class TestXofRandom(unittest.TestCase):
+    def test_is_random(self):
+        rng = XofRandom(b"seed")
+        self.assertIsInstance(rng, random.Random)
+        self.assertEqual(rng.__class__.__module__, "xoflib")
+
+    def test_matches_xof(self):
+        for algorithm, Xof in ALGORITHMS.items():
+            rng = XofRandom(b"seed", algorithm=algorithm)
+            xof = Xof(b"seed").finalize()
+
+            # randbytes reads through the internal buffer, and directly from
+            # the XOF for large requests
+            for n in [1, 7, 100, 5000, 10_000]:
+                self.assertEqual(rng.randbytes(n), xof.read(n))
+
+            for k in [0, 1, 8, 13, 64, 65, 1000]:
+                n = (k + 7) // 8
+                expected = int.from_bytes(xof.read(n), "little") % 2**k
+                self.assertEqual(rng.getrandbits(k), expected)
+
+            x = int.from_bytes(xof.read(8), "little") >> 11
+            self.assertEqual(rng.random(), x / 2**53)
+
+    def test_default_algorithm(self):
+        rng1 = XofRandom(b"seed")
+        rng2 = XofRandom(b"seed", algorithm="turboshake128")
+        self.assertEqual(rng1.randbytes(100), rng2.randbytes(100))
+
+    def test_seeds(self):
+        for seed in [b"seed", bytearray(b"seed"), "seed", 0, 12345, -1, 2**100]:
+            rng1 = XofRandom(seed)
+            rng2 = XofRandom(seed)
+            self.assertEqual(rng1.random(), rng2.random())
+
+        self.assertEqual(XofRandom("seed").random(), XofRandom(b"seed").random())
+        self.assertNotEqual(XofRandom(1).random(), XofRandom(-1).random())
+        self.assertNotEqual(XofRandom().random(), XofRandom().random())
+
+    def test_reseed(self):
+        rng = XofRandom(b"seed", algorithm="blake3")
+        a = [rng.random() for _ in range(10)]
+        rng.seed(b"seed")
+        self.assertEqual(a, [rng.random() for _ in range(10)])
+
+    def test_methods(self):
+        rng = XofRandom(b"seed")
+        for _ in range(1000):
+            self.assertTrue(0 <= rng.random() < 1)
+            self.assertTrue(0 <= rng.randrange(3329) < 3329)
+            self.assertIn(rng.choice("abc"), "abc")
+        items = list(range(100))
+        rng.shuffle(items)
+        self.assertEqual(sorted(items), list(range(100)))
+        self.assertEqual(len(rng.sample(range(1000), 10)), 10)
+
+    def test_state(self):
+        rng = XofRandom(b"seed", algorithm="shake256")
+        rng.random()
+        state = rng.getstate()
+        a = [rng.random() for _ in range(10)]
+        rng.setstate(state)
+        self.assertEqual(a, [rng.random() for _ in range(10)])
+
+        for copy_fn in [copy.copy, copy.deepcopy]:
+            rng_copy = copy_fn(rng)
+            self.assertEqual(rng_copy.randbytes(100), rng.randbytes(100))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            XofRandom(b"seed", algorithm="md5")
+        with self.assertRaises(ValueError):
+            XofRandom(b"seed").getrandbits(-1)
@@ -0,0 +1,54 @@
+import unittest
+from utilities import TUPLE_HASH_CLASSES, XOF_CLASSES
+from xoflib import Shake128
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestReadArray(unittest.TestCase):
+    def test_matches_read(self):
+        for Xof in XOF_CLASSES + TUPLE_HASH_CLASSES:
+            for dtype, shape in [
+                (np.uint8, 100),
+                (np.uint16, (3, 5)),
+                (np.int32, (2, 3, 4)),
+                (np.uint64, ()),
+                ("<u4", 1000),
+                (">i8", (10, 10)),
+                (np.float64, 7),
+                (np.complex128, 3),
+            ]:
+                xof1 = Xof(b"array").finalize()
+                xof2 = Xof(b"array").finalize()
+                a = xof1.read_array(dtype, shape)
+                self.assertEqual(a.dtype, np.dtype(dtype))
+                self.assertEqual(a.shape, np.empty(shape).shape)
+                self.assertTrue(a.flags.c_contiguous)
+                self.assertTrue(a.flags.aligned)
+                self.assertEqual(a.tobytes(), xof2.read(a.nbytes))
+
+                # the position is advanced by the size of the array
+                self.assertEqual(xof1.read(32), xof2.read(32))
+
+    def test_empty_array(self):
+        xof = Shake128(b"array").finalize()
+        a = xof.read_array(np.uint32, (0, 4))
+        self.assertEqual(a.shape, (0, 4))
+        self.assertEqual(xof.read(32), Shake128(b"array").finalize().read(32))
+
+    def test_invalid_dtype(self):
+        xof = Shake128(b"array").finalize()
+        for dtype in [object, bool, "U4", [("a", np.uint8)]]:
+            with self.assertRaises(TypeError):
+                xof.read_array(dtype, 4)
+
+    def test_fill_existing_array(self):
+        xof1 = Shake128(b"array").finalize()
+        xof2 = Shake128(b"array").finalize()
+        a = np.zeros((8, 8), dtype=np.uint32)
+        xof1.read_into(a.view(np.uint8))
+        self.assertEqual(a.tobytes(), xof2.read(a.nbytes))
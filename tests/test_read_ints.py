@@ -0,0 +1,75 @@
+import os
+import unittest
+from array import array
+from utilities import TUPLE_HASH_CLASSES, XOF_CLASSES
+from xoflib import Shake128
+
+
+def unpack_ints(data, count, bits):
+    """
+    Parse `count` consecutive little-endian `bits`-bit fields from `data`
+    """
+    x = int.from_bytes(data, "little")
+    return [(x >> (bits * i)) & ((1 << bits) - 1) for i in range(count)]
+
+
+class TestReadInts(unittest.TestCase):
+    def test_read_uint(self):
+        for Xof in XOF_CLASSES + TUPLE_HASH_CLASSES:
+            xof = Xof(os.urandom(32)).finalize()
+            for byteorder in ("little", "big"):
+                for nbytes in [0, 1, 8, 15, 16, 17, 100]:
+                    expected = int.from_bytes(xof.copy().read(nbytes), byteorder)
+                    self.assertEqual(xof.read_uint(nbytes, byteorder), expected)
+
+    def test_read_uint_byteorder(self):
+        xof = Shake128(b"xoflib").finalize()
+        with self.assertRaises(ValueError):
+            xof.read_uint(8, "middle")
+
+    def test_read_ints(self):
+        for Xof in XOF_CLASSES + TUPLE_HASH_CLASSES:
+            xof = Xof(os.urandom(32)).finalize()
+            for bits in [1, 3, 8, 12, 23, 32, 63, 64]:
+                for count in [0, 1, 7, 256]:
+                    nbytes = (count * bits + 7) // 8
+                    expected = unpack_ints(xof.copy().read(nbytes), count, bits)
+                    self.assertEqual(xof.read_ints(count, bits), expected)
+
+    def test_read_ints_into(self):
+        for Xof in XOF_CLASSES + TUPLE_HASH_CLASSES:
+            xof = Xof(os.urandom(32)).finalize()
+            for typecode, bits in [("B", 5), ("H", 12), ("I", 23), ("Q", 64)]:
+                out = array(typecode, [0] * 300)
+                expected = xof.copy().read_ints(256, bits)
+                self.assertIsNone(xof.read_ints(256, bits, into=out))
+                self.assertEqual(out[:256].tolist(), expected)
+                self.assertEqual(out[256:].tolist(), [0] * 44)
+
+    def test_read_ints_continues_stream(self):
+        for Xof in XOF_CLASSES + TUPLE_HASH_CLASSES:
+            xof = Xof(b"xoflib").finalize()
+            copy = xof.copy()
+            xof.read_ints(8, 16)
+            self.assertEqual(xof.read(16), copy.read(32)[16:])
+
+    def test_read_ints_errors(self):
+        xof = Shake128(b"xoflib").finalize()
+        copy = xof.copy()
+        with self.assertRaises(ValueError):
+            xof.read_ints(10, 0)
+        with self.assertRaises(ValueError):
+            xof.read_ints(10, 65)
+        with self.assertRaises(ValueError):
+            xof.read_ints(10, 12, into=array("B", bytes(10)))
+        with self.assertRaises(ValueError):
+            xof.read_ints(10, 12, into=array("H", bytes(18)))
+        with self.assertRaises(TypeError):
+            xof.read_ints(10, 8, into=bytes(10))
+
+        # Errors do not consume any output
+        self.assertEqual(xof.read(32), copy.read(32))
+
+
+if __name__ == "__main__":
+    unittest.main()
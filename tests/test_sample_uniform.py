@@ -0,0 +1,73 @@
+import unittest
+from array import array
+from utilities import TUPLE_HASH_CLASSES, XOF_CLASSES
+from xoflib import Shake128
+
+
+def ml_kem_sample(xof, q):
+    """
+    Rejection sampling from ML-KEM (FIPS 203, Algorithm 7)
+    """
+    coeffs = []
+    while len(coeffs) < 256:
+        c = xof.read(3)
+        d1 = c[0] + 256 * (c[1] % 16)
+        d2 = (c[1] >> 4) + 16 * c[2]
+        if d1 < q:
+            coeffs.append(d1)
+        if d2 < q and len(coeffs) < 256:
+            coeffs.append(d2)
+    return coeffs
+
+
+def ml_dsa_sample(xof, q):
+    """
+    Rejection sampling from ML-DSA (FIPS 204, Algorithm 30)
+    """
+    coeffs = []
+    while len(coeffs) < 256:
+        c = xof.read(3)
+        z = c[0] + (c[1] << 8) + ((c[2] & 0x7F) << 16)
+        if z < q:
+            coeffs.append(z)
+    return coeffs
+
+
+class TestSampleUniform(unittest.TestCase):
+    def test_ml_kem_sampling(self):
+        for Xof in XOF_CLASSES + TUPLE_HASH_CLASSES:
+            xof1 = Xof(b"ML-KEM seed").finalize()
+            xof2 = Xof(b"ML-KEM seed").finalize()
+            for _ in range(3):
+                poly = array("H", bytes(512))
+                xof1.sample_uniform(poly, 3329, 12)
+                self.assertEqual(poly.tolist(), ml_kem_sample(xof2, 3329))
+
+            # The stream position matches after sampling
+            self.assertEqual(xof1.read(16), xof2.read(16))
+
+    def test_ml_dsa_sampling(self):
+        for Xof in XOF_CLASSES + TUPLE_HASH_CLASSES:
+            xof1 = Xof(b"ML-DSA seed").finalize()
+            xof2 = Xof(b"ML-DSA seed").finalize()
+            for _ in range(3):
+                poly = array("I", bytes(1024))
+                xof1.sample_uniform(poly, 8380417, 23, stride=24)
+                self.assertEqual(poly.tolist(), ml_dsa_sample(xof2, 8380417))
+            self.assertEqual(xof1.read(16), xof2.read(16))
+
+    def test_invalid_parameters(self):
+        xof = Shake128().finalize()
+        self.assertRaises(ValueError, xof.sample_uniform, array("H", [0]), 0, 12)
+        self.assertRaises(ValueError, xof.sample_uniform, array("H", [0]), 4097, 12)
+        self.assertRaises(ValueError, xof.sample_uniform, array("H", [0]), 7, 0)
+        self.assertRaises(ValueError, xof.sample_uniform, array("H", [0]), 7, 12, 8)
+        self.assertRaises(ValueError, xof.sample_uniform, array("H", [0]), 7, 33)
+        self.assertRaises(
+            ValueError, xof.sample_uniform, array("H", [0]), 8380417, 23, 24
+        )
+        self.assertRaises(BufferError, xof.sample_uniform, bytearray(4), 7, 12)
+
+        # The error for a readonly 16-bit array is not hidden by the 32-bit retry
+        readonly = memoryview(array("H", [0])).toreadonly()
+        self.assertRaises(TypeError, xof.sample_uniform, readonly, 7, 12)
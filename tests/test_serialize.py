@@ -0,0 +1,105 @@
+import copy
+import os
+import pickle
+import unittest
+from utilities import TUPLE_HASH_CLASSES, XOF_CLASSES
+from xoflib import (
+    AsconAXof,
+    AsconXof,
+    Blake3,
+    Shake128,
+    Shake256,
+    TurboShake128,
+    TurboShake256,
+)
+
+PRIVATE_STATE_CLASSES = [AsconXof, AsconAXof, Blake3]
+
+SERIALIZABLE_CLASSES = [
+    Xof for Xof in XOF_CLASSES + TUPLE_HASH_CLASSES if Xof not in PRIVATE_STATE_CLASSES
+] + [lambda data=None: TurboShake256(0x7F, data)]
+
+
+class TestSerialize(unittest.TestCase):
+    def test_shaker_round_trip(self):
+        # Cover states part way through a block, at block boundaries and, for
+        # KangarooTwelve, inside the tree of chunks
+        for Xof in SERIALIZABLE_CLASSES:
+            for size in [0, 1, 135, 136, 168, 169, 8191, 8192, 8193, 3 * 8192 + 7]:
+                data = os.urandom(size)
+                xof = Xof(data)
+                restored = type(xof).from_bytes(xof.to_bytes())
+                self.assertEqual(restored.to_bytes(), xof.to_bytes())
+
+                # Both continue identically after restoring
+                restored.absorb(b"suffix")
+                xof.absorb(b"suffix")
+                self.assertEqual(restored.finalize().read(200), xof.finalize().read(200))
+
+    def test_sponge_round_trip(self):
+        for Xof in SERIALIZABLE_CLASSES:
+            for offset in [0, 1, 135, 136, 168, 169, 1000]:
+                sponge = Xof(b"abc").finalize()
+                sponge.read(offset)
+                restored = type(sponge).from_bytes(bytearray(sponge.to_bytes()))
+                self.assertEqual(restored.read(500), sponge.read(500))
+
+    def test_pickle(self):
+        for Xof in SERIALIZABLE_CLASSES:
+            xof = Xof(b"pickled")
+            sponge = xof.copy().finalize()
+            sponge.read(10)
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                shaker_copy = pickle.loads(pickle.dumps(xof, protocol))
+                sponge_copy = pickle.loads(pickle.dumps(sponge, protocol))
+                self.assertIs(type(shaker_copy), type(xof))
+                self.assertEqual(
+                    shaker_copy.finalize().read(32), xof.copy().finalize().read(32)
+                )
+                self.assertEqual(sponge_copy.read(32), sponge.copy().read(32))
+
+    def test_copy_unaffected(self):
+        # copy() and the copy module do not go through the serialized state
+        for Xof in SERIALIZABLE_CLASSES + PRIVATE_STATE_CLASSES:
+            xof = Xof(b"abc")
+            self.assertEqual(
+                copy.copy(xof).finalize().read(16), xof.finalize().read(16)
+            )
+
+    def test_private_state(self):
+        for Xof in PRIVATE_STATE_CLASSES:
+            xof = Xof(b"abc")
+            sponge = xof.copy().finalize()
+            for obj in [xof, sponge]:
+                with self.assertRaises(TypeError):
+                    obj.to_bytes()
+                with self.assertRaises(TypeError):
+                    pickle.dumps(obj)
+
+    def test_invalid_state(self):
+        state = Shake128(b"abc").to_bytes()
+        sponge_state = Shake128(b"abc").finalize().to_bytes()
+
+        invalid = [
+            b"",
+            state[:1],
+            bytes([state[0] + 1]) + state[1:],
+            state[:-1],
+            state + b"\x00",
+            sponge_state,
+        ]
+        for data in invalid:
+            with self.assertRaises(ValueError):
+                Shake128.from_bytes(data)
+
+        # The state of one algorithm is not accepted by another
+        with self.assertRaises(ValueError):
+            Shake256.from_bytes(state)
+        with self.assertRaises(ValueError):
+            TurboShake128.from_bytes(state)
+        with self.assertRaises(ValueError):
+            type(Shake128().finalize()).from_bytes(state)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import hashlib
 import unittest
 import os
 import random
@@ -6,9 +7,12 @@ from xoflib import (
     Shake256,
     shake128,
     shake256,
+    shake128_batch,
+    shake256_batch,
 )
 
 import sys
+from utilities import piece_lengths, piece_patterns
 
 if sys.version_info >= (3, 12):
     from collections.abc import Buffer
@@ -117,6 +121,58 @@ class TestShakeKAT(unittest.TestCase):
         )
 
 
+class TestShakeSplitKAT(unittest.TestCase):
+    """
+    Absorb the message and read the output of every KAT in pieces, so that
+    calls start and end at every offset within a lane and either side of the
+    rate boundary
+    """
+
+    def kat_vectors(self, filename):
+        """
+        Parse the (message, output) pairs from a KAT file
+        """
+        vectors = []
+        record = {}
+        with open(filename) as f:
+            for line in f:
+                if " = " not in line or line.startswith(("#", "[")):
+                    continue
+                key, value = line.strip().split(" = ")
+                record[key] = value
+                if key == "Output":
+                    msg = bytes.fromhex(record["Msg"])
+                    if "Len" in record:
+                        msg = msg[: int(record["Len"]) // 8]
+                    vectors.append((msg, bytes.fromhex(value)))
+                    record = {}
+        return vectors
+
+    def split_kat(self, Shake, rate, name):
+        for kind in ["ShortMsg", "LongMsg", "VariableOut"]:
+            vectors = self.kat_vectors(f"tests/assets/shake/{name}{kind}.rsp")
+            self.assertGreater(len(vectors), 0)
+            for msg, out in vectors:
+                for pattern in piece_patterns(rate, len(msg)):
+                    xof = Shake()
+                    i = 0
+                    for n in piece_lengths(len(msg), pattern):
+                        xof.absorb(msg[i : i + n])
+                        i += n
+                    self.assertEqual(xof.finalize().read(len(out)), out)
+
+                for pattern in piece_patterns(rate, len(out)):
+                    sponge = Shake(msg).finalize()
+                    lengths = piece_lengths(len(out), pattern)
+                    self.assertEqual(b"".join(sponge.read(n) for n in lengths), out)
+
+    def test_shake128_split_kat(self):
+        self.split_kat(Shake128, 168, "SHAKE128")
+
+    def test_shake256_split_kat(self):
+        self.split_kat(Shake256, 136, "SHAKE256")
+
+
 class TestShakeMonteCarlo(unittest.TestCase):
     """
     Ensure that Shake XOF passes the KAT Monte Carlo test
@@ -185,6 +241,38 @@ class TestShake(unittest.TestCase):
     def test_shake256(self):
         self.class_function_comparison(Shake256, shake256)
 
+    def block_offset_comparison(self, Shake, hashlib_shake, rate):
+        # Split the input and output at every offset within the first blocks, so
+        # that every position in a lane and every lane of the block is used as
+        # the start and the end of a partial block
+        msg = os.urandom(2 * rate + 9)
+        expected = hashlib_shake(msg).digest(2 * rate + 9)
+        for split in range(len(msg) + 1):
+            xof = Shake(msg[:split]).absorb(msg[split:]).finalize()
+            self.assertEqual(xof.read(split) + xof.read(len(msg) - split), expected)
+
+        # One byte at a time
+        xof = Shake()
+        for i in range(len(msg)):
+            xof.absorb(msg[i : i + 1])
+        xof = xof.finalize()
+        self.assertEqual(b"".join(xof.read(1) for _ in range(len(msg))), expected)
+
+        # Pieces of every length up to a block
+        for size in range(1, rate + 1):
+            xof = Shake()
+            for i in range(0, len(msg), size):
+                xof.absorb(msg[i : i + size])
+            xof = xof.finalize()
+            output = b"".join(xof.read(size) for _ in range(0, len(msg), size))
+            self.assertEqual(output[: len(msg)], expected)
+
+    def test_shake128_block_offsets(self):
+        self.block_offset_comparison(Shake128, hashlib.shake_128, 168)
+
+    def test_shake256_block_offsets(self):
+        self.block_offset_comparison(Shake256, hashlib.shake_256, 136)
+
     def accept_buffer_api(self, Shake, shake, data: Buffer):
         xof1 = Shake(data).finalize()
         xof2 = shake(data)
@@ -197,3 +285,22 @@ class TestShake(unittest.TestCase):
         self.accept_buffer_api(
             Shake256, shake256, bytearray(b"bytearrays support __buffer__")
         )
+
+    def batch_comparison(self, shake, shake_batch):
+        # Small batches are hashed in place and large ones in parallel
+        for count in [9, 1000]:
+            inputs = [os.urandom(random.randint(0, 200)) for _ in range(count)]
+            n = 200
+            output = shake_batch(inputs, n)
+            self.assertEqual(len(output), len(inputs) * n)
+            for i, data in enumerate(inputs):
+                self.assertEqual(output[i * n : (i + 1) * n], shake(data).read(n))
+
+        self.assertEqual(shake_batch([], n), b"")
+        self.assertEqual(shake_batch(inputs, 0), b"")
+
+    def test_shake128_batch(self):
+        self.batch_comparison(shake128, shake128_batch)
+
+    def test_shake256_batch(self):
+        self.batch_comparison(shake256, shake256_batch)
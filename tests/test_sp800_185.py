@@ -0,0 +1,343 @@
+import asyncio
+import hashlib
+import os
+import pickle
+import tempfile
+import unittest
+from test_sp800_185_data import (
+    KEY,
+    cshake128_test_vectors,
+    cshake256_test_vectors,
+    kmac128_test_vectors,
+    kmac256_test_vectors,
+    kmac_xof128_test_vectors,
+    kmac_xof256_test_vectors,
+    parallel_hash128_test_vectors,
+    parallel_hash256_test_vectors,
+    parallel_hash_xof128_test_vectors,
+    parallel_hash_xof256_test_vectors,
+    tuple_hash128_test_vectors,
+    tuple_hash256_test_vectors,
+    tuple_hash_xof128_test_vectors,
+    tuple_hash_xof256_test_vectors,
+)
+from xoflib import (
+    CShake128,
+    CShake256,
+    Kmac128,
+    Kmac256,
+    KmacXof128,
+    KmacXof256,
+    ParallelHash128,
+    ParallelHash256,
+    ParallelHashXof128,
+    ParallelHashXof256,
+    TupleHash128,
+    TupleHash256,
+    TupleHashXof128,
+    TupleHashXof256,
+)
+
+
+class TestSP800185Documentation(unittest.TestCase):
+    def parsed_data_test(self, xof, vectors):
+        for test_vector in vectors:
+            output = xof(test_vector).read(test_vector["out_len"])
+            output_kat = bytes.fromhex(test_vector["output_bytes"].replace(" ", ""))
+            self.assertEqual(output, output_kat)
+
+    def test_cshake128(self):
+        self.parsed_data_test(
+            lambda v: CShake128(v["msg"], customization=v["customization"]).finalize(),
+            cshake128_test_vectors,
+        )
+
+    def test_cshake256(self):
+        self.parsed_data_test(
+            lambda v: CShake256(v["msg"], customization=v["customization"]).finalize(),
+            cshake256_test_vectors,
+        )
+
+    def test_kmac128(self):
+        for test_vector in kmac128_test_vectors:
+            mac = Kmac128(
+                test_vector["key"],
+                test_vector["out_len"],
+                test_vector["msg"],
+                test_vector["customization"],
+            )
+            output_kat = bytes.fromhex(test_vector["output_bytes"].replace(" ", ""))
+            self.assertEqual(mac.finalize(), output_kat)
+
+    def test_kmac256(self):
+        for test_vector in kmac256_test_vectors:
+            mac = Kmac256(
+                test_vector["key"],
+                test_vector["out_len"],
+                test_vector["msg"],
+                test_vector["customization"],
+            )
+            output_kat = bytes.fromhex(test_vector["output_bytes"].replace(" ", ""))
+            self.assertEqual(mac.finalize(), output_kat)
+
+    def test_kmac_xof128(self):
+        self.parsed_data_test(
+            lambda v: KmacXof128(v["key"], v["msg"], v["customization"]).finalize(),
+            kmac_xof128_test_vectors,
+        )
+
+    def test_kmac_xof256(self):
+        self.parsed_data_test(
+            lambda v: KmacXof256(v["key"], v["msg"], v["customization"]).finalize(),
+            kmac_xof256_test_vectors,
+        )
+
+    def fixed_output_test(self, hasher, vectors):
+        for test_vector in vectors:
+            output_kat = bytes.fromhex(test_vector["output_bytes"].replace(" ", ""))
+            self.assertEqual(hasher(test_vector).finalize(), output_kat)
+
+    def test_tuple_hash128(self):
+        self.fixed_output_test(
+            lambda v: TupleHash128(v["out_len"], v["tuple"], v["customization"]),
+            tuple_hash128_test_vectors,
+        )
+
+    def test_tuple_hash256(self):
+        self.fixed_output_test(
+            lambda v: TupleHash256(v["out_len"], v["tuple"], v["customization"]),
+            tuple_hash256_test_vectors,
+        )
+
+    def test_tuple_hash_xof128(self):
+        self.parsed_data_test(
+            lambda v: TupleHashXof128(v["tuple"], v["customization"]).finalize(),
+            tuple_hash_xof128_test_vectors,
+        )
+
+    def test_tuple_hash_xof256(self):
+        self.parsed_data_test(
+            lambda v: TupleHashXof256(v["tuple"], v["customization"]).finalize(),
+            tuple_hash_xof256_test_vectors,
+        )
+
+    def test_parallel_hash128(self):
+        self.fixed_output_test(
+            lambda v: ParallelHash128(
+                v["block_size"], v["out_len"], v["msg"], v["customization"]
+            ),
+            parallel_hash128_test_vectors,
+        )
+
+    def test_parallel_hash256(self):
+        self.fixed_output_test(
+            lambda v: ParallelHash256(
+                v["block_size"], v["out_len"], v["msg"], v["customization"]
+            ),
+            parallel_hash256_test_vectors,
+        )
+
+    def test_parallel_hash_xof128(self):
+        self.parsed_data_test(
+            lambda v: ParallelHashXof128(
+                v["block_size"], v["msg"], v["customization"]
+            ).finalize(),
+            parallel_hash_xof128_test_vectors,
+        )
+
+    def test_parallel_hash_xof256(self):
+        self.parsed_data_test(
+            lambda v: ParallelHashXof256(
+                v["block_size"], v["msg"], v["customization"]
+            ).finalize(),
+            parallel_hash_xof256_test_vectors,
+        )
+
+
+class TestSP800185(unittest.TestCase):
+    def test_cshake_is_shake_without_strings(self):
+        for CShake, shake in [
+            (CShake128, hashlib.shake_128),
+            (CShake256, hashlib.shake_256),
+        ]:
+            xof = CShake(b"message").finalize()
+            self.assertEqual(xof.read(100), shake(b"message").digest(100))
+
+    def test_function_name(self):
+        a = CShake128(b"message", customization=b"custom").finalize().read(32)
+        b = CShake128(b"message", b"name", b"custom").finalize().read(32)
+        c = CShake128(b"message", function_name=b"name").finalize().read(32)
+        self.assertEqual(len({a, b, c}), 3)
+
+    def test_finalize_keeps_precomputed_state(self):
+        # finalize resets to the state after the function name, customization
+        # string and key, so the same object can process many messages
+        for make in [
+            lambda: CShake128(customization=b"custom"),
+            lambda: CShake256(function_name=b"name"),
+            lambda: KmacXof128(b"key", customization=b"custom"),
+            lambda: KmacXof256(b"key"),
+            lambda: TupleHashXof128(customization=b"custom"),
+            lambda: ParallelHashXof256(100, customization=b"custom"),
+        ]:
+            xof = make()
+            for msg in [b"first", b"second" * 100, b""]:
+                expected = make().absorb(msg).finalize().read(64)
+                self.assertEqual(xof.absorb(msg).finalize().read(64), expected)
+
+        for Kmac in [Kmac128, Kmac256]:
+            mac = Kmac(b"key", 32, customization=b"custom")
+            for msg in [b"first", b"second" * 100, b""]:
+                expected = Kmac(b"key", 32, msg, b"custom").finalize()
+                self.assertEqual(mac.absorb(msg).finalize(), expected)
+
+        for ParallelHash in [ParallelHash128, ParallelHash256]:
+            hasher = ParallelHash(100, 32, customization=b"custom")
+            for msg in [b"first", b"second" * 100, b""]:
+                expected = ParallelHash(100, 32, msg, b"custom").finalize()
+                self.assertEqual(hasher.absorb(msg).finalize(), expected)
+
+    def test_kmac_output_len(self):
+        # The output length is part of the tag, unlike with the XOF variant
+        for Kmac, KmacXof in [(Kmac128, KmacXof128), (Kmac256, KmacXof256)]:
+            short = Kmac(KEY, 16, bytes(range(4))).finalize()
+            long = Kmac(KEY, 32, bytes(range(4))).finalize()
+            self.assertEqual(len(short), 16)
+            self.assertNotEqual(short, long[:16])
+            self.assertEqual(Kmac(KEY, 16).output_len, 16)
+            self.assertEqual(Kmac(KEY, 0, bytes(range(4))).finalize(), b"")
+
+            xof = KmacXof(KEY, bytes(range(4))).finalize().read(32)
+            self.assertNotEqual(xof, long)
+
+    def test_tuple_hash_elements(self):
+        # Every absorb is one element of the tuple, so moving bytes between
+        # elements changes the hash
+        for TupleHash in [TupleHash128, TupleHash256]:
+            a = TupleHash(32, [b"ab", b"c"]).finalize()
+            b = TupleHash(32, [b"a", b"bc"]).finalize()
+            c = TupleHash(32, [b"abc"]).finalize()
+            self.assertEqual(len({a, b, c}), 3)
+
+            self.assertEqual(TupleHash(32).absorb(b"ab").absorb(b"c").finalize(), a)
+            self.assertEqual(TupleHash(32).absorb_many([b"ab", b"c"]).finalize(), a)
+            self.assertNotEqual(
+                TupleHash(32, [b""]).finalize(), TupleHash(32).finalize()
+            )
+
+    def test_tuple_hash_absorb_file(self):
+        # A file is one element, even when it is read in several chunks
+        data = os.urandom(3 * 2**20 + 5)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.bin")
+            with open(path, "wb") as f:
+                f.write(data)
+            for TupleHashXof in [TupleHashXof128, TupleHashXof256]:
+                expected = TupleHashXof([b"first", data]).finalize().read(32)
+                xof = TupleHashXof([b"first"]).absorb_file(path)
+                self.assertEqual(xof.finalize().read(32), expected)
+            for TupleHash in [TupleHash128, TupleHash256]:
+                expected = TupleHash(32, [b"first", data]).finalize()
+                hasher = TupleHash(32, [b"first"]).absorb_file(path)
+                self.assertEqual(hasher.finalize(), expected)
+
+            # Only the rest of the file after the current offset is the element
+            with open(path, "rb") as f:
+                f.seek(1000)
+                xof = TupleHashXof128().absorb_file(f.fileno())
+                expected = TupleHashXof128([data[1000:]]).finalize().read(32)
+                self.assertEqual(xof.finalize().read(32), expected)
+
+    @unittest.skipUnless(hasattr(os, "pipe"), "requires os.pipe")
+    def test_tuple_hash_absorb_pipe(self):
+        # A pipe has no length up front, but is still a single element
+        # Small enough to fit in the pipe buffer on every platform
+        data = os.urandom(4000)
+        read_fd, write_fd = os.pipe()
+        try:
+            os.write(write_fd, data)
+            os.close(write_fd)
+            xof = TupleHashXof256([b"first"]).absorb_file(read_fd)
+        finally:
+            os.close(read_fd)
+        expected = TupleHashXof256([b"first", data]).finalize().read(32)
+        self.assertEqual(xof.finalize().read(32), expected)
+
+    def test_fixed_output_absorb_file_and_async(self):
+        data = os.urandom(2**20 + 17)
+        hashers = [
+            lambda: Kmac128(KEY, 32),
+            lambda: Kmac256(KEY, 64),
+            lambda: ParallelHash128(1000, 32),
+            lambda: ParallelHash256(1000, 64),
+        ]
+
+        async def absorb_async(hasher, chunks):
+            for chunk in chunks:
+                self.assertIs(await hasher.absorb_async(chunk), hasher)
+            return hasher.finalize()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.bin")
+            with open(path, "wb") as f:
+                f.write(data)
+            for new_hasher in hashers:
+                expected = new_hasher().absorb(data).finalize()
+                self.assertEqual(new_hasher().absorb_file(path).finalize(), expected)
+                with open(path, "rb") as f:
+                    hasher = new_hasher().absorb_file(f.fileno())
+                    self.assertEqual(hasher.finalize(), expected)
+
+                chunks = [data[:1000], bytearray(data[1000:5000]), data[5000:]]
+                self.assertEqual(asyncio.run(absorb_async(new_hasher(), chunks)), expected)
+
+    def test_parallel_hash_split_absorb(self):
+        # The output does not depend on how the input is split between calls,
+        # including partial blocks and absorbs of many whole blocks at once
+        data = os.urandom(50 * 1000 + 123)
+        for ParallelHash in [ParallelHash128, ParallelHash256]:
+            expected = ParallelHash(1000, 32, data).finalize()
+            for cuts in [[1], [999, 1000, 1001], [1500, 30000], [4096, 40000, 50000]]:
+                hasher = ParallelHash(1000, 32)
+                start = 0
+                for cut in cuts + [len(data)]:
+                    hasher.absorb(data[start:cut])
+                    start = cut
+                self.assertEqual(hasher.finalize(), expected)
+
+            self.assertEqual(
+                ParallelHash(1000, 32).absorb_many([data[:7], data[7:]]).finalize(),
+                expected,
+            )
+            self.assertNotEqual(ParallelHash(999, 32, data).finalize(), expected)
+
+    def test_parallel_hash_block_size(self):
+        for ParallelHash in [ParallelHash128, ParallelHash256]:
+            with self.assertRaises(ValueError):
+                ParallelHash(0, 32)
+        for ParallelHashXof in [ParallelHashXof128, ParallelHashXof256]:
+            with self.assertRaises(ValueError):
+                ParallelHashXof(0)
+
+    def test_copy_and_pickle(self):
+        for obj in [
+            CShake128(b"abc", customization=b"custom"),
+            KmacXof256(b"key", b"abc"),
+            TupleHashXof128([b"a", b"bc"]),
+            ParallelHashXof256(8, b"a" * 20),
+        ]:
+            expected = obj.copy().finalize().read(32)
+            restored = pickle.loads(pickle.dumps(obj))
+            self.assertEqual(restored.finalize().read(32), expected)
+
+        for obj in [
+            Kmac128(b"key", 16, b"abc"),
+            TupleHash256(16, [b"a", b"bc"]),
+            ParallelHash128(8, 16, b"a" * 20),
+        ]:
+            restored = pickle.loads(pickle.dumps(obj))
+            self.assertEqual(restored.finalize(), obj.copy().finalize())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,291 @@
+# Test vectors taken from the NIST SP 800-185 example values for cSHAKE, KMAC,
+# KMACXOF, TupleHash, TupleHashXOF, ParallelHash and ParallelHashXOF
+# https://csrc.nist.gov/projects/cryptographic-standards-and-guidelines/example-values
+# Formatted into python dictionaries for easier parsing...
+
+
+KEY = bytes(range(0x40, 0x60))
+
+cshake128_test_vectors = [
+    {
+        "msg": bytes(range(4)),
+        "customization": b"Email Signature",
+        "out_len": 32,
+        "output_bytes": "C1 C3 69 25 B6 40 9A 04 F1 B5 04 FC BC A9 D8 2B 40 17 27 7C B5 ED 2B 20 65 FC 1D 38 14 D5 AA F5",
+    },
+    {
+        "msg": bytes(range(200)),
+        "customization": b"Email Signature",
+        "out_len": 32,
+        "output_bytes": "C5 22 1D 50 E4 F8 22 D9 6A 2E 88 81 A9 61 42 0F 29 4B 7B 24 FE 3D 20 94 BA ED 2C 65 24 CC 16 6B",
+    },
+]
+
+cshake256_test_vectors = [
+    {
+        "msg": bytes(range(4)),
+        "customization": b"Email Signature",
+        "out_len": 64,
+        "output_bytes": "D0 08 82 8E 2B 80 AC 9D 22 18 FF EE 1D 07 0C 48 B8 E4 C8 7B FF 32 C9 69 9D 5B 68 96 EE E0 ED D1 64 02 0E 2B E0 56 08 58 D9 C0 0C 03 7E 34 A9 69 37 C5 61 A7 4C 41 2B B4 C7 46 46 95 27 28 1C 8C",
+    },
+    {
+        "msg": bytes(range(200)),
+        "customization": b"Email Signature",
+        "out_len": 64,
+        "output_bytes": "07 DC 27 B1 1E 51 FB AC 75 BC 7B 3C 1D 98 3E 8B 4B 85 FB 1D EF AF 21 89 12 AC 86 43 02 73 09 17 27 F4 2B 17 ED 1D F6 3E 8E C1 18 F0 4B 23 63 3C 1D FB 15 74 C8 FB 55 CB 45 DA 8E 25 AF B0 92 BB",
+    },
+]
+
+kmac128_test_vectors = [
+    {
+        "msg": bytes(range(4)),
+        "key": KEY,
+        "customization": b"",
+        "out_len": 32,
+        "output_bytes": "E5 78 0B 0D 3E A6 F7 D3 A4 29 C5 70 6A A4 3A 00 FA DB D7 D4 96 28 83 9E 31 87 24 3F 45 6E E1 4E",
+    },
+    {
+        "msg": bytes(range(4)),
+        "key": KEY,
+        "customization": b"My Tagged Application",
+        "out_len": 32,
+        "output_bytes": "3B 1F BA 96 3C D8 B0 B5 9E 8C 1A 6D 71 88 8B 71 43 65 1A F8 BA 0A 70 70 C0 97 9E 28 11 32 4A A5",
+    },
+    {
+        "msg": bytes(range(200)),
+        "key": KEY,
+        "customization": b"My Tagged Application",
+        "out_len": 32,
+        "output_bytes": "1F 5B 4E 6C CA 02 20 9E 0D CB 5C A6 35 B8 9A 15 E2 71 EC C7 60 07 1D FD 80 5F AA 38 F9 72 92 30",
+    },
+]
+
+kmac256_test_vectors = [
+    {
+        "msg": bytes(range(4)),
+        "key": KEY,
+        "customization": b"My Tagged Application",
+        "out_len": 64,
+        "output_bytes": "20 C5 70 C3 13 46 F7 03 C9 AC 36 C6 1C 03 CB 64 C3 97 0D 0C FC 78 7E 9B 79 59 9D 27 3A 68 D2 F7 F6 9D 4C C3 DE 9D 10 4A 35 16 89 F2 7C F6 F5 95 1F 01 03 F3 3F 4F 24 87 10 24 D9 C2 77 73 A8 DD",
+    },
+    {
+        "msg": bytes(range(200)),
+        "key": KEY,
+        "customization": b"",
+        "out_len": 64,
+        "output_bytes": "75 35 8C F3 9E 41 49 4E 94 97 07 92 7C EE 0A F2 0A 3F F5 53 90 4C 86 B0 8F 21 CC 41 4B CF D6 91 58 9D 27 CF 5E 15 36 9C BB FF 8B 9A 4C 2E B1 78 00 85 5D 02 35 FF 63 5D A8 25 33 EC 6B 75 9B 69",
+    },
+    {
+        "msg": bytes(range(200)),
+        "key": KEY,
+        "customization": b"My Tagged Application",
+        "out_len": 64,
+        "output_bytes": "B5 86 18 F7 1F 92 E1 D5 6C 1B 8C 55 DD D7 CD 18 8B 97 B4 CA 4D 99 83 1E B2 69 9A 83 7D A2 E4 D9 70 FB AC FD E5 00 33 AE A5 85 F1 A2 70 85 10 C3 2D 07 88 08 01 BD 18 28 98 FE 47 68 76 FC 89 65",
+    },
+]
+
+kmac_xof128_test_vectors = [
+    {
+        "msg": bytes(range(4)),
+        "key": KEY,
+        "customization": b"",
+        "out_len": 32,
+        "output_bytes": "CD 83 74 0B BD 92 CC C8 CF 03 2B 14 81 A0 F4 46 0E 7C A9 DD 12 B0 8A 0C 40 31 17 8B AC D6 EC 35",
+    },
+    {
+        "msg": bytes(range(4)),
+        "key": KEY,
+        "customization": b"My Tagged Application",
+        "out_len": 32,
+        "output_bytes": "31 A4 45 27 B4 ED 9F 5C 61 01 D1 1D E6 D2 6F 06 20 AA 5C 34 1D EF 41 29 96 57 FE 9D F1 A3 B1 6C",
+    },
+    {
+        "msg": bytes(range(200)),
+        "key": KEY,
+        "customization": b"My Tagged Application",
+        "out_len": 32,
+        "output_bytes": "47 02 6C 7C D7 93 08 4A A0 28 3C 25 3E F6 58 49 0C 0D B6 14 38 B8 32 6F E9 BD DF 28 1B 83 AE 0F",
+    },
+]
+
+kmac_xof256_test_vectors = [
+    {
+        "msg": bytes(range(4)),
+        "key": KEY,
+        "customization": b"My Tagged Application",
+        "out_len": 64,
+        "output_bytes": "17 55 13 3F 15 34 75 2A AD 07 48 F2 C7 06 FB 5C 78 45 12 CA B8 35 CD 15 67 6B 16 C0 C6 64 7F A9 6F AA 7A F6 34 A0 BF 8F F6 DF 39 37 4F A0 0F AD 9A 39 E3 22 A7 C9 20 65 A6 4E B1 FB 08 01 EB 2B",
+    },
+    {
+        "msg": bytes(range(200)),
+        "key": KEY,
+        "customization": b"",
+        "out_len": 64,
+        "output_bytes": "FF 7B 17 1F 1E 8A 2B 24 68 3E ED 37 83 0E E7 97 53 8B A8 DC 56 3F 6D A1 E6 67 39 1A 75 ED C0 2C A6 33 07 9F 81 CE 12 A2 5F 45 61 5E C8 99 72 03 1D 18 33 73 31 D2 4C EB 8F 8C A8 E6 A1 9F D9 8B",
+    },
+    {
+        "msg": bytes(range(200)),
+        "key": KEY,
+        "customization": b"My Tagged Application",
+        "out_len": 64,
+        "output_bytes": "D5 BE 73 1C 95 4E D7 73 28 46 BB 59 DB E3 A8 E3 0F 83 E7 7A 4B FF 44 59 F2 F1 C2 B4 EC EB B8 CE 67 BA 01 C6 2E 8A B8 57 8D 2D 49 9B D1 BB 27 67 68 78 11 90 02 0A 30 6A 97 DE 28 1D CC 30 30 5D",
+    },
+]
+
+TUPLE = [bytes(range(0x00, 0x03)), bytes(range(0x10, 0x16)), bytes(range(0x20, 0x29))]
+
+PARALLEL_MSG = (
+    bytes(range(0x00, 0x08)) + bytes(range(0x10, 0x18)) + bytes(range(0x20, 0x28))
+)
+
+tuple_hash128_test_vectors = [
+    {
+        "tuple": TUPLE[:2],
+        "customization": b"",
+        "out_len": 32,
+        "output_bytes": "C5 D8 78 6C 1A FB 9B 82 11 1A B3 4B 65 B2 C0 04 8F A6 4E 6D 48 E2 63 26 4C E1 70 7D 3F FC 8E D1",
+    },
+    {
+        "tuple": TUPLE[:2],
+        "customization": b"My Tuple App",
+        "out_len": 32,
+        "output_bytes": "75 CD B2 0F F4 DB 11 54 E8 41 D7 58 E2 41 60 C5 4B AE 86 EB 8C 13 E7 F5 F4 0E B3 55 88 E9 6D FB",
+    },
+    {
+        "tuple": TUPLE[:3],
+        "customization": b"My Tuple App",
+        "out_len": 32,
+        "output_bytes": "E6 0F 20 2C 89 A2 63 1E DA 8D 4C 58 8C A5 FD 07 F3 9E 51 51 99 8D EC CF 97 3A DB 38 04 BB 6E 84",
+    },
+]
+
+tuple_hash_xof128_test_vectors = [
+    {
+        "tuple": TUPLE[:2],
+        "customization": b"",
+        "out_len": 32,
+        "output_bytes": "2F 10 3C D7 C3 23 20 35 34 95 C6 8D E1 A8 12 92 45 C6 32 5F 6F 2A 3D 60 8D 92 17 9C 96 E6 84 88",
+    },
+    {
+        "tuple": TUPLE[:2],
+        "customization": b"My Tuple App",
+        "out_len": 32,
+        "output_bytes": "3F C8 AD 69 45 31 28 29 28 59 A1 8B 6C 67 D7 AD 85 F0 1B 32 81 5E 22 CE 83 9C 49 EC 37 4E 9B 9A",
+    },
+    {
+        "tuple": TUPLE[:3],
+        "customization": b"My Tuple App",
+        "out_len": 32,
+        "output_bytes": "90 0F E1 6C AD 09 8D 28 E7 4D 63 2E D8 52 F9 9D AA B7 F7 DF 4D 99 E7 75 65 78 85 B4 BF 76 D6 F8",
+    },
+]
+
+tuple_hash256_test_vectors = [
+    {
+        "tuple": TUPLE[:2],
+        "customization": b"",
+        "out_len": 64,
+        "output_bytes": "CF B7 05 8C AC A5 E6 68 F8 1A 12 A2 0A 21 95 CE 97 A9 25 F1 DB A3 E7 44 9A 56 F8 22 01 EC 60 73 11 AC 26 96 B1 AB 5E A2 35 2D F1 42 3B DE 7B D4 BB 78 C9 AE D1 A8 53 C7 86 72 F9 EB 23 BB E1 94",
+    },
+    {
+        "tuple": TUPLE[:2],
+        "customization": b"My Tuple App",
+        "out_len": 64,
+        "output_bytes": "14 7C 21 91 D5 ED 7E FD 98 DB D9 6D 7A B5 A1 16 92 57 6F 5F E2 A5 06 5F 3E 33 DE 6B BA 9F 3A A1 C4 E9 A0 68 A2 89 C6 1C 95 AA B3 0A EE 1E 41 0B 0B 60 7D E3 62 0E 24 A4 E3 BF 98 52 A1 D4 36 7E",
+    },
+    {
+        "tuple": TUPLE[:3],
+        "customization": b"My Tuple App",
+        "out_len": 64,
+        "output_bytes": "45 00 0B E6 3F 9B 6B FD 89 F5 47 17 67 0F 69 A9 BC 76 35 91 A4 F0 5C 50 D6 88 91 A7 44 BC C6 E7 D6 D5 B5 E8 2C 01 8D A9 99 ED 35 B0 BB 49 C9 67 8E 52 6A BD 8E 85 C1 3E D2 54 02 1D B9 E7 90 CE",
+    },
+]
+
+tuple_hash_xof256_test_vectors = [
+    {
+        "tuple": TUPLE[:2],
+        "customization": b"",
+        "out_len": 64,
+        "output_bytes": "03 DE D4 61 0E D6 45 0A 1E 3F 8B C4 49 51 D1 4F BC 38 4A B0 EF E5 7B 00 0D F6 B6 DF 5A AE 7C D5 68 E7 73 77 DA F1 3F 37 EC 75 CF 5F C5 98 B6 84 1D 51 DD 20 7C 99 1C D4 5D 21 0B A6 0A C5 2E B9",
+    },
+    {
+        "tuple": TUPLE[:2],
+        "customization": b"My Tuple App",
+        "out_len": 64,
+        "output_bytes": "64 83 CB 3C 99 52 EB 20 E8 30 AF 47 85 85 1F C5 97 EE 3B F9 3B B7 60 2C 0E F6 A6 5D 74 1A EC A7 E6 3C 3B 12 89 81 AA 05 C6 D2 74 38 C7 9D 27 54 BB 1B 71 91 F1 25 D6 62 0F CA 12 CE 65 8B 24 42",
+    },
+    {
+        "tuple": TUPLE[:3],
+        "customization": b"My Tuple App",
+        "out_len": 64,
+        "output_bytes": "0C 59 B1 14 64 F2 33 6C 34 66 3E D5 1B 2B 95 0B EC 74 36 10 85 6F 36 C2 8D 1D 08 8D 8A 24 46 28 4D D0 98 30 A6 A1 78 DC 75 23 76 19 9F AE 93 5D 86 CF DE E5 91 3D 49 22 DF D3 69 B6 6A 53 C8 97",
+    },
+]
+
+parallel_hash128_test_vectors = [
+    {
+        "msg": PARALLEL_MSG,
+        "block_size": 8,
+        "customization": b"",
+        "out_len": 32,
+        "output_bytes": "BA 8D C1 D1 D9 79 33 1D 3F 81 36 03 C6 7F 72 60 9A B5 E4 4B 94 A0 B8 F9 AF 46 51 44 54 A2 B4 F5",
+    },
+    {
+        "msg": PARALLEL_MSG,
+        "block_size": 8,
+        "customization": b"Parallel Data",
+        "out_len": 32,
+        "output_bytes": "FC 48 4D CB 3F 84 DC EE DC 35 34 38 15 1B EE 58 15 7D 6E FE D0 44 5A 81 F1 65 E4 95 79 5B 72 06",
+    },
+]
+
+parallel_hash_xof128_test_vectors = [
+    {
+        "msg": PARALLEL_MSG,
+        "block_size": 8,
+        "customization": b"",
+        "out_len": 32,
+        "output_bytes": "FE 47 D6 61 E4 9F FE 5B 7D 99 99 22 C0 62 35 67 50 CA F5 52 98 5B 8E 8C E6 66 7F 27 27 C3 C8 D3",
+    },
+    {
+        "msg": PARALLEL_MSG,
+        "block_size": 8,
+        "customization": b"Parallel Data",
+        "out_len": 32,
+        "output_bytes": "EA 2A 79 31 40 82 0F 7A 12 8B 8E B7 0A 94 39 F9 32 57 C6 E6 E7 9B 4A 54 0D 29 1D 6D AE 70 98 D7",
+    },
+]
+
+parallel_hash256_test_vectors = [
+    {
+        "msg": PARALLEL_MSG,
+        "block_size": 8,
+        "customization": b"",
+        "out_len": 64,
+        "output_bytes": "BC 1E F1 24 DA 34 49 5E 94 8E AD 20 7D D9 84 22 35 DA 43 2D 2B BC 54 B4 C1 10 E6 4C 45 11 05 53 1B 7F 2A 3E 0C E0 55 C0 28 05 E7 C2 DE 1F B7 46 AF 97 A1 DD 01 F4 3B 82 4E 31 B8 76 12 41 04 29",
+    },
+    {
+        "msg": PARALLEL_MSG,
+        "block_size": 8,
+        "customization": b"Parallel Data",
+        "out_len": 64,
+        "output_bytes": "CD F1 52 89 B5 4F 62 12 B4 BC 27 05 28 B4 95 26 00 6D D9 B5 4E 2B 6A DD 1E F6 90 0D DA 39 63 BB 33 A7 24 91 F2 36 96 9C A8 AF AE A2 9C 68 2D 47 A3 93 C0 65 B3 8E 29 FA E6 51 A2 09 1C 83 31 10",
+    },
+]
+
+parallel_hash_xof256_test_vectors = [
+    {
+        "msg": PARALLEL_MSG,
+        "block_size": 8,
+        "customization": b"",
+        "out_len": 64,
+        "output_bytes": "C1 0A 05 27 22 61 46 84 14 4D 28 47 48 50 B4 10 75 7E 3C BA 87 65 1B A1 67 A5 CB DD FF 7F 46 66 75 FB F8 4B CA E7 37 8A C4 44 BE 68 1D 72 94 99 AF CA 66 7F B8 79 34 8B FD DA 42 78 63 C8 2F 1C",
+    },
+    {
+        "msg": PARALLEL_MSG,
+        "block_size": 8,
+        "customization": b"Parallel Data",
+        "out_len": 64,
+        "output_bytes": "53 8E 10 5F 1A 22 F4 4E D2 F5 CC 16 74 FB D4 0B E8 03 D9 C9 9B F5 F8 D9 0A 2C 81 93 F3 FE 6E A7 68 E5 C1 A2 09 87 E2 C9 C6 5F EB ED 03 88 7A 51 D3 56 24 ED 12 37 75 94 B5 58 55 41 DC 37 7E FC",
+    },
+]
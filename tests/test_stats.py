@@ -0,0 +1,175 @@
+import os
+import tempfile
+import unittest
+from array import array
+import xoflib
+from xoflib import (
+    Blake3,
+    Blake3KeyContext,
+    Shake128,
+    Shake256,
+    shake128,
+    shake128_batch,
+    shake256_many,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self):
+        xoflib.enable_stats()
+        xoflib.reset_stats()
+
+    def tearDown(self):
+        xoflib.enable_stats(False)
+        xoflib.reset_stats()
+
+    def test_all_algorithms(self):
+        self.assertEqual(
+            sorted(xoflib.stats()),
+            sorted(
+                [
+                    "AsconXof",
+                    "AsconAXof",
+                    "Blake3",
+                    "KT128",
+                    "KT256",
+                    "Shake128",
+                    "Shake256",
+                    "TurboShake128",
+                    "TurboShake256",
+                    "CShake128",
+                    "CShake256",
+                    "Kmac128",
+                    "Kmac256",
+                    "KmacXof128",
+                    "KmacXof256",
+                    "TupleHash128",
+                    "TupleHash256",
+                    "TupleHashXof128",
+                    "TupleHashXof256",
+                    "ParallelHash128",
+                    "ParallelHash256",
+                    "ParallelHashXof128",
+                    "ParallelHashXof256",
+                ]
+            ),
+        )
+        for algorithm in xoflib.stats().values():
+            for op in ["absorb", "finalize", "read"]:
+                self.assertEqual(algorithm[op], {"calls": 0, "bytes": 0, "ns": 0})
+
+    def test_counts(self):
+        xof = Shake128(b"abc").absorb(bytes(100)).absorb_many([b"a", b"bc"])
+        sponge = xof.finalize()
+        sponge.read(10)
+        sponge.read_into(bytearray(20))
+        sponge.read_many([1, 2, 3])
+        sponge.xor_into(bytearray(5))
+
+        stats = xoflib.stats()["Shake128"]
+        self.assertEqual(stats["absorb"]["calls"], 3)
+        self.assertEqual(stats["absorb"]["bytes"], 106)
+        self.assertEqual(stats["finalize"]["calls"], 1)
+        self.assertEqual(stats["read"]["calls"], 4)
+        self.assertEqual(stats["read"]["bytes"], 41)
+
+        # Other algorithms are counted separately
+        self.assertEqual(xoflib.stats()["Shake256"]["read"]["calls"], 0)
+
+    def test_one_shot_functions(self):
+        shake128(bytes(32)).read(16)
+
+        stats = xoflib.stats()["Shake128"]
+        self.assertEqual(stats["absorb"]["bytes"], 32)
+        self.assertEqual(stats["finalize"]["calls"], 1)
+        self.assertEqual(stats["read"]["bytes"], 16)
+
+    def test_read_at(self):
+        sponge = Blake3(b"abc").finalize()
+        sponge.read(10)
+        sponge.read_at(1000, 64)
+
+        stats = xoflib.stats()["Blake3"]
+        self.assertEqual(stats["read"]["calls"], 2)
+        self.assertEqual(stats["read"]["bytes"], 74)
+
+    def test_sample_uniform(self):
+        xof = Shake128(b"abc").finalize()
+        xof.sample_uniform(array("H", bytes(512)), 3329, 12)
+
+        # Every squeezed byte is counted, including rejected candidates
+        stats = xoflib.stats()["Shake128"]
+        self.assertEqual(stats["read"]["calls"], 1)
+        self.assertGreaterEqual(stats["read"]["bytes"], 384)
+        self.assertEqual(stats["read"]["bytes"] % 3, 0)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_read_array(self):
+        Shake128(b"abc").finalize().read_array(np.uint32, (4, 8))
+
+        stats = xoflib.stats()["Shake128"]
+        self.assertEqual(stats["read"]["calls"], 1)
+        self.assertEqual(stats["read"]["bytes"], 128)
+
+    def test_batch_and_many(self):
+        shake128_batch([b"a", b"bc", b"def"], 10)
+        shake256_many([b"a", b"bc"], 16, threads=2)
+
+        stats = xoflib.stats()
+        self.assertEqual(stats["Shake128"]["absorb"]["calls"], 3)
+        self.assertEqual(stats["Shake128"]["absorb"]["bytes"], 6)
+        self.assertEqual(stats["Shake128"]["finalize"]["calls"], 3)
+        self.assertEqual(stats["Shake128"]["read"]["bytes"], 30)
+        self.assertEqual(stats["Shake256"]["absorb"]["calls"], 2)
+        self.assertEqual(stats["Shake256"]["read"]["bytes"], 32)
+
+    def test_blake3_key_context(self):
+        kdf = Blake3KeyContext(context="xoflib stats test")
+        kdf.digest(b"key material", 32)
+        kdf.digest_batch([b"a", b"bc"], 16)
+
+        stats = xoflib.stats()["Blake3"]
+        self.assertEqual(stats["absorb"]["calls"], 3)
+        self.assertEqual(stats["absorb"]["bytes"], 15)
+        self.assertEqual(stats["finalize"]["calls"], 3)
+        self.assertEqual(stats["read"]["bytes"], 64)
+
+    def test_absorb_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.bin")
+            with open(path, "wb") as f:
+                f.write(os.urandom(3000))
+            Shake256().absorb_file(path)
+
+        stats = xoflib.stats()["Shake256"]
+        self.assertEqual(stats["absorb"]["calls"], 1)
+        self.assertEqual(stats["absorb"]["bytes"], 3000)
+
+    def test_time(self):
+        Shake256().absorb(bytes(2**20))
+        self.assertGreater(xoflib.stats()["Shake256"]["absorb"]["ns"], 0)
+
+    def test_disabled(self):
+        xoflib.enable_stats(False)
+        Shake128(b"abc").finalize().read(10)
+
+        stats = xoflib.stats()["Shake128"]
+        self.assertEqual(stats["absorb"]["calls"], 0)
+        self.assertEqual(stats["finalize"]["calls"], 0)
+        self.assertEqual(stats["read"]["calls"], 0)
+
+    def test_reset(self):
+        Shake128(b"abc").finalize().read(10)
+        xoflib.reset_stats()
+        self.assertEqual(
+            xoflib.stats()["Shake128"]["read"], {"calls": 0, "bytes": 0, "ns": 0}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
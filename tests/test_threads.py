@@ -0,0 +1,39 @@
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from utilities import XOF_CLASSES
+from xoflib import Shake128
+
+
+def chunked_digest(Xof, data, chunk_size, out_len):
+    xof = Xof()
+    for i in range(0, len(data), chunk_size):
+        xof.absorb(data[i : i + chunk_size])
+    sponge = xof.finalize()
+    return b"".join(sponge.read(chunk_size) for _ in range(0, out_len, chunk_size))
+
+
+class TestLargeCalls(unittest.TestCase):
+    def test_large_absorb_and_read(self):
+        # Large calls release the GIL, which must not change the output
+        data = os.urandom(2**20 + 17)
+        for Xof in XOF_CLASSES:
+            sponge = Xof(data).finalize()
+            buf = bytearray(2**16)
+            sponge.read_into(buf)
+            self.assertEqual(buf, chunked_digest(Xof, data, 2**10, 2**16))
+
+    def test_threaded_hashing(self):
+        data = [os.urandom(2**18) for _ in range(16)]
+        for Xof in XOF_CLASSES:
+            expected = [Xof(d).finalize().read(2**14) for d in data]
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                output = list(
+                    executor.map(lambda d: Xof(d).finalize().read(2**14), data)
+                )
+            self.assertEqual(output, expected)
+
+    def test_non_contiguous_buffer(self):
+        data = memoryview(bytearray(64))[::2]
+        self.assertRaises(BufferError, lambda: Shake128(data))
+        self.assertRaises(BufferError, lambda: Shake128().finalize().read_into(data))
@@ -1,10 +1,19 @@
+import os
 import sys
 import unittest
 from test_turbo_shake_data import (
     turbo_shake_128_test_vectors,
     turbo_shake_256_test_vectors,
 )
-from xoflib import turbo_shake128, turbo_shake256, TurboShake128, TurboShake256
+from utilities import piece_lengths, piece_patterns
+from xoflib import (
+    turbo_shake128,
+    turbo_shake256,
+    turbo_shake128_batch,
+    turbo_shake256_batch,
+    TurboShake128,
+    TurboShake256,
+)
 
 if sys.version_info >= (3, 12):
     from collections.abc import Buffer
@@ -32,6 +41,36 @@ class TestTurboShakeDocumentation(unittest.TestCase):
     def test_turbo_shake_256(self):
         self.parsed_data_test(turbo_shake256, turbo_shake_256_test_vectors)
 
+    def split_vectors_test(self, TurboShake, rate, vectors):
+        # Absorb and read every vector in pieces, so that calls start and end at
+        # every offset within a lane and either side of the rate boundary
+        for test_vector in vectors:
+            msg = test_vector["msg"]
+            out_len = test_vector["out_len"]
+            last = test_vector.get("last", out_len)
+            output_kat = bytes.fromhex(test_vector["output_bytes"].replace(" ", ""))
+
+            for pattern in piece_patterns(rate, len(msg)):
+                xof = TurboShake(test_vector["D"])
+                i = 0
+                for n in piece_lengths(len(msg), pattern):
+                    xof.absorb(msg[i : i + n])
+                    i += n
+                output = xof.finalize().read(out_len)
+                self.assertEqual(output[-last:], output_kat)
+
+            for pattern in piece_patterns(rate, out_len):
+                sponge = TurboShake(test_vector["D"], msg).finalize()
+                lengths = piece_lengths(out_len, pattern)
+                output = b"".join(sponge.read(n) for n in lengths)
+                self.assertEqual(output[-last:], output_kat)
+
+    def test_turbo_shake_128_split(self):
+        self.split_vectors_test(TurboShake128, 168, turbo_shake_128_test_vectors)
+
+    def test_turbo_shake_256_split(self):
+        self.split_vectors_test(TurboShake256, 136, turbo_shake_256_test_vectors)
+
 
 class TestTurboShake(unittest.TestCase):
     def turbo_shake(self, TurboShake, turbo_shake):
@@ -64,6 +103,42 @@ class TestTurboShake(unittest.TestCase):
     def test_turboshake_256(self):
         self.turbo_shake(TurboShake256, turbo_shake256)
 
+    def one_shot(self, TurboShake, turbo_shake):
+        for domain_sep in [1, 0x06, 0x1F, 0x7F]:
+            for size in [0, 1, 167, 168, 169, 10_000]:
+                data = os.urandom(size)
+                expected = TurboShake(domain_sep, data).finalize().read(500)
+                self.assertEqual(turbo_shake(domain_sep, data).read(500), expected)
+
+    def test_turboshake_128_one_shot(self):
+        self.one_shot(TurboShake128, turbo_shake128)
+
+    def test_turboshake_256_one_shot(self):
+        self.one_shot(TurboShake256, turbo_shake256)
+
+    def block_offsets(self, TurboShake, turbo_shake, rate):
+        # Split the input and output at every offset within the first blocks,
+        # which must match hashing the whole input at once
+        msg = os.urandom(2 * rate + 9)
+        expected = turbo_shake(1, msg).read(len(msg))
+        for split in range(len(msg) + 1):
+            xof = TurboShake(1, msg[:split]).absorb(msg[split:]).finalize()
+            self.assertEqual(xof.read(split) + xof.read(len(msg) - split), expected)
+
+        for size in range(1, rate + 1):
+            xof = TurboShake(1)
+            for i in range(0, len(msg), size):
+                xof.absorb(msg[i : i + size])
+            xof = xof.finalize()
+            output = b"".join(xof.read(size) for _ in range(0, len(msg), size))
+            self.assertEqual(output[: len(msg)], expected)
+
+    def test_turboshake_128_block_offsets(self):
+        self.block_offsets(TurboShake128, turbo_shake128, 168)
+
+    def test_turboshake_256_block_offsets(self):
+        self.block_offsets(TurboShake256, turbo_shake256, 136)
+
     def accept_buffer_api(self, Shake, shake, data: Buffer):
         xof1 = Shake(1, data).finalize()
         xof2 = shake(1, data)
@@ -76,3 +151,23 @@ class TestTurboShake(unittest.TestCase):
         self.accept_buffer_api(
             TurboShake256, turbo_shake256, bytearray(b"bytearrays support __buffer__")
         )
+
+    def batch_comparison(self, turbo_shake, turbo_shake_batch):
+        inputs = [os.urandom(i * 20) for i in range(9)]
+        n = 200
+        for domain_sep in [1, 0x1F, 127]:
+            output = turbo_shake_batch(domain_sep, inputs, n)
+            self.assertEqual(len(output), len(inputs) * n)
+            for i, data in enumerate(inputs):
+                self.assertEqual(
+                    output[i * n : (i + 1) * n], turbo_shake(domain_sep, data).read(n)
+                )
+
+        self.assertRaises(ValueError, lambda: turbo_shake_batch(0, inputs, n))
+        self.assertRaises(ValueError, lambda: turbo_shake_batch(128, inputs, n))
+
+    def test_turbo_shake128_batch(self):
+        self.batch_comparison(turbo_shake128, turbo_shake128_batch)
+
+    def test_turbo_shake256_batch(self):
+        self.batch_comparison(turbo_shake256, turbo_shake256_batch)
@@ -0,0 +1,52 @@
+import os
+import unittest
+from array import array
+from utilities import TUPLE_HASH_CLASSES, XOF_CLASSES
+from xoflib import Shake128
+
+
+def xor_bytes(a, b):
+    return bytes(i ^ j for i, j in zip(a, b))
+
+
+class TestXorInto(unittest.TestCase):
+    def test_matches_read(self):
+        for Xof in XOF_CLASSES + TUPLE_HASH_CLASSES:
+            xof1 = Xof(b"key").finalize()
+            xof2 = Xof(b"key").finalize()
+            # Cover both small writes and writes spanning several blocks
+            for n in [0, 1, 31, 200, 5000, 10_000]:
+                msg = os.urandom(n)
+                buf = bytearray(msg)
+                xof1.xor_into(buf)
+                self.assertEqual(buf, xor_bytes(msg, xof2.read(n)))
+
+            # The position is shared between reads and xor_into
+            self.assertEqual(xof1.read(100), xof2.read(100))
+
+    def test_round_trip(self):
+        for Xof in XOF_CLASSES + TUPLE_HASH_CLASSES:
+            msg = os.urandom(1000)
+            buf = bytearray(msg)
+            Xof(b"key").finalize().xor_into(buf)
+            self.assertNotEqual(buf, msg)
+            Xof(b"key").finalize().xor_into(buf)
+            self.assertEqual(buf, msg)
+
+    def test_buffer_types(self):
+        xof1 = Shake128(b"key").finalize()
+        xof2 = Shake128(b"key").finalize()
+
+        buf = array("B", range(16))
+        expected = xor_bytes(buf.tobytes(), xof2.read(16))
+        xof1.xor_into(buf)
+        self.assertEqual(buf.tobytes(), expected)
+
+        buf = bytearray(32)
+        xof1.xor_into(memoryview(buf)[8:24])
+        self.assertEqual(buf, bytes(8) + xof2.read(16) + bytes(8))
+
+    def test_readonly_buffer(self):
+        xof = Shake128(b"key").finalize()
+        with self.assertRaises(TypeError):
+            xof.xor_into(b"immutable")
@@ -1,3 +1,53 @@
+import itertools
+
+from xoflib import (
+    AsconAXof,
+    AsconXof,
+    Blake3,
+    CShake128,
+    CShake256,
+    KmacXof128,
+    KmacXof256,
+    KT128,
+    KT256,
+    ParallelHashXof128,
+    ParallelHashXof256,
+    Shake128,
+    Shake256,
+    TupleHashXof128,
+    TupleHashXof256,
+    TurboShake128,
+    TurboShake256,
+)
+
+# Every XOF, as a constructor taking optional initial input. Absorbing is
+# streaming for all of these, so `Xof(a + b)` and `Xof(a).absorb(b)` agree
+XOF_CLASSES = [
+    AsconXof,
+    AsconAXof,
+    Blake3,
+    KT128,
+    KT256,
+    Shake128,
+    Shake256,
+    lambda data=None: TurboShake128(1, data),
+    lambda data=None: TurboShake256(1, data),
+    lambda data=None: CShake128(data, b"name", b"custom"),
+    lambda data=None: CShake256(data, customization=b"custom"),
+    lambda data=None: KmacXof128(b"key", data),
+    lambda data=None: KmacXof256(b"key", data, b"custom"),
+    lambda data=None: ParallelHashXof128(100, data),
+    lambda data=None: ParallelHashXof256(100, data, b"custom"),
+]
+
+# TupleHash absorbs every call as a separate element of the tuple, so it can
+# only be used where the input is absorbed in a single call
+TUPLE_HASH_CLASSES = [
+    lambda data=None: TupleHashXof128(None if data is None else [data]),
+    lambda data=None: TupleHashXof256(None if data is None else [data], b"custom"),
+]
+
+
 def create_pattern(byte_val, length):
     """
     Create test vector patterns
@@ -32,3 +82,35 @@ def test_create_pattern():
 
     assert bytes.fromhex(ptn_17) == create_pattern(0xFA, 17)
     assert bytes.fromhex(ptn_17_2) == create_pattern(0xFA, 17**2)
+
+
+def piece_patterns(rate, length, max_calls=1024):
+    """
+    Yield patterns of piece lengths for splitting `length` bytes of input or
+    output of a sponge with the given `rate`
+
+    The patterns cover single bytes and runs of up to 7 bytes, an offset of 1
+    to 7 bytes followed by whole blocks or large pieces, and pieces which end
+    either side of the rate boundary. Patterns which need more than
+    `max_calls` pieces are skipped.
+    """
+    patterns = [[k] for k in range(1, 8)]
+    patterns += [[k, rate] for k in range(1, 8)]
+    patterns += [[k, 2**16] for k in range(1, 8)]
+    patterns += [[rate - 1], [rate + 1], [rate - 1, 2]]
+    for pattern in patterns:
+        if length * len(pattern) <= max_calls * sum(pattern):
+            yield pattern
+
+
+def piece_lengths(length, pattern):
+    """
+    Split `length` into consecutive pieces whose lengths are taken from
+    `pattern` in turn, with the last piece cut short
+    """
+    lengths = []
+    for n in itertools.cycle(pattern):
+        if length <= 0:
+            return lengths
+        lengths.append(min(n, length))
+        length -= n
@@ -1,4 +1,7 @@
+import os
+import random
 import sys
+from typing import Any, Awaitable, Callable, Iterable, Literal
 
 if sys.version_info >= (3, 12):
     from collections.abc import Buffer
@@ -10,72 +13,851 @@ else:
 class Shake128:
     def __init__(self, input_bytes: Buffer | None = None): ...
     def absorb(self, input_bytes: Buffer) -> "Shake128": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "Shake128": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "Shake128": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["Shake128"]: ...
     def finalize(self) -> Sponge128: ...
+    def copy(self) -> "Shake128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "Shake128": ...
 
 class Sponge128:
     def read(self, n: int) -> bytes: ...
     def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "Sponge128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "Sponge128": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
 
 class Shake256:
     def __init__(self, input_bytes: Buffer | None = None): ...
     def absorb(self, input_bytes: Buffer) -> "Shake256": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "Shake256": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "Shake256": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["Shake256"]: ...
     def finalize(self) -> Sponge128: ...
+    def copy(self) -> "Shake256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "Shake256": ...
 
 class Sponge256:
     def read(self, n: int) -> bytes: ...
     def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "Sponge256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "Sponge256": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
 
 class TurboShake128:
     def __init__(self, domain_sep: int, input_bytes: Buffer | None = None): ...
     def absorb(self, input_bytes: Buffer) -> "TurboShake128": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "TurboShake128": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "TurboShake128": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["TurboShake128"]: ...
     def finalize(self) -> Sponge128: ...
+    def copy(self) -> "TurboShake128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TurboShake128": ...
 
 class TurboSponge128:
     def read(self, n: int) -> bytes: ...
     def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "TurboSponge128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TurboSponge128": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
 
 class TurboShake256:
     def __init__(self, domain_sep: int, input_bytes: Buffer | None = None): ...
     def absorb(self, input_bytes: Buffer) -> "TurboShake256": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "TurboShake256": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "TurboShake256": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["TurboShake256"]: ...
     def finalize(self) -> Sponge128: ...
+    def copy(self) -> "TurboShake256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TurboShake256": ...
 
 class TurboSponge256:
     def read(self, n: int) -> bytes: ...
     def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "TurboSponge256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TurboSponge256": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
 
 def shake128(input_bytes: Buffer) -> Sponge128: ...
 def shake256(input_bytes: Buffer) -> Sponge256: ...
 def turbo_shake128(domain_sep: int, input_bytes: Buffer) -> TurboSponge128: ...
 def turbo_shake256(domain_sep: int, input_bytes: Buffer) -> TurboSponge256: ...
+def shake128_batch(inputs: Iterable[Buffer], n: int) -> bytes: ...
+def shake256_batch(inputs: Iterable[Buffer], n: int) -> bytes: ...
+def turbo_shake128_batch(
+    domain_sep: int, inputs: Iterable[Buffer], n: int
+) -> bytes: ...
+def turbo_shake256_batch(
+    domain_sep: int, inputs: Iterable[Buffer], n: int
+) -> bytes: ...
+def shake128_many(
+    messages: Iterable[Buffer], out_len: int, threads: int | None = None
+) -> list[bytes]: ...
+def shake256_many(
+    messages: Iterable[Buffer], out_len: int, threads: int | None = None
+) -> list[bytes]: ...
+def turbo_shake128_many(
+    domain_sep: int,
+    messages: Iterable[Buffer],
+    out_len: int,
+    threads: int | None = None,
+) -> list[bytes]: ...
+def turbo_shake256_many(
+    domain_sep: int,
+    messages: Iterable[Buffer],
+    out_len: int,
+    threads: int | None = None,
+) -> list[bytes]: ...
+
+class KT128:
+    def __init__(
+        self, input_bytes: Buffer | None = None, customization: Buffer | None = None
+    ): ...
+    def absorb(self, input_bytes: Buffer) -> "KT128": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "KT128": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "KT128": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["KT128"]: ...
+    def finalize(self) -> KTSponge128: ...
+    def copy(self) -> "KT128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "KT128": ...
+
+class KTSponge128:
+    def read(self, n: int) -> bytes: ...
+    def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "KTSponge128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "KTSponge128": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+KangarooTwelve = KT128
+
+class KT256:
+    def __init__(
+        self, input_bytes: Buffer | None = None, customization: Buffer | None = None
+    ): ...
+    def absorb(self, input_bytes: Buffer) -> "KT256": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "KT256": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "KT256": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["KT256"]: ...
+    def finalize(self) -> KTSponge256: ...
+    def copy(self) -> "KT256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "KT256": ...
+
+class KTSponge256:
+    def read(self, n: int) -> bytes: ...
+    def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "KTSponge256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "KTSponge256": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+def kt128(input_bytes: Buffer, customization: Buffer | None = None) -> KTSponge128: ...
+def kt256(input_bytes: Buffer, customization: Buffer | None = None) -> KTSponge256: ...
+def kt128_many(
+    messages: Iterable[Buffer],
+    out_len: int,
+    customization: Buffer | None = None,
+    threads: int | None = None,
+) -> list[bytes]: ...
+def kt256_many(
+    messages: Iterable[Buffer],
+    out_len: int,
+    customization: Buffer | None = None,
+    threads: int | None = None,
+) -> list[bytes]: ...
+
+class CShake128:
+    def __init__(
+        self,
+        input_bytes: Buffer | None = None,
+        function_name: Buffer | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    def absorb(self, input_bytes: Buffer) -> "CShake128": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "CShake128": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "CShake128": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["CShake128"]: ...
+    def finalize(self) -> CShakeSponge128: ...
+    def copy(self) -> "CShake128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "CShake128": ...
+
+class CShakeSponge128:
+    def read(self, n: int) -> bytes: ...
+    def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "CShakeSponge128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "CShakeSponge128": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+class CShake256:
+    def __init__(
+        self,
+        input_bytes: Buffer | None = None,
+        function_name: Buffer | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    def absorb(self, input_bytes: Buffer) -> "CShake256": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "CShake256": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "CShake256": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["CShake256"]: ...
+    def finalize(self) -> CShakeSponge256: ...
+    def copy(self) -> "CShake256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "CShake256": ...
+
+class CShakeSponge256:
+    def read(self, n: int) -> bytes: ...
+    def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "CShakeSponge256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "CShakeSponge256": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+class KmacXof128:
+    def __init__(
+        self,
+        key: Buffer,
+        input_bytes: Buffer | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    def absorb(self, input_bytes: Buffer) -> "KmacXof128": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "KmacXof128": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "KmacXof128": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["KmacXof128"]: ...
+    def finalize(self) -> KmacXofSponge128: ...
+    def copy(self) -> "KmacXof128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "KmacXof128": ...
+
+class KmacXofSponge128:
+    def read(self, n: int) -> bytes: ...
+    def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "KmacXofSponge128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "KmacXofSponge128": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+class KmacXof256:
+    def __init__(
+        self,
+        key: Buffer,
+        input_bytes: Buffer | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    def absorb(self, input_bytes: Buffer) -> "KmacXof256": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "KmacXof256": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "KmacXof256": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["KmacXof256"]: ...
+    def finalize(self) -> KmacXofSponge256: ...
+    def copy(self) -> "KmacXof256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "KmacXof256": ...
+
+class KmacXofSponge256:
+    def read(self, n: int) -> bytes: ...
+    def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "KmacXofSponge256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "KmacXofSponge256": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+class Kmac128:
+    def __init__(
+        self,
+        key: Buffer,
+        output_len: int,
+        input_bytes: Buffer | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    @property
+    def output_len(self) -> int: ...
+    def absorb(self, input_bytes: Buffer) -> "Kmac128": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "Kmac128": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "Kmac128": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["Kmac128"]: ...
+    def finalize(self) -> bytes: ...
+    def copy(self) -> "Kmac128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "Kmac128": ...
+
+class Kmac256:
+    def __init__(
+        self,
+        key: Buffer,
+        output_len: int,
+        input_bytes: Buffer | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    @property
+    def output_len(self) -> int: ...
+    def absorb(self, input_bytes: Buffer) -> "Kmac256": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "Kmac256": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "Kmac256": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["Kmac256"]: ...
+    def finalize(self) -> bytes: ...
+    def copy(self) -> "Kmac256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "Kmac256": ...
+
+class TupleHashXof128:
+    def __init__(
+        self,
+        input_tuple: Iterable[Buffer] | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    def absorb(self, input_bytes: Buffer) -> "TupleHashXof128": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "TupleHashXof128": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "TupleHashXof128": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["TupleHashXof128"]: ...
+    def finalize(self) -> TupleHashXofSponge128: ...
+    def copy(self) -> "TupleHashXof128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TupleHashXof128": ...
+
+class TupleHashXofSponge128:
+    def read(self, n: int) -> bytes: ...
+    def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "TupleHashXofSponge128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TupleHashXofSponge128": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+class TupleHashXof256:
+    def __init__(
+        self,
+        input_tuple: Iterable[Buffer] | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    def absorb(self, input_bytes: Buffer) -> "TupleHashXof256": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "TupleHashXof256": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "TupleHashXof256": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["TupleHashXof256"]: ...
+    def finalize(self) -> TupleHashXofSponge256: ...
+    def copy(self) -> "TupleHashXof256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TupleHashXof256": ...
+
+class TupleHashXofSponge256:
+    def read(self, n: int) -> bytes: ...
+    def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "TupleHashXofSponge256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TupleHashXofSponge256": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+class TupleHash128:
+    def __init__(
+        self,
+        output_len: int,
+        input_tuple: Iterable[Buffer] | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    @property
+    def output_len(self) -> int: ...
+    def absorb(self, input_bytes: Buffer) -> "TupleHash128": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "TupleHash128": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "TupleHash128": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["TupleHash128"]: ...
+    def finalize(self) -> bytes: ...
+    def copy(self) -> "TupleHash128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TupleHash128": ...
+
+class TupleHash256:
+    def __init__(
+        self,
+        output_len: int,
+        input_tuple: Iterable[Buffer] | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    @property
+    def output_len(self) -> int: ...
+    def absorb(self, input_bytes: Buffer) -> "TupleHash256": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "TupleHash256": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "TupleHash256": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["TupleHash256"]: ...
+    def finalize(self) -> bytes: ...
+    def copy(self) -> "TupleHash256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TupleHash256": ...
+
+class ParallelHashXof128:
+    def __init__(
+        self,
+        block_size: int,
+        input_bytes: Buffer | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    def absorb(self, input_bytes: Buffer) -> "ParallelHashXof128": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "ParallelHashXof128": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "ParallelHashXof128": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["ParallelHashXof128"]: ...
+    def finalize(self) -> ParallelHashXofSponge128: ...
+    def copy(self) -> "ParallelHashXof128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "ParallelHashXof128": ...
+
+class ParallelHashXofSponge128:
+    def read(self, n: int) -> bytes: ...
+    def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "ParallelHashXofSponge128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "ParallelHashXofSponge128": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+class ParallelHashXof256:
+    def __init__(
+        self,
+        block_size: int,
+        input_bytes: Buffer | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    def absorb(self, input_bytes: Buffer) -> "ParallelHashXof256": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "ParallelHashXof256": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "ParallelHashXof256": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["ParallelHashXof256"]: ...
+    def finalize(self) -> ParallelHashXofSponge256: ...
+    def copy(self) -> "ParallelHashXof256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "ParallelHashXof256": ...
+
+class ParallelHashXofSponge256:
+    def read(self, n: int) -> bytes: ...
+    def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "ParallelHashXofSponge256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "ParallelHashXofSponge256": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+class ParallelHash128:
+    def __init__(
+        self,
+        block_size: int,
+        output_len: int,
+        input_bytes: Buffer | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    @property
+    def output_len(self) -> int: ...
+    def absorb(self, input_bytes: Buffer) -> "ParallelHash128": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "ParallelHash128": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "ParallelHash128": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["ParallelHash128"]: ...
+    def finalize(self) -> bytes: ...
+    def copy(self) -> "ParallelHash128": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "ParallelHash128": ...
+
+class ParallelHash256:
+    def __init__(
+        self,
+        block_size: int,
+        output_len: int,
+        input_bytes: Buffer | None = None,
+        customization: Buffer | None = None,
+    ): ...
+    @property
+    def output_len(self) -> int: ...
+    def absorb(self, input_bytes: Buffer) -> "ParallelHash256": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "ParallelHash256": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "ParallelHash256": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["ParallelHash256"]: ...
+    def finalize(self) -> bytes: ...
+    def copy(self) -> "ParallelHash256": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "ParallelHash256": ...
 
 class AsconXof:
     def __init__(self, input_bytes: Buffer | None = None): ...
     def absorb(self, input_bytes: Buffer) -> "AsconXof": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "AsconXof": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "AsconXof": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["AsconXof"]: ...
     def finalize(self) -> AsconSponge: ...
+    def copy(self) -> "AsconXof": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "AsconXof": ...
 
 class AsconSponge:
     def read(self, n: int) -> bytes: ...
     def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "AsconSponge": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "AsconSponge": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
 
 class AsconAXof:
     def __init__(self, input_bytes: Buffer | None = None): ...
     def absorb(self, input_bytes: Buffer) -> "AsconAXof": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "AsconAXof": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "AsconAXof": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["AsconAXof"]: ...
     def finalize(self) -> AsconSponge: ...
+    def copy(self) -> "AsconAXof": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "AsconAXof": ...
 
 class AsconASponge:
     def read(self, n: int) -> bytes: ...
     def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "AsconASponge": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "AsconASponge": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
 
 def ascon_xof(input_bytes: Buffer) -> AsconXof: ...
 def ascona_xof(input_bytes: Buffer) -> AsconAXof: ...
+def ascon_xof_many(
+    messages: Iterable[Buffer], out_len: int, threads: int | None = None
+) -> list[bytes]: ...
+def ascona_xof_many(
+    messages: Iterable[Buffer], out_len: int, threads: int | None = None
+) -> list[bytes]: ...
 
 class Blake3:
-    def __init__(self, input_bytes: Buffer | None = None): ...
-    def absorb(self, input_bytes: Buffer) -> "AsconAXof": ...
-    def finalize(self) -> AsconSponge: ...
+    def __init__(
+        self, input_bytes: Buffer | None = None, key: Buffer | None = None
+    ): ...
+    @classmethod
+    def derive_key(
+        cls, context: str, key_material: Buffer | None = None
+    ) -> "Blake3": ...
+    def absorb(self, input_bytes: Buffer) -> "Blake3": ...
+    def absorb_many(self, input_bytes: Iterable[Buffer]) -> "Blake3": ...
+    def absorb_file(self, file: str | os.PathLike | int) -> "Blake3": ...
+    def absorb_async(self, input_bytes: Buffer) -> Awaitable["Blake3"]: ...
+    def absorb_parallel(self, input_bytes: Buffer) -> "Blake3": ...
+    def finalize(self) -> Blake3Sponge: ...
+    def copy(self) -> "Blake3": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "Blake3": ...
 
 class Blake3Sponge:
     def read(self, n: int) -> bytes: ...
+    def seek(self, offset: int): ...
+    def tell(self) -> int: ...
+    def read_at(self, offset: int, n: int) -> bytes: ...
     def read_into(self, buf: Buffer): ...
+    def read_many(self, sizes: Iterable[int]) -> list[bytes]: ...
+    def read_into_many(self, buffers: Iterable[Buffer]): ...
+    def read_async(self, n: int) -> Awaitable[bytes]: ...
+    def read_into_async(self, buf: Buffer) -> Awaitable[None]: ...
+    def read_array(self, dtype: Any, shape: int | tuple[int, ...]) -> Any: ...
+    def read_uint(self, nbytes: int, byteorder: Literal["little", "big"]) -> int: ...
+    def read_ints(
+        self, count: int, bits: int, into: Buffer | None = None
+    ) -> list[int] | None: ...
+    def xor_into(self, buf: Buffer): ...
+    def copy(self) -> "Blake3Sponge": ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "Blake3Sponge": ...
+    def sample_uniform(
+        self, buf: Buffer, q: int, bits: int, stride: int | None = None
+    ): ...
+
+class Blake3KeyContext:
+    def __init__(self, key: Buffer | None = None, context: str | None = None): ...
+    def hasher(self, input_bytes: Buffer | None = None) -> Blake3: ...
+    def digest(self, input_bytes: Buffer, n: int = 32) -> bytes: ...
+    def digest_batch(self, inputs: Iterable[Buffer], n: int = 32) -> bytes: ...
+
+def blake3_xof(input_bytes: Buffer) -> Blake3Sponge: ...
+def blake3_xof_many(
+    messages: Iterable[Buffer], out_len: int, threads: int | None = None
+) -> list[bytes]: ...
+_Shaker = (
+    Shake128
+    | Shake256
+    | TurboShake128
+    | TurboShake256
+    | KT128
+    | KT256
+    | CShake128
+    | CShake256
+    | KmacXof128
+    | KmacXof256
+    | TupleHashXof128
+    | TupleHashXof256
+    | ParallelHashXof128
+    | ParallelHashXof256
+    | AsconXof
+    | AsconAXof
+    | Blake3
+)
+
+def hash_file(
+    algorithm: _Shaker | type[_Shaker], path: str | os.PathLike | int, out_len: int
+) -> bytes: ...
+
+class PrefixCache:
+    def __init__(self, algorithm: Callable[[], Any], maxsize: int = 128): ...
+    def get(self, prefix: Buffer, key: Buffer | None = None) -> Any: ...
+    def clear(self): ...
+    @property
+    def hits(self) -> int: ...
+    @property
+    def misses(self) -> int: ...
+    @property
+    def maxsize(self) -> int: ...
+    def __len__(self) -> int: ...
+
+class XofBitGenerator:
+    def __init__(self, seed: Buffer, algorithm: str = "turboshake128"): ...
+    @property
+    def capsule(self) -> Any: ...
+    @property
+    def lock(self) -> Any: ...
+    @property
+    def algorithm(self) -> str: ...
+
+class XofRandom(random.Random):
+    def __init__(
+        self, seed: int | str | Buffer | None = None, algorithm: str = "turboshake128"
+    ): ...
 
-def blake3_xof(input_bytes: Buffer) -> AsconXof: ...
+def enable_stats(enabled: bool = True): ...
+def stats() -> dict[str, dict[str, dict[str, int]]]: ...
+def reset_stats(): ...